@@ -0,0 +1,378 @@
+# lithood/backtest.py
+"""Vectorized replay of the infinite-grid strategy over historical prices."""
+
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from lithood.config import FLOOR_CONFIG
+from lithood.infinite_grid import InfiniteGridConfig, InfiniteGridEngine, PRICE_QUANTUM
+from lithood.ladder import PriceLadder
+from lithood.types import OrderSide
+
+# Prices are compared as integer ticks of PRICE_QUANTUM
+TICKS_PER_UNIT = int(1 / PRICE_QUANTUM)
+PRICE_DECIMALS = -PRICE_QUANTUM.as_tuple().exponent
+
+_NO_BUY = np.iinfo(np.int64).min
+_NO_SELL = np.iinfo(np.int64).max
+
+# First window of the galloping crossing search (doubles up to the cap)
+_SEARCH_WINDOW = 64
+_SEARCH_WINDOW_MAX = 1 << 16
+
+
+@dataclass
+class _SimOrder:
+    side: OrderSide
+    price: Decimal
+    tick: int
+    placed_at: float
+
+
+@dataclass
+class BacktestResult:
+    """Summary of one backtest run (amounts in USDC, sizes in LIT)."""
+    cycles: int
+    buy_fills: int
+    sell_fills: int
+    profit: float  # engine accounting: sell fills x price x spacing
+    pnl: float  # mark-to-market equity change
+    fees: float
+    recenters: int
+    start_equity: float
+    end_equity: float
+    min_equity: float
+    max_drawdown: float
+    end_inventory: float
+    min_inventory: float
+    max_inventory: float
+    inventory_swing: float
+    end_cash: float
+    min_cash: float
+    floor_breaches: int
+    first_breach_time: Optional[float]
+    missed_fills: int  # fills dropped by a recenter before they were detected
+    points: int
+    events: int
+    params: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def candles_to_path(
+    timestamps: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Expand OHLC bars into a price path of four points per bar.
+
+    Each bar is walked open -> low -> high -> close when it closed up and
+    open -> high -> low -> close when it closed down, so fills on both
+    sides of a wide bar happen in a plausible order.
+
+    Args:
+        timestamps: Bar open times (seconds)
+        open_, high, low, close: Bar prices
+
+    Returns:
+        Tuple of (times, prices)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    up = np.asarray(close) >= np.asarray(open_)
+    first = np.where(up, low, high)
+    second = np.where(up, high, low)
+    prices = np.column_stack((open_, first, second, close)).astype(np.float64).ravel()
+
+    bar = float(np.median(np.diff(timestamps))) if len(timestamps) > 1 else 60.0
+    offsets = np.array([0.0, 0.25, 0.5, 0.75]) * bar
+    times = (timestamps[:, None] + offsets[None, :]).ravel()
+    return times, prices
+
+
+def _read_columns(path: Path, wanted: dict[str, tuple[str, ...]]) -> dict[str, np.ndarray]:
+    """Load named numeric columns from a CSV with a header row."""
+    with open(path) as f:
+        header = [h.strip().lower() for h in f.readline().split(",")]
+    usecols = {}
+    for key, aliases in wanted.items():
+        index = next((header.index(a) for a in aliases if a in header), None)
+        if index is None:
+            raise ValueError(f"{path}: no column for {key} (expected one of {', '.join(aliases)})")
+        usecols[key] = index
+    data = np.loadtxt(path, delimiter=",", skiprows=1, usecols=list(usecols.values()), ndmin=2)
+    columns = {key: data[:, i] for i, key in enumerate(usecols)}
+    # Millisecond epochs -> seconds
+    if len(columns["time"]) and columns["time"][0] > 1e12:
+        columns["time"] = columns["time"] / 1000.0
+    return columns
+
+
+_TIME_ALIASES = ("timestamp", "time", "ts", "open_time")
+
+
+def load_candles(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load OHLC candles (CSV: timestamp,open,high,low,close) as a price path."""
+    cols = _read_columns(Path(path), {
+        "time": _TIME_ALIASES,
+        "open": ("open", "o"),
+        "high": ("high", "h"),
+        "low": ("low", "l"),
+        "close": ("close", "c"),
+    })
+    return candles_to_path(cols["time"], cols["open"], cols["high"], cols["low"], cols["close"])
+
+
+def load_ticks(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Load trade ticks (CSV: timestamp,price) as a price path."""
+    cols = _read_columns(Path(path), {"time": _TIME_ALIASES, "price": ("price", "p", "close")})
+    return cols["time"], cols["price"]
+
+
+def price_ticks(prices: np.ndarray) -> np.ndarray:
+    """Convert prices to int64 ticks of PRICE_QUANTUM."""
+    return np.rint(np.asarray(prices, dtype=np.float64) * TICKS_PER_UNIT).astype(np.int64)
+
+
+def _next_crossing(ticks: np.ndarray, start: int, end: int, lo: int, hi: int) -> int:
+    """First index in [start, end) with ticks <= lo or >= hi, else end.
+
+    Gallops through exponentially growing windows, so quiet stretches are
+    skipped in a few vectorized comparisons while an event just ahead
+    costs only a small one.
+    """
+    window = _SEARCH_WINDOW
+    while start < end:
+        stop = min(start + window, end)
+        segment = ticks[start:stop]
+        hits = (segment <= lo) | (segment >= hi)
+        if hits.any():
+            return start + int(hits.argmax())
+        start = stop
+        window = min(window * 2, _SEARCH_WINDOW_MAX)
+    return end
+
+
+class GridBacktester:
+    """Replays a price path through the InfiniteGridEngine rules.
+
+    Mirrors the engine: levels from a PriceLadder anchored at the first
+    price (recenters move the center rung), resting orders
+    fill when the price touches them, each fill places a counter-order at
+    +/- spacing once detected (after the engine's fill grace period), a
+    counter-order is skipped if an order already rests at that price and
+    side, and the grid recenters on the current price once it reaches the
+    recenter_threshold-th outermost level. A recenter cancels everything,
+    including fills not yet detected.
+
+    Orders placed at a point can first fill at the next point. Fills are
+    all-or-nothing at the order price (no volume model), and balances are
+    not enforced, so min_inventory / min_cash show what the run required.
+    """
+
+    def __init__(
+        self,
+        config: InfiniteGridConfig,
+        initial_lit: Decimal = Decimal("0"),
+        initial_usdc: Decimal = Decimal("0"),
+        fill_grace_seconds: float = InfiniteGridEngine.FILL_GRACE_SECONDS,
+        maker_fee: Decimal = Decimal("0"),
+        floor_value: Decimal = FLOOR_CONFIG["emergency_buffer"],
+    ):
+        """Initialize the backtester.
+
+        Args:
+            config: Grid configuration under test
+            initial_lit: Starting LIT inventory
+            initial_usdc: Starting USDC
+            fill_grace_seconds: Delay before a fill is detected (engine default)
+            maker_fee: Fee rate charged on every fill
+            floor_value: Equity at or below which a floor breach is counted
+                (defaults to the emergency-exit buffer)
+        """
+        self.config = config
+        self.initial_lit = Decimal(initial_lit)
+        self.initial_usdc = Decimal(initial_usdc)
+        self.fill_grace_seconds = fill_grace_seconds
+        self.maker_fee = Decimal(maker_fee)
+        self.floor_value = Decimal(floor_value)
+
+    def run(
+        self,
+        times: np.ndarray,
+        prices: np.ndarray,
+        ticks: Optional[np.ndarray] = None,
+    ) -> BacktestResult:
+        """Run the strategy over a price path.
+
+        Args:
+            times: Point times in seconds (ascending)
+            prices: Prices at each point
+            ticks: Precomputed price_ticks(prices), to reuse across runs
+
+        Returns:
+            BacktestResult
+        """
+        times = np.ascontiguousarray(times, dtype=np.float64)
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        ticks = price_ticks(prices) if ticks is None else np.ascontiguousarray(ticks, dtype=np.int64)
+        n = len(ticks)
+        if n == 0:
+            raise ValueError("Empty price path")
+
+        cfg = self.config
+        spacing = cfg.level_spacing_pct
+        size = cfg.lit_per_order
+
+        orders: dict[int, _SimOrder] = {}
+        undetected: list[tuple[float, _SimOrder]] = []  # (detect time, filled order)
+        next_id = 0
+
+        cash = self.initial_usdc
+        inventory = self.initial_lit
+        buy_fills = sell_fills = recenters = missed = events = 0
+        profit = fees = Decimal("0")
+        recenter_lo = recenter_hi = 0
+        threshold = cfg.recenter_threshold
+
+        # Inventory/cash after each event, for the vectorized equity path
+        marks = [0]
+        cash_marks = [float(cash)]
+        inventory_marks = [float(inventory)]
+
+        ladder = PriceLadder(Decimal(int(ticks[0])).scaleb(-PRICE_DECIMALS), spacing, PRICE_DECIMALS)
+
+        def place(side: OrderSide, tick: int, now: float):
+            nonlocal next_id
+            if any(o.side == side and o.tick == tick for o in orders.values()):
+                return
+            orders[next_id] = _SimOrder(side, ladder.to_price(tick), tick, now)
+            next_id += 1
+
+        def build_grid(tick: int, now: float):
+            nonlocal recenter_lo, recenter_hi
+            orders.clear()
+            undetected.clear()
+            buy_ticks, sell_ticks = ladder.levels(ladder.nearest(tick), cfg.num_levels)
+            for level in buy_ticks:
+                place(OrderSide.BUY, level, now)
+            for level in sell_ticks:
+                place(OrderSide.SELL, level, now)
+            if threshold > 0 and buy_ticks and sell_ticks:
+                recenter_lo = buy_ticks[-min(threshold, len(buy_ticks))]
+                recenter_hi = sell_ticks[-min(threshold, len(sell_ticks))]
+            else:
+                recenter_lo, recenter_hi = _NO_BUY, _NO_SELL
+
+        build_grid(int(ticks[0]), float(times[0]))
+
+        i = 1
+        while i < n:
+            lo = max((o.tick for o in orders.values() if o.side == OrderSide.BUY), default=_NO_BUY)
+            hi = min((o.tick for o in orders.values() if o.side == OrderSide.SELL), default=_NO_SELL)
+            lo, hi = max(lo, recenter_lo), min(hi, recenter_hi)
+
+            end = n
+            if undetected:
+                due = min(t for t, _ in undetected)
+                end = max(i, int(np.searchsorted(times, due, side="left")))
+                end = min(end, n)
+            j = _next_crossing(ticks, i, end, lo, hi)
+            if j >= n:
+                break
+            events += 1
+            tick = int(ticks[j])
+            now = float(times[j])
+
+            # Exchange side: everything the price touched fills at its own price
+            for order_id in [k for k, o in orders.items()
+                             if (o.side == OrderSide.BUY and o.tick >= tick)
+                             or (o.side == OrderSide.SELL and o.tick <= tick)]:
+                order = orders.pop(order_id)
+                notional = order.price * size
+                fee = notional * self.maker_fee
+                fees += fee
+                if order.side == OrderSide.BUY:
+                    inventory += size
+                    cash -= notional + fee
+                else:
+                    inventory -= size
+                    cash += notional - fee
+                undetected.append((max(now, order.placed_at + self.fill_grace_seconds), order))
+
+            # Engine side: detected fills get counter-orders
+            if undetected:
+                still_pending = []
+                for detect_at, order in undetected:
+                    if detect_at > now:
+                        still_pending.append((detect_at, order))
+                        continue
+                    place(
+                        OrderSide.SELL if order.side == OrderSide.BUY else OrderSide.BUY,
+                        ladder.counter_tick(order.side, order.tick),
+                        now,
+                    )
+                    if order.side == OrderSide.BUY:
+                        buy_fills += 1
+                    else:
+                        sell_fills += 1
+                        profit += size * order.price * spacing
+                undetected[:] = still_pending
+
+            if tick >= recenter_hi or tick <= recenter_lo:
+                missed += len(undetected)
+                recenters += 1
+                build_grid(tick, now)
+
+            marks.append(j)
+            cash_marks.append(float(cash))
+            inventory_marks.append(float(inventory))
+            i = j + 1
+
+        # Equity along the whole path: balances are piecewise constant between events
+        lengths = np.diff(np.append(marks, n))
+        inventory_path = np.repeat(inventory_marks, lengths)
+        cash_path = np.repeat(cash_marks, lengths)
+        equity = cash_path + inventory_path * prices
+
+        floor = float(self.floor_value)
+        below = equity <= floor
+        breach_starts = np.flatnonzero(below & ~np.concatenate(([False], below[:-1])))
+        running_peak = np.maximum.accumulate(equity)
+
+        return BacktestResult(
+            cycles=sell_fills,
+            buy_fills=buy_fills,
+            sell_fills=sell_fills,
+            profit=float(profit),
+            pnl=float(equity[-1] - equity[0]),
+            fees=float(fees),
+            recenters=recenters,
+            start_equity=float(equity[0]),
+            end_equity=float(equity[-1]),
+            min_equity=float(equity.min()),
+            max_drawdown=float((running_peak - equity).max()),
+            end_inventory=float(inventory),
+            min_inventory=float(min(inventory_marks)),
+            max_inventory=float(max(inventory_marks)),
+            inventory_swing=float(max(inventory_marks) - min(inventory_marks)),
+            end_cash=float(cash),
+            min_cash=float(min(cash_marks)),
+            floor_breaches=len(breach_starts),
+            first_breach_time=float(times[breach_starts[0]]) if len(breach_starts) else None,
+            missed_fills=missed,
+            points=n,
+            events=events,
+            params={
+                "num_levels": cfg.num_levels,
+                "level_spacing_pct": str(cfg.level_spacing_pct),
+                "lit_per_order": str(cfg.lit_per_order),
+                "recenter_threshold": cfg.recenter_threshold,
+            },
+        )
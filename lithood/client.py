@@ -2,6 +2,7 @@
 """Lighter DEX API client wrapper with retry logic and connection monitoring."""
 
 import asyncio
+import dataclasses
 import time
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -17,6 +18,16 @@ from lithood.config import (
     LIGHTER_API_KEY_INDEX,
     LIGHTER_ACCOUNT_INDEX,
     PROXY_URL,
+    PROXY_URLS,
+    LIGHTER_BASE_URLS,
+    HEALTH_CHECK_INTERVAL_SECONDS,
+    HEALTH_CHECK_TIMEOUT_SECONDS,
+    HEALTH_DEGRADED_RTT_SECONDS,
+    HTTP_POOL_SIZE,
+    HTTP_KEEPALIVE_SECONDS,
+    HTTP_DNS_TTL_SECONDS,
+    HTTP_WARMUP_CONNECTIONS,
+    HTTP_HEDGE_READS,
 )
 
 from lighter import (
@@ -26,7 +37,13 @@ from lighter import (
     AccountApi,
     OrderApi,
     FundingApi,
+    RootApi,
 )
+from lithood.health import HealthMonitor
+from lithood.signing import SigningPool, TxRequest
+from lithood.state import client_order_index
+from lithood.instrumentation import timed
+from lithood.transport import Endpoint, HttpPool, install_shared_transport
 from lithood.logger import log
 from lithood.types import (
     Market,
@@ -40,6 +57,9 @@ from lithood.types import (
     Account,
     AssetBalance,
     FundingRate,
+    BookLevel,
+    OrderBook,
+    Trade,
 )
 from lithood.retry import (
     retry_async,
@@ -47,6 +67,7 @@ from lithood.retry import (
     RETRY_FAST,
     RETRY_STANDARD,
     RETRY_PERSISTENT,
+    calculate_delay,
     is_transient_error,
 )
 
@@ -54,6 +75,13 @@ from lithood.retry import (
 class LighterClient:
     """Client for interacting with the Lighter DEX API."""
 
+    # Auth tokens (DEFAULT_10_MIN_AUTH_EXPIRY) are refreshed a minute before expiry
+    AUTH_TOKEN_LIFETIME = 10 * 60
+    AUTH_TOKEN_REFRESH_MARGIN = 60
+
+    # Most client order indices the accountOrders endpoint accepts per call
+    CLIENT_ORDER_LOOKUP_LIMIT = 20
+
     def __init__(
         self,
         base_url: str = LIGHTER_BASE_URL,
@@ -61,6 +89,7 @@ class LighterClient:
         api_key_private: str = LIGHTER_API_KEY_PRIVATE,
         api_key_index: int = LIGHTER_API_KEY_INDEX,
         account_index: Optional[int] = None,
+        fallback_urls: Optional[list[str]] = None,
     ):
         """Initialize the client.
 
@@ -69,18 +98,22 @@ class LighterClient:
             wallet_private_key: Wallet private key (for account lookup)
             api_key_private: API key private key (for signing orders)
             api_key_index: API key index (3-254)
-            account_index: Account index (optional, will be looked up if not provided)
+            account_index: Account index (defaults to LIGHTER_ACCOUNT_INDEX, else looked up
+                from the wallet address on connect)
+            fallback_urls: Extra base URLs for failover (defaults to LIGHTER_BASE_URLS)
         """
         self.base_url = base_url
         self.wallet_private_key = wallet_private_key
         self.api_key_private = api_key_private
         self.api_key_index = api_key_index
 
-        # Use provided account index or look it up later
-        if LIGHTER_ACCOUNT_INDEX:
+        # Provided account index wins over LIGHTER_ACCOUNT_INDEX; otherwise look it up later
+        if account_index is not None:
+            self.account_index = account_index
+        elif LIGHTER_ACCOUNT_INDEX:
             self.account_index = int(LIGHTER_ACCOUNT_INDEX)
         else:
-            self.account_index = account_index
+            self.account_index = None
 
         # Derive L1 address from wallet private key (for account lookup)
         if wallet_private_key:
@@ -95,6 +128,26 @@ class LighterClient:
         self.account_api: Optional[AccountApi] = None
         self.order_api: Optional[OrderApi] = None
         self.funding_api: Optional[FundingApi] = None
+        self.root_api: Optional[RootApi] = None
+
+        # One HTTP connection pool shared by the reader and signer ApiClients,
+        # routing across every base URL x proxy combination (base_url first)
+        urls = [base_url] + [u for u in (fallback_urls or LIGHTER_BASE_URLS) if u.rstrip("/") != base_url.rstrip("/")]
+        proxies = ([PROXY_URL] if PROXY_URL else []) + PROXY_URLS or [None]
+        self._http_pool = HttpPool(
+            endpoints=[Endpoint(url, proxy) for url in urls for proxy in proxies],
+            pool_size=HTTP_POOL_SIZE,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            dns_ttl=HTTP_DNS_TTL_SECONDS,
+            hedge_reads=HTTP_HEDGE_READS,
+        )
+
+        # Signing runs on a thread pool; nonces and sends stay on the loop
+        self._signing = SigningPool()
+
+        # Auth token cache (reused across reconnects)
+        self._auth_token: Optional[str] = None
+        self._auth_token_expiry: float = 0.0
 
         # Market cache: key = "{symbol}_{market_type}"
         self._markets: dict[str, Market] = {}
@@ -102,6 +155,10 @@ class LighterClient:
         # Connection monitoring
         self._connection_monitor = ConnectionMonitor(self._reconnect)
         self._last_successful_op = time.time()
+        self._health_monitor: Optional[HealthMonitor] = None
+
+        # Set by connect_offline(): a FakeExchange standing in for the network
+        self._offline_exchange = None
 
     async def connect(self) -> None:
         """Initialize API clients and load market data."""
@@ -110,17 +167,12 @@ class LighterClient:
             # Mask password in log
             masked_proxy = PROXY_URL.split("@")[-1] if "@" in PROXY_URL else PROXY_URL
             log.info(f"Using proxy: {masked_proxy}")
+        if len(self._http_pool.endpoints) > 1:
+            names = ", ".join(e.name for e in self._http_pool.endpoints)
+            log.info(f"Endpoint failover across: {names}{' (hedged reads)' if HTTP_HEDGE_READS else ''}")
 
         # Initialize API client for read operations
-        config = Configuration(host=self.base_url)
-        if PROXY_URL:
-            config.proxy = PROXY_URL
-        self.api_client = ApiClient(configuration=config)
-
-        # Initialize API endpoints
-        self.account_api = AccountApi(self.api_client)
-        self.order_api = OrderApi(self.api_client)
-        self.funding_api = FundingApi(self.api_client)
+        await self._init_api_client()
 
         # Get account index from L1 address if not already set
         if self.account_index is None and self.l1_address:
@@ -141,30 +193,104 @@ class LighterClient:
 
         # Initialize signer client for write operations (using API key)
         if self.api_key_private and self.account_index is not None:
-            # Pre-configure proxy before SignerClient init (SDK makes requests during __init__)
-            if PROXY_URL:
-                from lighter.api_client import Configuration as LighterConfiguration
-                LighterConfiguration.get_default_copy().proxy = PROXY_URL
-            self.signer_client = SignerClient(
-                url=self.base_url,
-                account_index=self.account_index,
-                api_private_keys={self.api_key_index: self.api_key_private},
-            )
-            # Also apply proxy to the instance's api_client
-            if PROXY_URL:
-                self.signer_client.api_client.configuration.proxy = PROXY_URL
-                log.info(f"Signer client proxy configured")
+            await self._init_signer_client()
             log.info(f"Signer client initialized with API key index {self.api_key_index}")
         elif not self.api_key_private:
             log.warning("No API key configured - read-only mode (cannot place orders)")
 
+        # Open pooled connections before the first order needs them
+        warmed = await self._http_pool.warm_up("/", HTTP_WARMUP_CONNECTIONS)
+        total = HTTP_WARMUP_CONNECTIONS * len(self._http_pool.endpoints)
+        log.info(f"HTTP pool warmed up: {warmed}/{total} connections")
+
         # Load market data
         await self._load_markets()
         self._connection_monitor.record_success()
         log.info(f"Connected. Loaded {len(self._markets)} markets.")
 
+    async def connect_offline(self, exchange) -> None:
+        """Bind to an in-process simulated exchange instead of the network.
+
+        Everything above the SDK objects (retries, market cache, auth token
+        cache, order parsing) runs unchanged, so engines can be exercised
+        offline.
+
+        Args:
+            exchange: lithood.fake_exchange.FakeExchange
+        """
+        self._offline_exchange = exchange
+        self._bind_offline_exchange()
+        await self._load_markets()
+        self._connection_monitor.record_success()
+        log.info(f"Connected to offline exchange. Loaded {len(self._markets)} markets.")
+
+    def _bind_offline_exchange(self) -> None:
+        exchange = self._offline_exchange
+        self.api_client = exchange.api_client
+        self.account_api = exchange.account_api
+        self.order_api = exchange.order_api
+        self.funding_api = exchange.funding_api
+        self.root_api = exchange.root_api
+        self.signer_client = exchange.signer_client
+        self._signing.bind(self.signer_client)
+        self.account_index = exchange.account_index
+
+    async def _init_api_client(self) -> None:
+        """Create the read-side ApiClient and endpoint wrappers."""
+        config = Configuration(host=self.base_url)
+        self.api_client = ApiClient(configuration=config)
+        # Proxy, pool limits and keep-alive come from the shared pool
+        await install_shared_transport(self.api_client, self._http_pool)
+
+        self.account_api = AccountApi(self.api_client)
+        self.order_api = OrderApi(self.api_client)
+        self.funding_api = FundingApi(self.api_client)
+        self.root_api = RootApi(self.api_client)
+
+    async def _init_signer_client(self) -> None:
+        """Create the SignerClient and route it through the shared pool."""
+        self.signer_client = SignerClient(
+            url=self.base_url,
+            account_index=self.account_index,
+            api_private_keys={self.api_key_index: self.api_key_private},
+        )
+        self._signing.bind(self.signer_client)
+        await install_shared_transport(self.signer_client.api_client, self._http_pool)
+
     async def _reconnect(self) -> None:
-        """Reconnect to the exchange after connection loss."""
+        """Reconnect to the exchange after connection loss.
+
+        Hot-swaps the shared HTTP session under the existing ApiClient and
+        SignerClient, keeping the signer, its nonce state, the auth token
+        cache and the market map. Falls back to a full rebuild only if the
+        clients were never created or the swapped transport is still dead.
+        """
+        if self._offline_exchange is not None:
+            self._bind_offline_exchange()
+            await self._load_markets()
+            return
+
+        if self.api_client is None:
+            await self._rebuild_clients()
+            return
+
+        log.info("Attempting to reconnect to exchange (transport swap)...")
+        self._http_pool.swap()
+
+        try:
+            # One cheap round trip opens the new connection and verifies it
+            await self._ping()
+        except Exception as e:
+            log.warning(f"Transport swap did not restore connectivity ({e}) - rebuilding clients")
+            await self._rebuild_clients()
+            return
+
+        if not self._markets:
+            await self._load_markets()
+        log.info("Reconnection successful (transport swapped)")
+
+    async def _rebuild_clients(self) -> None:
+        """Tear down and re-create ApiClient and SignerClient (full bootstrap)."""
         log.info("Attempting to reconnect to exchange...")
 
         # Close existing connections
@@ -176,44 +302,51 @@ class LighterClient:
         except Exception:
             pass  # Ignore errors during cleanup
 
-        # Re-initialize
-        config = Configuration(host=self.base_url)
-        if PROXY_URL:
-            config.proxy = PROXY_URL
-        self.api_client = ApiClient(configuration=config)
-
-        self.account_api = AccountApi(self.api_client)
-        self.order_api = OrderApi(self.api_client)
-        self.funding_api = FundingApi(self.api_client)
+        # Re-initialize on a fresh session
+        self._http_pool.swap()
+        await self._init_api_client()
 
+        self._auth_token = None
         if self.api_key_private and self.account_index is not None:
-            # Pre-configure proxy before SignerClient init
-            if PROXY_URL:
-                from lighter.api_client import Configuration as LighterConfig
-                LighterConfig.get_default_copy().proxy = PROXY_URL
-            self.signer_client = SignerClient(
-                url=self.base_url,
-                account_index=self.account_index,
-                api_private_keys={self.api_key_index: self.api_key_private},
-            )
-            if PROXY_URL:
-                self.signer_client.api_client.configuration.proxy = PROXY_URL
+            await self._init_signer_client()
 
         # Verify connection by loading markets
         await self._load_markets()
         log.info("Reconnection successful")
 
+    async def _get_auth_token(self) -> tuple[Optional[str], Optional[str]]:
+        """Get a cached auth token, creating a new one shortly before expiry.
+
+        Returns:
+            Tuple of (auth_token, error)
+        """
+        now = time.time()
+        if self._auth_token is not None and now < self._auth_token_expiry - self.AUTH_TOKEN_REFRESH_MARGIN:
+            return self._auth_token, None
+
+        auth_token, auth_error = await self._signing.run(
+            "auth_token", self.signer_client.create_auth_token_with_expiry, SignerClient.DEFAULT_10_MIN_AUTH_EXPIRY
+        )
+        if auth_error:
+            return None, auth_error
+        self._auth_token = auth_token
+        self._auth_token_expiry = now + self.AUTH_TOKEN_LIFETIME
+        return auth_token, None
+
     async def ensure_connected(self) -> bool:
         """Ensure connection is healthy, reconnect if needed."""
         return await self._connection_monitor.ensure_connected()
 
+    async def _ping(self) -> None:
+        """Hit the lightweight status endpoint (raises on failure)."""
+        if not self.root_api:
+            raise ConnectionError("Client not connected")
+        await self.root_api.status()
+
     async def health_check(self) -> bool:
-        """Quick health check - try to fetch orderbook."""
+        """Quick health check - ping the status endpoint."""
         try:
-            if not self.order_api:
-                return False
-            # Try to get orderbook details (lightweight call)
-            await self.order_api.order_book_details()
+            await self._ping()
             self._connection_monitor.record_success()
             return True
         except Exception as e:
@@ -221,18 +354,48 @@ class LighterClient:
             self._connection_monitor.record_failure()
             return False
 
+    def start_health_monitor(self) -> None:
+        """Start background pings that reconnect before trading calls need to."""
+        if self._health_monitor is None:
+            self._health_monitor = HealthMonitor(
+                ping=self._ping,
+                connection_monitor=self._connection_monitor,
+                interval=HEALTH_CHECK_INTERVAL_SECONDS,
+                timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
+                degraded_rtt=HEALTH_DEGRADED_RTT_SECONDS,
+            )
+        self._health_monitor.start()
+
+    async def stop_health_monitor(self) -> None:
+        """Stop the background health monitor if running."""
+        if self._health_monitor is not None:
+            await self._health_monitor.stop()
+
+    def get_health_stats(self) -> dict:
+        """Get connection health statistics (RTT percentiles, reconnects)."""
+        if self._health_monitor is None:
+            return {"running": False}
+        return self._health_monitor.get_stats()
+
+    def get_pool_stats(self) -> dict:
+        """Get shared HTTP pool statistics (open, reused, waiting connections)."""
+        return self._http_pool.get_stats()
+
     def is_connected(self) -> bool:
         """Check if we believe we're connected."""
         return self._connection_monitor.is_connected
 
     async def close(self) -> None:
         """Clean up connections."""
+        await self.stop_health_monitor()
         if self.api_client:
             await self.api_client.close()
             self.api_client = None
         if self.signer_client:
             await self.signer_client.close()
             self.signer_client = None
+        self._signing.close()
+        await self._http_pool.close()
         log.info("Client connections closed")
 
     async def _load_markets(self) -> None:
@@ -260,7 +423,7 @@ class LighterClient:
                     taker_fee=Decimal(ob.taker_fee),
                     maker_fee=Decimal(ob.maker_fee),
                 )
-                log.debug(f"Loaded market: {key} (id={ob.market_id})")
+                log.debug("Loaded market: %s (id=%s)", key, ob.market_id)
 
             # Load spot markets
             for ob in details.spot_order_book_details:
@@ -279,7 +442,7 @@ class LighterClient:
                     taker_fee=Decimal(ob.taker_fee),
                     maker_fee=Decimal(ob.maker_fee),
                 )
-                log.debug(f"Loaded market: {key} (id={ob.market_id})")
+                log.debug("Loaded market: %s (id=%s)", key, ob.market_id)
 
         except Exception as e:
             log.error(f"Failed to load markets: {e}")
@@ -298,6 +461,17 @@ class LighterClient:
         key = f"{symbol}_{market_type.value}"
         return self._markets.get(key)
 
+    def get_market_by_id(self, market_id: int) -> Optional[Market]:
+        """Get market info by market ID.
+
+        Args:
+            market_id: Exchange market index
+
+        Returns:
+            Market info or None if not found
+        """
+        return next((m for m in self._markets.values() if m.market_id == market_id), None)
+
     async def get_account(self) -> Optional[Account]:
         """Get account balances and positions.
 
@@ -362,6 +536,7 @@ class LighterClient:
             log.error(f"Failed to get account: {e}")
             raise
 
+    @timed("get_active_orders")
     async def get_active_orders(
         self,
         market_id: Optional[int] = None,
@@ -387,33 +562,13 @@ class LighterClient:
                 # Create auth token
                 auth_token = None
                 if self.signer_client:
-                    auth_token, auth_error = self.signer_client.create_auth_token_with_expiry(
-                        SignerClient.DEFAULT_10_MIN_AUTH_EXPIRY
-                    )
+                    auth_token, auth_error = await self._get_auth_token()
                     if auth_error:
                         auth_failures += 1
                         log.error(f"Failed to create auth token for market {mid}: {auth_error}")
                         continue
 
-                result = await self.order_api.account_active_orders(
-                    account_index=self.account_index,
-                    market_id=mid,
-                    auth=auth_token,
-                )
-
-                for o in result.orders:
-                    # Use order_index for cancellation - it's the integer ID required by the SDK
-                    orders.append(Order(
-                        id=str(o.order_index),
-                        market_id=o.market_index,
-                        side=OrderSide.SELL if o.is_ask else OrderSide.BUY,
-                        price=Decimal(o.price),
-                        size=Decimal(o.initial_base_amount),
-                        status=self._parse_order_status(o.status),
-                        order_type=self._parse_order_type(o.type),
-                        created_at=datetime.fromtimestamp(o.created_at / 1000) if o.created_at else datetime.now(),
-                        filled_size=Decimal(o.filled_base_amount),
-                    ))
+                orders.extend(await self._fetch_active_orders(mid, auth_token))
 
             except Exception as e:
                 log.error(f"Failed to get active orders for market {mid}: {e}")
@@ -424,6 +579,105 @@ class LighterClient:
 
         return orders
 
+    async def _fetch_active_orders(self, market_id: int, auth_token: Optional[str]) -> list[Order]:
+        """Fetch and parse one market's active orders (raises on failure)."""
+        result = await self.order_api.account_active_orders(
+            account_index=self.account_index,
+            market_id=market_id,
+            auth=auth_token,
+        )
+        return [self._parse_order(o) for o in result.orders]
+
+    def _parse_order(self, o) -> Order:
+        """Convert an API order to an Order."""
+        # Use order_index for cancellation - it's the integer ID required by the SDK
+        return Order(
+            id=str(o.order_index),
+            market_id=o.market_index,
+            side=OrderSide.SELL if o.is_ask else OrderSide.BUY,
+            price=Decimal(o.price),
+            size=Decimal(o.initial_base_amount),
+            status=self._parse_order_status(o.status),
+            order_type=self._parse_order_type(o.type),
+            client_order_index=getattr(o, "client_order_index", None) or None,
+            created_at=datetime.fromtimestamp(o.created_at / 1000) if o.created_at else datetime.now(),
+            filled_size=Decimal(o.filled_base_amount),
+        )
+
+    async def get_orders_by_client_index(self, client_order_indexes: list[int]) -> Optional[dict[int, Order]]:
+        """Look up orders (active or not) by the client order index they were sent with.
+
+        Args:
+            client_order_indexes: Indices to look up
+
+        Returns:
+            Dict of client_order_index -> Order for the indices the exchange
+            knows, or None if the lookup failed (outcome still unknown)
+        """
+        if not self.order_api or self.account_index is None:
+            return None
+
+        auth_token = None
+        if self.signer_client:
+            auth_token, auth_error = await self._get_auth_token()
+            if auth_error:
+                log.error(f"Failed to create auth token: {auth_error}")
+                return None
+
+        found = {}
+        # The endpoint takes at most CLIENT_ORDER_LOOKUP_LIMIT indices per call
+        for i in range(0, len(client_order_indexes), self.CLIENT_ORDER_LOOKUP_LIMIT):
+            chunk = client_order_indexes[i:i + self.CLIENT_ORDER_LOOKUP_LIMIT]
+            try:
+                result = await self.order_api.account_orders(
+                    authorization=auth_token,
+                    client_order_indexes=",".join(str(index) for index in chunk),
+                    account_index=self.account_index,
+                )
+            except Exception as e:
+                log.error(f"Failed to look up orders by client order index: {e}")
+                return None
+            for o in result.orders:
+                order = self._parse_order(o)
+                if order.client_order_index in chunk:
+                    found[order.client_order_index] = order
+        return found
+
+    @timed("get_active_orders_by_market")
+    async def get_active_orders_by_market(self, market_ids: list[int]) -> dict[int, list[Order]]:
+        """Fetch active orders for several markets concurrently with one auth token.
+
+        Unlike get_active_orders(), a market whose fetch failed is left out
+        of the result instead of looking like a market with no orders, so
+        callers never mistake a failed read for fills.
+
+        Args:
+            market_ids: Markets to fetch
+
+        Returns:
+            Dict of market_id -> active orders, for markets fetched successfully
+        """
+        if not self.order_api or self.account_index is None:
+            return {}
+
+        auth_token = None
+        if self.signer_client:
+            auth_token, auth_error = await self._get_auth_token()
+            if auth_error:
+                log.error(f"Failed to create auth token: {auth_error}")
+                return {}
+
+        results = await asyncio.gather(
+            *(self._fetch_active_orders(mid, auth_token) for mid in market_ids), return_exceptions=True
+        )
+        orders = {}
+        for mid, result in zip(market_ids, results):
+            if isinstance(result, Exception):
+                log.error(f"Failed to get active orders for market {mid}: {result}")
+            else:
+                orders[mid] = result
+        return orders
+
     def _parse_order_status(self, status: str) -> OrderStatus:
         """Parse order status string to enum."""
         status_map = {
@@ -432,7 +686,11 @@ class LighterClient:
             "cancelled": OrderStatus.CANCELLED,
             "partial": OrderStatus.PARTIALLY_FILLED,
         }
-        return status_map.get(status.lower(), OrderStatus.PENDING)
+        status = status.lower()
+        if status.startswith("cancel"):
+            # "canceled", "canceled-post-only", "canceled-not-enough-balance", ...
+            return OrderStatus.CANCELLED
+        return status_map.get(status, OrderStatus.PENDING)
 
     def _parse_order_type(self, order_type: str) -> OrderType:
         """Parse order type string to enum."""
@@ -446,6 +704,7 @@ class LighterClient:
         }
         return type_map.get(order_type.lower(), OrderType.LIMIT)
 
+    @timed("get_mid_price")
     async def get_mid_price(self, symbol: str, market_type: MarketType) -> Optional[Decimal]:
         """Get mid price from orderbook.
 
@@ -481,6 +740,76 @@ class LighterClient:
             log.error(f"Failed to get mid price for market {symbol}_{market_type.value}: {e}")
             return None
 
+    @timed("get_order_book")
+    async def get_order_book(self, symbol: str, market_type: MarketType, limit: int = 20) -> Optional[OrderBook]:
+        """Get the top of the order book.
+
+        Args:
+            symbol: Market symbol (e.g., "LIT")
+            market_type: Market type (SPOT or PERP)
+            limit: Levels per side
+
+        Returns:
+            OrderBook or None on failure
+        """
+        if not self.order_api:
+            return None
+
+        market = self.get_market(symbol, market_type)
+        if not market:
+            log.error(f"Market not found: {symbol}_{market_type.value}")
+            return None
+
+        try:
+            result = await self.order_api.order_book_orders(market_id=market.market_id, limit=limit)
+            return OrderBook(
+                market_id=market.market_id,
+                bids=[BookLevel(Decimal(b.price), Decimal(b.remaining_base_amount)) for b in result.bids],
+                asks=[BookLevel(Decimal(a.price), Decimal(a.remaining_base_amount)) for a in result.asks],
+                timestamp=datetime.now(),
+            )
+        except Exception as e:
+            log.error(f"Failed to get order book for market {symbol}_{market_type.value}: {e}")
+            return None
+
+    @timed("get_recent_trades")
+    async def get_recent_trades(self, symbol: str, market_type: MarketType, limit: int = 100) -> list[Trade]:
+        """Get the most recent public trades, oldest first.
+
+        Args:
+            symbol: Market symbol (e.g., "LIT")
+            market_type: Market type (SPOT or PERP)
+            limit: Number of trades (1-100)
+
+        Returns:
+            List of trades (empty on failure)
+        """
+        if not self.order_api:
+            return []
+
+        market = self.get_market(symbol, market_type)
+        if not market:
+            log.error(f"Market not found: {symbol}_{market_type.value}")
+            return []
+
+        try:
+            result = await self.order_api.recent_trades(market_id=market.market_id, limit=limit)
+            trades = [
+                Trade(
+                    trade_id=t.trade_id,
+                    market_id=t.market_id,
+                    price=Decimal(t.price),
+                    size=Decimal(t.size),
+                    is_maker_ask=bool(t.is_maker_ask),
+                    timestamp=datetime.fromtimestamp(t.timestamp / 1000),
+                )
+                for t in result.trades
+            ]
+            return sorted(trades, key=lambda t: t.trade_id)
+        except Exception as e:
+            log.error(f"Failed to get recent trades for market {symbol}_{market_type.value}: {e}")
+            return []
+
     def _to_price_int(self, price: Decimal, market: Market) -> int:
         """Convert Decimal price to API integer format.
 
@@ -513,6 +842,7 @@ class LighterClient:
         price: Decimal,
         size: Decimal,
         post_only: bool = True,
+        client_order_index: int = 0,
     ) -> Optional[Order]:
         """Place a limit order with retry logic.
 
@@ -523,6 +853,10 @@ class LighterClient:
             price: Order price
             size: Order size in base asset
             post_only: If True, use POST_ONLY time in force (default True)
+            client_order_index: Our id for the order (0 = none), for looking
+                it up with get_orders_by_client_index(). A retry first asks
+                the exchange for it, so an order whose response was lost is
+                returned instead of being sent twice.
 
         Returns:
             Order object if successful, None otherwise
@@ -536,26 +870,22 @@ class LighterClient:
             log.error(f"Market not found: {symbol}_{market_type.value}")
             return None
 
-        async def _place_order():
-            is_ask = 1 if side == OrderSide.SELL else 0
-            price_int = self._to_price_int(price, market)
-            size_int = self._to_size_int(size, market)
-
-            # Map post_only to time in force
-            if post_only:
-                tif = SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY
-            else:
-                tif = SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME
+        attempts = 0
 
-            tx, resp, error = await self.signer_client.create_order(
-                market_index=market.market_id,
-                client_order_index=0,
-                base_amount=size_int,
-                price=price_int,
-                is_ask=is_ask,
-                order_type=SignerClient.ORDER_TYPE_LIMIT,
-                time_in_force=tif,
-                reduce_only=False,
+        async def _place_order():
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1 and client_order_index:
+                found = await self.get_orders_by_client_index([client_order_index])
+                if found is None:
+                    raise ConnectionError(f"Could not look up client order index {client_order_index}")
+                earlier = found.get(client_order_index)
+                if earlier is not None:
+                    log.info(f"Order {earlier.id} from an earlier attempt is on the exchange")
+                    return earlier if earlier.status != OrderStatus.CANCELLED else None
+
+            tx, resp, error = await self._signing.submit(
+                self._limit_order_request(market, side, price, size, post_only, client_order_index)
             )
 
             if error:
@@ -565,24 +895,9 @@ class LighterClient:
                 log.error(f"Failed to place limit order: {error}")
                 return None
 
-            if resp and resp.tx_hash:
-                self._connection_monitor.record_success()
-                # Use order_index as id for cancellation if available, otherwise tx_hash
-                order_id = str(resp.order_index) if hasattr(resp, 'order_index') and resp.order_index else resp.tx_hash
-                return Order(
-                    id=order_id,
-                    market_id=market.market_id,
-                    side=side,
-                    price=price,
-                    size=size,
-                    status=OrderStatus.PENDING,
-                    order_type=OrderType.LIMIT,
-                    tx_hash=resp.tx_hash,
-                    created_at=datetime.now(),
-                    filled_size=Decimal("0"),
-                )
-            return None
+            return self._limit_order_from_response(market, side, price, size, resp, client_order_index)
 
+        start = time.monotonic()
         result, error = await retry_async(
             _place_order,
             config=RETRY_STANDARD,
@@ -594,13 +909,156 @@ class LighterClient:
             return None
 
         if result:
+            latency_ms = (time.monotonic() - start) * 1000
             log.info(
-                f"Placed {side.value} limit order: {size} @ {price} "
-                f"(market={market.symbol}, id={result.id}, tx={result.tx_hash})"
+                "Placed %s limit order: %s @ %s (market=%s, id=%s, tx=%s, %.0fms)",
+                side.value, size, price, market.symbol, result.id, result.tx_hash, latency_ms,
+                extra={
+                    "order_id": result.id,
+                    "market": market.symbol,
+                    "side": side.value,
+                    "price": str(price),
+                    "size": str(size),
+                    "latency_ms": round(latency_ms, 1),
+                },
             )
 
         return result
 
+    async def place_limit_orders(
+        self,
+        symbol: str,
+        market_type: MarketType,
+        orders: list[tuple[OrderSide, Decimal, Decimal]],
+        post_only: bool = True,
+        client_order_indexes: Optional[list[int]] = None,
+    ) -> list[Optional[Order]]:
+        """Place several limit orders in one pipelined submission.
+
+        The orders are signed in parallel and sent in order on one API key,
+        sharing round trips (see lithood.signing.TxPipeline). Orders that
+        fail with a transient error are resubmitted together with
+        RETRY_STANDARD backoff, unless the exchange reports their client
+        order index was placed after all; other failures are logged and left as None.
+
+        Args:
+            symbol: Market symbol (e.g., "LIT")
+            market_type: Market type (SPOT or PERP)
+            orders: (side, price, size) per order, in submission order
+            post_only: If True, use POST_ONLY time in force (default True)
+            client_order_indexes: Our id for each order (default: none)
+
+        Returns:
+            Order object (or None if it failed) for each entry in orders
+        """
+        results: list[Optional[Order]] = [None] * len(orders)
+        if not orders:
+            return results
+        if not self.signer_client:
+            log.error("Signer client not initialized")
+            return results
+
+        market = self.get_market(symbol, market_type)
+        if not market:
+            log.error(f"Market not found: {symbol}_{market_type.value}")
+            return results
+
+        client_order_indexes = client_order_indexes or [0] * len(orders)
+        start = time.monotonic()
+        pending = list(range(len(orders)))
+        for attempt in range(RETRY_STANDARD.max_retries + 1):
+            if attempt:
+                delay = calculate_delay(attempt - 1, RETRY_STANDARD)
+                log.warning(f"{len(pending)} limit orders failed transiently (attempt {attempt}/"
+                            f"{RETRY_STANDARD.max_retries + 1}) - retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                # A transient error may have hidden an order that got there
+                indexes = [client_order_indexes[i] for i in pending if client_order_indexes[i]]
+                if indexes:
+                    found = await self.get_orders_by_client_index(indexes)
+                    if found is None:
+                        continue
+                    for i in [i for i in pending if client_order_indexes[i] in found]:
+                        earlier = found[client_order_indexes[i]]
+                        if earlier.status != OrderStatus.CANCELLED:
+                            results[i] = earlier
+                        pending.remove(i)
+                    if not pending:
+                        break
+
+            submitted = await self._signing.submit_many([
+                self._limit_order_request(market, *orders[i], post_only, client_order_indexes[i]) for i in pending
+            ])
+            retry = []
+            for i, (tx, resp, error) in zip(pending, submitted):
+                side, price, size = orders[i]
+                if error:
+                    if is_transient_error(Exception(str(error))):
+                        retry.append(i)
+                    else:
+                        log.error(f"Failed to place {side.value} limit order @ {price}: {error}")
+                    continue
+                results[i] = self._limit_order_from_response(market, side, price, size, resp, client_order_indexes[i])
+            pending = retry
+            if not pending:
+                break
+
+        if pending:
+            self._connection_monitor.record_failure()
+            log.error(f"{len(pending)} limit orders failed after {RETRY_STANDARD.max_retries + 1} attempts")
+
+        placed = sum(1 for order in results if order is not None)
+        latency_ms = (time.monotonic() - start) * 1000
+        log.info(
+            "Placed %d/%d limit orders on %s (%.0fms)", placed, len(orders), market.symbol, latency_ms,
+            extra={"market": market.symbol, "placed": placed, "requested": len(orders),
+                   "latency_ms": round(latency_ms, 1)},
+        )
+        return results
+
+    def _limit_order_request(
+        self, market: Market, side: OrderSide, price: Decimal, size: Decimal, post_only: bool,
+        client_order_index: int = 0,
+    ) -> TxRequest:
+        """Build the create_order transaction for a limit order."""
+        if post_only:
+            tif = SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY
+        else:
+            tif = SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME
+        return TxRequest("create_order", dict(
+            market_index=market.market_id,
+            client_order_index=client_order_index,
+            base_amount=self._to_size_int(size, market),
+            price=self._to_price_int(price, market),
+            is_ask=1 if side == OrderSide.SELL else 0,
+            order_type=SignerClient.ORDER_TYPE_LIMIT,
+            time_in_force=tif,
+            reduce_only=False,
+        ))
+
+    def _limit_order_from_response(
+        self, market: Market, side: OrderSide, price: Decimal, size: Decimal, resp, client_order_index: int = 0
+    ) -> Optional[Order]:
+        """Order for an accepted limit order transaction (None without a tx hash)."""
+        if not (resp and resp.tx_hash):
+            return None
+        self._connection_monitor.record_success()
+        # Use order_index as id for cancellation if available, otherwise tx_hash
+        order_id = str(resp.order_index) if hasattr(resp, 'order_index') and resp.order_index else resp.tx_hash
+        return Order(
+            id=order_id,
+            market_id=market.market_id,
+            side=side,
+            price=price,
+            size=size,
+            status=OrderStatus.PENDING,
+            order_type=OrderType.LIMIT,
+            tx_hash=resp.tx_hash,
+            client_order_index=client_order_index or None,
+            created_at=datetime.now(),
+            filled_size=Decimal("0"),
+        )
+
     async def place_market_order(
         self,
         symbol: str,
@@ -657,14 +1115,17 @@ class LighterClient:
 
             price_int = self._to_price_int(avg_price, market)
 
-            tx, resp, error = await self.signer_client.create_market_order(
+            tx, resp, error = await self._signing.submit(TxRequest("create_order", dict(
                 market_index=market.market_id,
                 client_order_index=0,
                 base_amount=size_int,
-                avg_execution_price=price_int,
+                price=price_int,
                 is_ask=is_ask,
+                order_type=SignerClient.ORDER_TYPE_MARKET,
+                time_in_force=SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL,
                 reduce_only=False,
-            )
+                order_expiry=SignerClient.DEFAULT_IOC_EXPIRY,
+            )))
 
             if error:
                 if is_transient_error(Exception(str(error))):
@@ -771,22 +1232,207 @@ class LighterClient:
                     return False
                 market_id = order.market_id
 
-            tx, resp, error = await self.signer_client.cancel_order(
-                market_index=market_id,
-                order_index=order_index,
+            tx, resp, error = await self._signing.submit(
+                TxRequest("cancel_order", dict(market_index=market_id, order_index=order_index))
             )
 
             if error:
                 log.error(f"Failed to cancel order: {error}")
                 return False
 
-            log.info(f"Cancelled order {order_id}")
+            log.info("Cancelled order %s", order_id, extra={"order_id": order_id, "market": market_id})
             return True
 
         except Exception as e:
             log.error(f"Failed to cancel order: {e}")
             return False
 
+    @staticmethod
+    def is_order_index(order_id: str) -> bool:
+        """Whether an order id is the exchange's order index.
+
+        Orders from get_active_orders carry their (int64) order index; a
+        placement that did not report one carries its tx hash (64 hex digits)
+        instead, which cancel_order and modify_order cannot use.
+        """
+        return order_id.isdigit() and len(order_id) <= 19
+
+    async def modify_order(
+        self,
+        order: Order,
+        price: Decimal,
+        size: Optional[Decimal] = None,
+        trigger_price: Optional[Decimal] = None,
+    ) -> Optional[Order]:
+        """Move an open order to a new price (and optionally size or trigger price).
+
+        Uses the exchange's native modify transaction: one signed transaction,
+        the order keeps its order index, and it never leaves the book. If the
+        order's exchange index is unknown (order.id is a tx hash) or the
+        exchange rejects the modify, the order is replaced by cancel + place
+        instead, arranged so the caller sees either the new order or the old
+        one untouched:
+
+        - trigger orders (stop-loss) place the replacement first and then
+          cancel the old one, so a position is never left without its stop
+        - limit orders cancel first (the old order may be holding the funds)
+          and put the old order back if the replacement cannot be placed;
+          both are placed at most once (see _place_replacement)
+
+        Args:
+            order: The open order to move
+            price: New price (for a stop-loss, the trigger price unless given)
+            size: New size (default: unchanged)
+            trigger_price: New trigger price for a stop-loss (default: price)
+
+        Returns:
+            The modified (or replacement) order, or None if the order was left as it was
+        """
+        if not self.signer_client:
+            log.error("Signer client not initialized")
+            return None
+
+        market = self.get_market_by_id(order.market_id)
+        if not market:
+            log.error(f"Market not found: {order.market_id}")
+            return None
+
+        size = order.size if size is None else size
+        is_trigger = order.order_type == OrderType.STOP_LOSS
+        if is_trigger and trigger_price is None:
+            trigger_price = price
+
+        start = time.monotonic()
+        modified = None
+        if self.is_order_index(order.id):
+            async def _modify():
+                tx, resp, error = await self._signing.submit(TxRequest("modify_order", dict(
+                    market_index=market.market_id,
+                    order_index=int(order.id),
+                    base_amount=self._to_size_int(size, market),
+                    price=self._to_price_int(price, market),
+                    trigger_price=self._to_price_int(trigger_price, market) if is_trigger else 0,
+                )))
+                if error:
+                    if is_transient_error(Exception(str(error))):
+                        raise ConnectionError(f"Transient error: {error}")
+                    log.warning(f"Exchange rejected modify of order {order.id}: {error}")
+                    return None
+                return resp
+
+            resp, error = await retry_async(
+                _modify, config=RETRY_FAST, operation_name=f"modify order {order.id} -> {price}",
+            )
+            if resp is not None and resp.tx_hash:
+                self._connection_monitor.record_success()
+                modified = dataclasses.replace(
+                    order, price=trigger_price if is_trigger else price, size=size, tx_hash=resp.tx_hash,
+                )
+
+        if modified is None:
+            modified = await self._replace_order(order, market, price, size, trigger_price)
+            if modified is None:
+                return None
+
+        latency_ms = (time.monotonic() - start) * 1000
+        log.info(
+            "Modified order %s: %s @ %s -> %s @ %s (market=%s, id=%s, %.0fms)",
+            order.id, order.size, order.price, modified.size, modified.price, market.symbol, modified.id, latency_ms,
+            extra={
+                "order_id": modified.id,
+                "market": market.symbol,
+                "side": order.side.value,
+                "price": str(modified.price),
+                "size": str(modified.size),
+                "latency_ms": round(latency_ms, 1),
+            },
+        )
+        return modified
+
+    async def _replace_order(
+        self, order: Order, market: Market, price: Decimal, size: Decimal, trigger_price: Optional[Decimal]
+    ) -> Optional[Order]:
+        """Cancel + place fallback for modify_order (see there for the ordering)."""
+        if order.order_type == OrderType.STOP_LOSS:
+            replacement = await self.place_stop_loss_order(
+                market.symbol, market.market_type, order.side, size, trigger_price, reduce_only=True,
+            )
+            if replacement is None:
+                return None
+            if not await self.cancel_order(order.id, market_id=market.market_id):
+                # A stale id fails the cancel too; only a stop still resting is a problem
+                snapshot = await self.get_active_orders_by_market([market.market_id])
+                if market.market_id not in snapshot:
+                    log.warning(f"Replaced stop-loss {order.id} but could not cancel it - two stops may be resting")
+                elif any(o.id == order.id for o in snapshot[market.market_id]):
+                    log.warning(f"Replaced stop-loss {order.id} but could not cancel it - two stops are resting")
+                else:
+                    log.info(f"Replaced stop-loss {order.id}, which was already gone from the exchange")
+            return dataclasses.replace(replacement, grid_level=order.grid_level)
+
+        if not await self.cancel_order(order.id, market_id=market.market_id):
+            return None
+        replacement = await self._place_replacement(order, market, "replace", price, size)
+        if replacement is None:
+            restored = await self._place_replacement(order, market, "restore", order.price,
+                                                     order.size - order.filled_size)
+            if restored is None:
+                log.error(f"CRITICAL: Replacing order {order.id} failed and it could not be restored")
+            else:
+                log.warning(f"Replacing order {order.id} failed - restored it as {restored.id}")
+            return None
+        return dataclasses.replace(replacement, grid_level=order.grid_level)
+
+    # Client order indexes tried per replacement before giving up (each earlier one cancelled on arrival)
+    REPLACEMENT_ATTEMPTS = 4
+
+    async def _place_replacement(
+        self, order: Order, market: Market, purpose: str, price: Decimal, size: Decimal
+    ) -> Optional[Order]:
+        """Place the limit order taking over from a cancelled `order`, at most once.
+
+        Its client order index is derived from the old order, the purpose
+        ("replace" or "restore") and the price, so a retry after a lost
+        response sends the same index. The exchange is asked for those
+        indexes first, and again if the placement reports failure: an order
+        an earlier attempt left there is returned (tracked from scratch, so
+        the caller's fill check picks up its fills) instead of placing a
+        second one.
+
+        Returns:
+            The placed (or earlier) order, or None if it could not be placed
+            or the exchange could not be asked
+        """
+        price_int = self._to_price_int(price, market)
+        indexes = [
+            client_order_index(order.id, purpose, market.market_id, order.side, price_int, generation)
+            for generation in range(self.REPLACEMENT_ATTEMPTS)
+        ]
+        found = await self.get_orders_by_client_index(indexes)
+        if found is None:
+            log.error(f"Cannot {purpose} order {order.id}: earlier attempts could not be checked")
+            return None
+
+        for index in indexes:
+            earlier = found.get(index)
+            if earlier is None:
+                placed = await self.place_limit_order(
+                    market.symbol, market.market_type, order.side, price, size, client_order_index=index,
+                )
+                if placed is not None:
+                    return placed
+                # The response may have been lost after the order got there
+                earlier = ((await self.get_orders_by_client_index([index])) or {}).get(index)
+                if earlier is None or earlier.status == OrderStatus.CANCELLED:
+                    return None
+            if earlier.status != OrderStatus.CANCELLED:
+                log.info(f"Order {earlier.id} from an earlier attempt to {purpose} {order.id} is on the exchange")
+                earlier.status = OrderStatus.PENDING
+                earlier.filled_size = Decimal("0")
+                return earlier
+        log.error(f"Cannot {purpose} order {order.id}: {len(indexes)} earlier attempts were cancelled")
+        return None
+
     async def cancel_all_orders(
         self,
         market_id: Optional[int] = None,
@@ -809,13 +1455,13 @@ class LighterClient:
             # If market_id specified, cancel only orders for that market
             if market_id is not None:
                 active_orders = await self.get_active_orders(market_id=market_id)
+                # One batch: every cancel is signed in parallel before the first send
+                results = await self._signing.submit_many([
+                    TxRequest("cancel_order", dict(market_index=market_id, order_index=int(order.id)))
+                    for order in active_orders
+                ]) if active_orders else []
                 cancelled_count = 0
-                for order in active_orders:
-                    order_index = int(order.id)
-                    tx, resp, error = await self.signer_client.cancel_order(
-                        market_index=market_id,
-                        order_index=order_index,
-                    )
+                for order, (tx, resp, error) in zip(active_orders, results):
                     if error:
                         log.error(f"Failed to cancel order {order.id}: {error}")
                     else:
@@ -828,10 +1474,10 @@ class LighterClient:
             order_count = len(active_orders)
 
             # Cancel all orders across all markets
-            tx, resp, error = await self.signer_client.cancel_all_orders(
+            tx, resp, error = await self._signing.submit(TxRequest("cancel_all_orders", dict(
                 time_in_force=SignerClient.CANCEL_ALL_TIF_IMMEDIATE,
                 timestamp_ms=timestamp_ms,
-            )
+            )))
 
             if error:
                 log.error(f"Failed to cancel all orders: {error}")
@@ -933,7 +1579,7 @@ class LighterClient:
             # (will execute at market when triggered)
             price_int = trigger_price_int
 
-            tx, resp, error = await self.signer_client.create_order(
+            tx, resp, error = await self._signing.submit(TxRequest("create_order", dict(
                 market_index=market.market_id,
                 client_order_index=0,
                 base_amount=size_int,
@@ -943,7 +1589,7 @@ class LighterClient:
                 time_in_force=SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL,
                 reduce_only=reduce_only,
                 trigger_price=trigger_price_int,
-            )
+            )))
 
             if error:
                 log.error(f"Failed to place stop-loss order: {error}")
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from typing import List
 from dotenv import load_dotenv
 
+from lithood.ladder import PriceLadder
+
 load_dotenv()
 
 # Environment
@@ -16,7 +18,47 @@ LIGHTER_API_KEY_PRIVATE = os.getenv("LIGHTER_API_KEY_PRIVATE", "")  # API key (f
 LIGHTER_API_KEY_INDEX = int(os.getenv("LIGHTER_API_KEY_INDEX", "3"))  # API key slot (3-254)
 LIGHTER_ACCOUNT_INDEX = os.getenv("LIGHTER_ACCOUNT_INDEX", "")  # Your account index
 POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "30"))
+FILL_CHECK_INTERVAL_SECONDS = float(os.getenv("FILL_CHECK_INTERVAL_SECONDS", "0.5"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" or "json" (structured)
+
+# Connection health monitor (background pings)
+HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "5"))
+HEALTH_CHECK_TIMEOUT_SECONDS = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "3"))
+HEALTH_DEGRADED_RTT_SECONDS = float(os.getenv("HEALTH_DEGRADED_RTT_SECONDS", "2"))
+
+# On-demand profiling (SIGUSR1/SIGUSR2) - sessions auto-stop after this many seconds
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
+# Prometheus metrics endpoint (port 0 disables it)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
+# Market tape recorder (scripts/record_tape.py, or run_infinite_grid.py --record)
+TAPE_DIR = os.getenv("TAPE_DIR", "data/tape")
+TAPE_BOOK_INTERVAL_SECONDS = float(os.getenv("TAPE_BOOK_INTERVAL_SECONDS", "1"))
+TAPE_DEPTH_INTERVAL_SECONDS = float(os.getenv("TAPE_DEPTH_INTERVAL_SECONDS", "10"))
+TAPE_DEPTH_LEVELS = int(os.getenv("TAPE_DEPTH_LEVELS", "20"))
+TAPE_TRADES_INTERVAL_SECONDS = float(os.getenv("TAPE_TRADES_INTERVAL_SECONDS", "2"))
+TAPE_FUNDING_INTERVAL_SECONDS = float(os.getenv("TAPE_FUNDING_INTERVAL_SECONDS", "300"))
+
+# Multi-account coordinator (scripts/run_coordinator.py)
+COORDINATOR_SOCKET = os.getenv("COORDINATOR_SOCKET", "coordinator.sock")  # Local control socket
+COORDINATOR_REPORT_INTERVAL_SECONDS = float(os.getenv("COORDINATOR_REPORT_INTERVAL_SECONDS", "5"))
+COORDINATOR_STALE_SECONDS = float(os.getenv("COORDINATOR_STALE_SECONDS", "30"))
+
+# Transaction signing threads (signing runs off the event loop)
+SIGNER_THREADS = int(os.getenv("SIGNER_THREADS", "2"))
+
+# Transaction pipelining per API key (nonces assigned locally)
+TX_BATCH_SIZE = int(os.getenv("TX_BATCH_SIZE", "25"))  # Most transactions per sendTxBatch round trip
+TX_MAX_REPLAYS = int(os.getenv("TX_MAX_REPLAYS", "3"))  # Replays of a nonce-rejected transaction
+
+# Shared HTTP connection pool (reads and order submission)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60"))
+HTTP_DNS_TTL_SECONDS = int(os.getenv("HTTP_DNS_TTL_SECONDS", "300"))
+HTTP_WARMUP_CONNECTIONS = int(os.getenv("HTTP_WARMUP_CONNECTIONS", "2"))
 
 # Proxy Configuration
 PROXY_HOST = os.getenv("PROXY_HOST", "")
@@ -39,6 +81,14 @@ if PROXY_URL:
     os.environ["HTTP_PROXY"] = PROXY_URL
     os.environ["HTTPS_PROXY"] = PROXY_URL
 
+# Endpoint failover - extra base URLs and proxies (comma-separated).
+# Every base URL is tried through every proxy; LIGHTER_BASE_URL is the primary.
+LIGHTER_BASE_URLS = [
+    url.strip() for url in os.getenv("LIGHTER_BASE_URLS", LIGHTER_BASE_URL).split(",") if url.strip()
+]
+PROXY_URLS = [url.strip() for url in os.getenv("PROXY_URLS", "").split(",") if url.strip()]
+HTTP_HEDGE_READS = os.getenv("HTTP_HEDGE_READS", "false").lower() == "true"
+
 
 @dataclass
 class GridPair:
@@ -75,6 +125,9 @@ GRID_CONFIG = {
     "cycle_spread_pct": Decimal("0.02"),    # 2% spread when cycling (MUST equal level_spacing)
 }
 
+# Grid prices are quantized to this increment (the ladder's tick when the market's is unknown)
+PRICE_QUANTUM = Decimal("0.0001")
+
 
 @dataclass
 class GridLevel:
@@ -85,66 +138,48 @@ class GridLevel:
     side: str  # "buy" or "sell"
 
 
-def generate_grid_levels(entry_price: Decimal) -> tuple[List[GridLevel], List[GridLevel]]:
+def generate_grid_levels(
+    entry_price: Decimal, price_decimals: int = -PRICE_QUANTUM.as_tuple().exponent
+) -> tuple[List[GridLevel], List[GridLevel]]:
     """Generate grid levels with fixed 2% spacing and fixed 400 LIT per order.
 
+    Levels are rungs of a price ladder anchored at entry, so a filled level's
+    counter-order lands exactly on the neighbouring level.
+
+    Args:
+        entry_price: Price the ladder is anchored at
+        price_decimals: Decimal places of a price tick (the market's, as the engine uses)
+
     Returns:
         (buy_levels, sell_levels) - separate lists for each side
     """
     config = GRID_CONFIG
-    spacing = config["level_spacing_pct"]
+    ladder = PriceLadder(entry_price, config["level_spacing_pct"], price_decimals)
     lit_per_order = config["lit_per_order"]
 
-    # Generate buy levels (below entry) - each level is 2% below the previous
-    buy_levels = []
-    for i in range(config["num_buy_levels"]):
-        multiplier = (1 - spacing) ** (i + 1)
-        price = entry_price * multiplier
-
-        buy_levels.append(GridLevel(
-            level_id=i + 1,
-            price=price.quantize(Decimal("0.0001")),
-            size=lit_per_order,  # Fixed 400 LIT
-            side="buy",
-        ))
-
-    # Generate sell levels (above entry) - each level is 2% above the previous
-    sell_levels = []
-    for i in range(config["num_sell_levels"]):
-        multiplier = (1 + spacing) ** (i + 1)
-        price = entry_price * multiplier
-
-        sell_levels.append(GridLevel(
-            level_id=i + 1,
-            price=price.quantize(Decimal("0.0001")),
-            size=lit_per_order,  # Fixed 400 LIT
-            side="sell",
-        ))
-
+    # Buy levels one rung apart below entry, sell levels above
+    buy_levels = [
+        GridLevel(level_id=i, price=ladder.price(-i), size=lit_per_order, side="buy")
+        for i in range(1, config["num_buy_levels"] + 1)
+    ]
+    sell_levels = [
+        GridLevel(level_id=i, price=ladder.price(i), size=lit_per_order, side="sell")
+        for i in range(1, config["num_sell_levels"] + 1)
+    ]
     return buy_levels, sell_levels
 
 
-def generate_full_grid_ladder(entry_price: Decimal, num_levels: int = 25) -> List[Decimal]:
+def generate_full_grid_ladder(
+    entry_price: Decimal, num_levels: int = 25, price_decimals: int = -PRICE_QUANTUM.as_tuple().exponent
+) -> List[Decimal]:
     """Generate a continuous price ladder for snapping.
 
     Creates levels both above and below entry, centered on entry price.
     This ensures counter-orders can always snap to a valid grid level,
     even if they fall in the "dead zone" between initial buys and sells.
     """
-    spacing = GRID_CONFIG["level_spacing_pct"]
-    ladder = [entry_price.quantize(Decimal("0.0001"))]
-
-    # Generate levels below entry
-    for i in range(1, num_levels + 1):
-        price = entry_price * ((1 - spacing) ** i)
-        ladder.append(price.quantize(Decimal("0.0001")))
-
-    # Generate levels above entry
-    for i in range(1, num_levels + 1):
-        price = entry_price * ((1 + spacing) ** i)
-        ladder.append(price.quantize(Decimal("0.0001")))
-
-    return sorted(ladder)
+    ladder = PriceLadder(entry_price, GRID_CONFIG["level_spacing_pct"], price_decimals, span=num_levels)
+    return [ladder.price(i) for i in range(-num_levels, num_levels + 1)]
 
 
 # Legacy function for backward compatibility
@@ -0,0 +1,584 @@
+# lithood/coordinator.py
+"""Multi-account coordinator: one worker process per account, with a global floor and kill switch."""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+from lithood.client import LighterClient
+from lithood.config import (
+    COORDINATOR_REPORT_INTERVAL_SECONDS,
+    COORDINATOR_STALE_SECONDS,
+    FLOOR_CONFIG,
+    SPOT_SYMBOL,
+)
+from lithood.floor import FloorProtection
+from lithood.instrumentation import metrics
+from lithood.logger import log
+from lithood.multi_grid import GridSpec, MultiGridHost
+from lithood.retry import RetryConfig, calculate_delay
+from lithood.state import StateManager
+from lithood.supervisor import SupervisedTask, Supervisor
+from lithood.types import MarketType
+
+# Delay before restarting a worker process that exited unexpectedly
+WORKER_RESTART_BACKOFF = RetryConfig(max_retries=0, initial_delay=5.0, max_delay=300.0)
+
+# Commands accepted from the control socket
+CONTROL_COMMANDS = ("status", "halt", "liquidate", "stop")
+
+
+@dataclass
+class AccountSlot:
+    """One account/API-key slot, run by its own worker process."""
+    name: str
+    account_index: int
+    api_key_index: int
+    api_key_env: str  # Environment variable holding the API key private key
+    grids: list[GridSpec]
+    state_db: str
+    offline: bool = False  # Trade against an in-process FakeExchange (testing)
+
+
+def load_slots(path: str) -> list[AccountSlot]:
+    """Load account slots from a JSON file.
+
+    Format::
+
+        {"accounts": [
+            {"name": "main", "account_index": 281474976710654, "api_key_index": 3,
+             "api_key_env": "LIGHTER_API_KEY_PRIVATE", "grids": ["LIT/USDC:spot:350:15"],
+             "state_db": "state_main.db"}
+        ]}
+
+    ``api_key_env`` names an environment variable, so keys stay out of the
+    file. ``state_db`` defaults to ``state_<name>.db`` next to the file.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Account slots in file order
+    """
+    with open(path) as f:
+        data = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    slots = []
+    for entry in data["accounts"]:
+        name = entry["name"]
+        slots.append(AccountSlot(
+            name=name,
+            account_index=int(entry["account_index"]),
+            api_key_index=int(entry.get("api_key_index", 3)),
+            api_key_env=entry.get("api_key_env", "LIGHTER_API_KEY_PRIVATE"),
+            grids=[GridSpec.parse(g) for g in entry.get("grids", [f"{SPOT_SYMBOL}:spot:350:15"])],
+            state_db=os.path.join(base, entry.get("state_db", f"state_{name}.db")),
+            offline=bool(entry.get("offline", False)),
+        ))
+
+    for attr in ("name", "account_index", "state_db"):
+        values = [getattr(slot, attr) for slot in slots]
+        if len(set(values)) != len(values):
+            raise ValueError(f"Duplicate {attr} in {path}")
+    keys = [(slot.account_index, slot.api_key_index) for slot in slots]
+    if len(set(keys)) != len(keys):
+        raise ValueError(f"Duplicate account/API-key slot in {path}")
+    return slots
+
+
+def _watch_pipe(conn, on_message, on_eof):
+    """Deliver messages from a multiprocessing Connection on the running loop."""
+    loop = asyncio.get_running_loop()
+    fd = conn.fileno()
+
+    def _readable():
+        try:
+            while conn.poll():
+                on_message(conn.recv())
+        except (EOFError, OSError):
+            loop.remove_reader(fd)
+            on_eof()
+
+    loop.add_reader(fd, _readable)
+
+
+# -----------------------------------------------------------------------------
+# Worker process
+# -----------------------------------------------------------------------------
+
+def worker_main(slot: AccountSlot, conn, report_interval: float):
+    """Worker process entry point (spawned by the Coordinator)."""
+    # Ctrl+C reaches the whole process group; the coordinator decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(AccountWorker(slot, conn, report_interval).run())
+
+
+class AccountWorker:
+    """Runs one account's grids and answers the coordinator.
+
+    Each worker has its own LighterClient (signer, connection pool, auth
+    token) and state database, so signing and order flow for different
+    accounts never share a GIL or event loop. The worker does not apply
+    the floor itself: it reports its portfolio value and the coordinator
+    decides on the sum across accounts.
+    """
+
+    def __init__(self, slot: AccountSlot, conn, report_interval: float):
+        self.slot = slot
+        self.conn = conn
+        self.report_interval = report_interval
+        self.client: Optional[LighterClient] = None
+        self.state: Optional[StateManager] = None
+        self.host: Optional[MultiGridHost] = None
+        self.floor: Optional[FloorProtection] = None
+        self._trading: Optional[Supervisor] = None
+        self._monitor = Supervisor()
+        self._done = asyncio.Event()
+        self._halt_lock = asyncio.Lock()
+
+    def _send(self, message: dict):
+        try:
+            self.conn.send({"account": self.slot.name, **message})
+        except (BrokenPipeError, OSError):
+            # Coordinator is gone - nothing left to report to
+            self._done.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, self._done.set)
+        _watch_pipe(self.conn, self._on_command, self._done.set)
+        try:
+            await self._start()
+            await self._done.wait()
+        except Exception as e:
+            log.error(f"[{self.slot.name}] Worker failed: {e}")
+            self._send({"type": "error", "error": str(e)})
+        finally:
+            await self._shutdown()
+
+    async def _start(self):
+        slot = self.slot
+        api_key = os.getenv(slot.api_key_env, "")
+        if not api_key and not slot.offline:
+            raise RuntimeError(f"{slot.api_key_env} is not set")
+
+        self.client = LighterClient(
+            api_key_private=api_key, api_key_index=slot.api_key_index, account_index=slot.account_index,
+        )
+        if slot.offline:
+            from lithood.fake_exchange import FakeExchange
+            await self.client.connect_offline(FakeExchange(account_index=slot.account_index))
+        else:
+            await self.client.connect()
+            self.client.start_health_monitor()
+
+        self.state = StateManager(db_path=slot.state_db)
+        self.host = MultiGridHost(self.client, self.state, slot.grids)
+        self.floor = FloorProtection(self.client, self.state, grid=self.host)
+
+        self._monitor.add(SupervisedTask(
+            "report", self._report, interval=self.report_interval, priority=3, timeout=30,
+        ))
+        if self.state.get("bot_halted", False):
+            log.warning(f"[{slot.name}] bot_halted is set in {slot.state_db} - not trading")
+        else:
+            if not await self.host.initialize():
+                raise RuntimeError("Grid initialization failed")
+            self._trading = Supervisor()
+            for task in self.host.supervised_tasks():
+                self._trading.add(task)
+            self._trading.start()
+        self._monitor.start()
+        self._send({"type": "ready", "pid": os.getpid()})
+        log.info(f"[{slot.name}] Worker ready: account {slot.account_index}, "
+                 f"{', '.join(spec.key for spec in slot.grids)}")
+
+    def _on_command(self, message: dict):
+        command = message.get("cmd")
+        if command == "stop":
+            self._done.set()
+        elif command in ("halt", "liquidate"):
+            asyncio.create_task(self._halt(liquidate=command == "liquidate", reason=message.get("reason", "")))
+        else:
+            log.warning(f"[{self.slot.name}] Unknown coordinator command: {message}")
+
+    async def _spot_price(self) -> Optional[Decimal]:
+        price = self.host.prices.get(f"{SPOT_SYMBOL}_{MarketType.SPOT.value}") if self.host else None
+        if price is None and self.client is not None:
+            price = await self.client.get_mid_price(SPOT_SYMBOL, MarketType.SPOT)
+        return price
+
+    async def _halt(self, liquidate: bool, reason: str):
+        """Stop trading and cancel every order; optionally sell all LIT."""
+        async with self._halt_lock:
+            if self.state is None:
+                return
+            log.error(f"[{self.slot.name}] {'Liquidating' if liquidate else 'Halting'}: {reason}")
+            if self._trading is not None:
+                await self._trading.stop()
+                self._trading = None
+            price = await self._spot_price() if liquidate else None
+            if price is not None:
+                # Cancels everything, sells all LIT and sets bot_halted
+                await self.floor.force_exit(price)
+            else:
+                if liquidate:
+                    log.error(f"[{self.slot.name}] CRITICAL: no price for emergency exit - cancelling orders only")
+                if not await self.host.cancel_all():
+                    log.warning(f"[{self.slot.name}] Grid cancel_all failed during halt")
+                await self.client.cancel_all_orders()
+                self.state.set("bot_halted", True)
+            self._send({"type": "halted", "liquidated": liquidate})
+
+    async def _report(self):
+        price = await self._spot_price()
+        value = await self.floor.portfolio_value(price) if price is not None else None
+        self._send({
+            "type": "report",
+            "price": price,
+            "value": value,
+            "halted": bool(self.state.get("bot_halted", False)),
+            "grids": self.host.get_stats(),
+            "counters": dict(metrics.counters),
+        })
+
+    async def _shutdown(self):
+        try:
+            if self._trading is not None:
+                await self._trading.stop()
+            await self._monitor.stop()
+            if self.client is not None:
+                await self.client.close()
+        except Exception as e:
+            log.warning(f"[{self.slot.name}] Error during worker shutdown: {e}")
+        finally:
+            if self.state is not None:
+                self.state.close()
+        self._send({"type": "stopped"})
+        log.info(f"[{self.slot.name}] Worker stopped")
+
+
+# -----------------------------------------------------------------------------
+# Coordinator
+# -----------------------------------------------------------------------------
+
+@dataclass
+class WorkerHandle:
+    """Coordinator-side view of one worker process."""
+    slot: AccountSlot
+    process: Optional[multiprocessing.Process] = None
+    conn: Optional[object] = None
+    ready: bool = False
+    report: dict = field(default_factory=dict)
+    reported_at: float = 0.0
+    restarts: int = 0
+    crashes_in_row: int = 0
+    restart_at: float = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class Coordinator:
+    """Starts one worker process per account slot and applies the floor globally.
+
+    Workers report their portfolio value, grid stats and counters every
+    report interval over a pipe. The coordinator sums the values and, if
+    the total reaches FLOOR_CONFIG's emergency_buffer, tells every worker
+    to run its emergency exit. The sum is only trusted when every worker
+    has reported within ``stale_after`` seconds; a missing account would
+    otherwise look like a loss and trip the floor.
+
+    A local Unix socket accepts one command per connection (``status``,
+    ``halt``, ``liquidate``, ``stop``) as the global kill switch. Workers
+    that exit unexpectedly are restarted with backoff; after a halt they
+    come back halted (the flag is in their state DB) and the halt command
+    is re-sent once they are ready.
+    """
+
+    def __init__(
+        self,
+        slots: list[AccountSlot],
+        socket_path: Optional[str] = None,
+        floor_config: dict = FLOOR_CONFIG,
+        report_interval: float = COORDINATOR_REPORT_INTERVAL_SECONDS,
+        stale_after: float = COORDINATOR_STALE_SECONDS,
+    ):
+        """Initialize the coordinator.
+
+        Args:
+            slots: Accounts to run, one worker process each
+            socket_path: Control socket path (None disables the kill switch socket)
+            floor_config: floor_value and emergency_buffer, applied to the total
+            report_interval: Seconds between worker reports
+            stale_after: Seconds after which a worker's last report is not trusted
+        """
+        self.workers = {slot.name: WorkerHandle(slot) for slot in slots}
+        self.socket_path = socket_path
+        self.floor_config = floor_config
+        self.report_interval = report_interval
+        self.stale_after = stale_after
+        self.halted: Optional[str] = None  # "halt" or "liquidate" once the kill switch fired
+        self.total_value: Optional[Decimal] = None
+        self._context = multiprocessing.get_context("spawn")
+        self._supervisor = Supervisor()
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._stopping = asyncio.Event()
+
+    # --- Worker processes ----------------------------------------------------
+
+    def _spawn(self, handle: WorkerHandle):
+        # A restart replaces the crashed worker's pipe
+        self._close_conn(handle)
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=worker_main, args=(handle.slot, child, self.report_interval),
+            name=f"lithood-{handle.slot.name}", daemon=False,
+        )
+        process.start()
+        child.close()
+        handle.process, handle.conn, handle.ready = process, parent, False
+        _watch_pipe(parent, lambda message: self._on_message(handle, message), lambda: None)
+        log.info(f"Started worker {handle.slot.name} (pid {process.pid})")
+
+    @staticmethod
+    def _close_conn(handle: WorkerHandle):
+        """Stop watching and close a worker's pipe."""
+        if handle.conn is None:
+            return
+        if not handle.conn.closed:
+            asyncio.get_running_loop().remove_reader(handle.conn.fileno())
+            handle.conn.close()
+        handle.conn = None
+
+    def _send(self, handle: WorkerHandle, message: dict) -> bool:
+        if handle.conn is None or not handle.alive:
+            return False
+        try:
+            handle.conn.send(message)
+            return True
+        except (BrokenPipeError, OSError):
+            return False
+
+    def _on_message(self, handle: WorkerHandle, message: dict):
+        kind = message.get("type")
+        if kind == "ready":
+            handle.ready = True
+            handle.crashes_in_row = 0
+            if self.halted:
+                self._send(handle, {"cmd": self.halted, "reason": "coordinator halted"})
+        elif kind == "report":
+            handle.report = message
+            handle.reported_at = time.monotonic()
+        elif kind == "halted":
+            log.warning(f"Worker {handle.slot.name} halted (liquidated: {message['liquidated']})")
+        elif kind == "error":
+            log.error(f"Worker {handle.slot.name} failed: {message['error']}")
+
+    async def _check_workers(self):
+        """Restart workers that exited on their own."""
+        now = time.monotonic()
+        for handle in self.workers.values():
+            if handle.alive or self._stopping.is_set():
+                continue
+            if handle.restart_at == 0.0:
+                delay = calculate_delay(handle.crashes_in_row, WORKER_RESTART_BACKOFF)
+                handle.crashes_in_row += 1
+                handle.restart_at = now + delay
+                code = handle.process.exitcode if handle.process else None
+                log.error(f"Worker {handle.slot.name} exited (code {code}) - restarting in {delay:.0f}s")
+            elif now >= handle.restart_at:
+                handle.restart_at = 0.0
+                handle.restarts += 1
+                self._spawn(handle)
+
+    # --- Global floor ----------------------------------------------------------
+
+    async def _check_floor(self):
+        now = time.monotonic()
+        values, stale = [], []
+        for name, handle in self.workers.items():
+            value = handle.report.get("value")
+            if value is None or now - handle.reported_at > self.stale_after:
+                stale.append(name)
+            else:
+                values.append(value)
+        if stale:
+            self.total_value = None
+            log.warning(f"Global floor not evaluated - no recent value from {', '.join(stale)}")
+            return
+
+        self.total_value = sum(values, Decimal("0"))
+        log.debug("Global floor check: total=$%.2f", self.total_value)
+        if self.total_value <= self.floor_config["emergency_buffer"] and self.halted != "liquidate":
+            self.liquidate(f"total portfolio ${self.total_value:,.2f} <= "
+                           f"${self.floor_config['emergency_buffer']:,.2f}")
+
+    # --- Kill switch ------------------------------------------------------------
+
+    def halt(self, reason: str):
+        """Stop trading and cancel every order on every account."""
+        if self.halted:
+            return
+        self._broadcast("halt", reason)
+
+    def liquidate(self, reason: str):
+        """Emergency exit on every account (cancel everything, sell all LIT)."""
+        if self.halted == "liquidate":
+            return
+        self._broadcast("liquidate", reason)
+
+    def _broadcast(self, command: str, reason: str):
+        log.error("=" * 50)
+        log.error(f"GLOBAL {command.upper()}: {reason}")
+        log.error("=" * 50)
+        self.halted = command
+        for handle in self.workers.values():
+            if not self._send(handle, {"cmd": command, "reason": reason}):
+                log.warning(f"Worker {handle.slot.name} not reachable - will {command} once it restarts")
+
+    async def _handle_control(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=5)
+            command = line.decode().strip().lower()
+            if command not in CONTROL_COMMANDS:
+                reply = {"ok": False, "error": f"unknown command {command!r}, expected one of {CONTROL_COMMANDS}"}
+            else:
+                if command == "halt":
+                    self.halt("control socket")
+                elif command == "liquidate":
+                    self.liquidate("control socket")
+                elif command == "stop":
+                    self._stopping.set()
+                reply = {"ok": True, **self.get_stats()}
+            writer.write((json.dumps(reply, default=str) + "\n").encode())
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    # --- Lifecycle ----------------------------------------------------------------
+
+    async def start(self):
+        """Start workers, the control socket and the periodic checks."""
+        for handle in self.workers.values():
+            self._spawn(handle)
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = await asyncio.start_unix_server(self._handle_control, self.socket_path)
+            log.info(f"Control socket listening on {self.socket_path}")
+        self._supervisor.add(SupervisedTask("floor", self._check_floor, interval=self.report_interval, priority=0))
+        self._supervisor.add(SupervisedTask("workers", self._check_workers, interval=1.0, priority=1))
+        self._supervisor.start()
+
+    async def wait(self):
+        """Block until stop() or a ``stop`` control command."""
+        await self._stopping.wait()
+
+    def request_stop(self):
+        """Make wait() return (safe to call from a signal handler)."""
+        self._stopping.set()
+
+    async def stop(self, timeout: float = 60.0):
+        """Ask every worker to stop, then wait for them (terminating stragglers)."""
+        self._stopping.set()
+        await self._supervisor.stop()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        for handle in self.workers.values():
+            self._send(handle, {"cmd": "stop"})
+        deadline = time.monotonic() + timeout
+        while any(h.alive for h in self.workers.values()) and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+        for handle in self.workers.values():
+            if handle.alive:
+                log.warning(f"Worker {handle.slot.name} did not stop in {timeout:.0f}s - terminating")
+                handle.process.terminate()
+                handle.process.join(5)
+            self._close_conn(handle)
+
+    # --- Reporting ------------------------------------------------------------------
+
+    def get_stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "halted": self.halted,
+            "total_value": self.total_value,
+            "floor_value": self.floor_config["floor_value"],
+            "emergency_buffer": self.floor_config["emergency_buffer"],
+            "accounts": {
+                name: {
+                    "pid": h.process.pid if h.process else None,
+                    "alive": h.alive,
+                    "ready": h.ready,
+                    "restarts": h.restarts,
+                    "value": h.report.get("value"),
+                    "halted": h.report.get("halted"),
+                    "report_age": round(now - h.reported_at, 1) if h.reported_at else None,
+                    "grids": h.report.get("grids", {}),
+                }
+                for name, h in self.workers.items()
+            },
+        }
+
+    def collect_metrics(self):
+        """Per-account metric families from the workers' last reports."""
+        reports = [(name, h.report) for name, h in self.workers.items() if h.report]
+
+        def per_grid(stat: str):
+            return [
+                ({"account": name, "market": key}, stats[stat])
+                for name, report in reports for key, stats in report["grids"].items()
+            ]
+
+        counters: dict[str, list] = {}
+        for name, report in reports:
+            for counter, value in report["counters"].items():
+                counters.setdefault(counter, []).append(({"account": name}, value))
+
+        families = [
+            ("lithood_worker_up", "gauge", "Worker process alive",
+             [({"account": name}, int(h.alive)) for name, h in self.workers.items()]),
+            ("lithood_worker_restarts", "counter", "Worker process restarts",
+             [({"account": name}, h.restarts) for name, h in self.workers.items()]),
+            ("lithood_portfolio_value_usdc", "gauge", "Portfolio value by account",
+             [({"account": name}, r["value"]) for name, r in reports if r.get("value") is not None]),
+            ("lithood_portfolio_total_value_usdc", "gauge", "Portfolio value across all accounts",
+             [({}, self.total_value)] if self.total_value is not None else []),
+            ("lithood_halted", "gauge", "Global kill switch fired", [({}, int(self.halted is not None))]),
+            ("lithood_grid_fills_total", "counter", "Grid order fills",
+             [({"account": name, "market": key, "side": side}, stats[f"{side}_fills"])
+              for name, report in reports for key, stats in report["grids"].items() for side in ("buy", "sell")]),
+            ("lithood_grid_cycles_total", "counter", "Completed buy/sell cycles", per_grid("cycles")),
+            ("lithood_grid_realized_profit_usdc", "gauge", "Approximate realized profit", per_grid("profit")),
+            ("lithood_grid_recenters_total", "counter", "Grid recenters", per_grid("recenters")),
+        ]
+        for counter, samples in sorted(counters.items()):
+            families.append((f"lithood_worker_{counter}_total", "counter", f"Worker counter {counter}", samples))
+        return families
+
+
+async def send_command(socket_path: str, command: str, timeout: float = 10.0) -> dict:
+    """Send one control command to a running coordinator and return its reply."""
+    reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(socket_path), timeout=timeout)
+    try:
+        writer.write(f"{command}\n".encode())
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+        return json.loads(line)
+    finally:
+        writer.close()
@@ -0,0 +1,973 @@
+# lithood/fake_exchange.py
+"""In-process simulated Lighter exchange for offline testing and benchmarking."""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from types import SimpleNamespace
+from typing import Optional, Union
+
+from lighter import SignerClient
+from lighter.exceptions import ApiException, BadRequestException
+from lighter.nonce_manager import OptimisticNonceManager
+
+from lithood.config import SPOT_SYMBOL, PERP_SYMBOL
+from lithood.instrumentation import metrics
+from lithood.logger import log
+
+# Order type codes (same values the SDK signs) -> type strings the API reports
+_ORDER_TYPE_NAMES = {
+    SignerClient.ORDER_TYPE_LIMIT: "limit",
+    SignerClient.ORDER_TYPE_STOP_LOSS: "stop_loss",
+    SignerClient.ORDER_TYPE_TAKE_PROFIT: "take_profit",
+}
+
+# Transaction types the native signer reports for each signed transaction
+_TX_TYPES = {
+    "create_order": 14,
+    "cancel_order": 15,
+    "cancel_all_orders": 16,
+    "modify_order": 17,
+}
+
+# API key slot the fake signer's nonce manager hands out
+_FAKE_API_KEY_INDEX = 3
+
+_API_ERROR_REASONS = {
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+@dataclass
+class FakeMarket:
+    """Market definition and external quote for the simulated exchange."""
+    symbol: str
+    market_id: int
+    is_spot: bool
+    base_asset_id: int
+    quote_asset_id: int
+    price: Decimal
+    size_decimals: int = 2
+    price_decimals: int = 4
+    min_base_amount: Decimal = Decimal("1")
+    min_quote_amount: Decimal = Decimal("1")
+    maker_fee: Decimal = Decimal("0")
+    taker_fee: Decimal = Decimal("0")
+    funding_rate: Decimal = Decimal("0")
+
+    def to_price(self, price_int: int) -> Decimal:
+        return Decimal(price_int).scaleb(-self.price_decimals)
+
+    def to_size(self, size_int: int) -> Decimal:
+        return Decimal(size_int).scaleb(-self.size_decimals)
+
+    def to_price_int(self, price: Decimal, rounding=ROUND_FLOOR) -> int:
+        return int(price.scaleb(self.price_decimals).to_integral_value(rounding=rounding))
+
+
+@dataclass
+class FakeOrder:
+    """An order resting on the simulated exchange (prices and sizes in API integer units)."""
+    order_index: int
+    client_order_index: int
+    market_id: int
+    is_ask: bool
+    price: int
+    size: int
+    order_type: int
+    time_in_force: int
+    reduce_only: bool
+    trigger_price: int
+    created_at: int  # ms
+    seq: int
+    filled: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.size - self.filled
+
+    @property
+    def is_trigger(self) -> bool:
+        return self.order_type != SignerClient.ORDER_TYPE_LIMIT
+
+
+@dataclass
+class FakeFill:
+    """One execution against the simulated exchange."""
+    order_index: int
+    market_id: int
+    is_ask: bool
+    price: Decimal
+    size: Decimal
+    fee: Decimal
+    maker: bool
+    timestamp: float
+
+
+@dataclass
+class _Position:
+    size: Decimal = Decimal("0")  # signed, negative = short
+    entry: Decimal = Decimal("0")
+
+
+class FakeExchange:
+    """Simulated Lighter exchange implementing the SDK surface LighterClient uses.
+
+    External liquidity is modelled as a quote around ``price`` (moved with
+    set_price). Resting orders match in price-time priority when the price
+    trades through them, optionally limited by the volume traded. Spot fills
+    move asset balances (quote locked for buys, base for sells); perp fills
+    move positions, with realized PnL and fees settled into collateral.
+
+    Like the real API, order transactions only fail on validation: an order
+    that cannot rest (post-only cross, insufficient balance, slippage) is
+    accepted and then cancelled, and recorded in ``rejects``.
+    Transport faults are injected per call via latency, jitter, error_rate,
+    rate_limit_rate and fail_next(), drawn from a seeded RNG so runs replay.
+    """
+
+    def __init__(
+        self,
+        markets: Optional[list[FakeMarket]] = None,
+        balances: Optional[dict[int, Decimal]] = None,
+        collateral: Decimal = Decimal("10000"),
+        account_index: int = 1,
+        spread_pct: Decimal = Decimal("0.001"),
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+        return_order_index: bool = False,
+        sign_seconds: float = 0.0,
+    ):
+        """Initialize the exchange.
+
+        Args:
+            markets: Markets to list (defaults to LIT/USDC spot and LIT perp at $1)
+            balances: Spot balances by asset id (defaults to 10k USDC and 10k LIT)
+            collateral: Perp collateral in USDC
+            account_index: Account index reported to the client
+            spread_pct: Width of the external quote around the price (0 = locked at the price)
+            latency: Seconds added to every API call
+            jitter: Extra uniformly random seconds (0..jitter) per call
+            error_rate: Probability of a 503 per call
+            rate_limit_rate: Probability of a 429 per call
+            seed: RNG seed for jitter and fault injection
+            return_order_index: Include order_index in send-tx responses (the
+                live API only returns tx_hash)
+            sign_seconds: Time each sign_* call takes on the calling thread,
+                modelling the native signer (which runs without the GIL)
+        """
+        if markets is None:
+            markets = [
+                FakeMarket(symbol=SPOT_SYMBOL, market_id=2048, is_spot=True,
+                           base_asset_id=2, quote_asset_id=3, price=Decimal("1")),
+                FakeMarket(symbol=PERP_SYMBOL, market_id=120, is_spot=False,
+                           base_asset_id=2, quote_asset_id=3, price=Decimal("1")),
+            ]
+        self.markets: dict[int, FakeMarket] = {m.market_id: m for m in markets}
+        if balances is None:
+            balances = {3: Decimal("10000"), 2: Decimal("10000")}
+
+        self.account_index = account_index
+        self.spread_pct = spread_pct
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.return_order_index = return_order_index
+        self.sign_seconds = sign_seconds
+
+        self.collateral = collateral
+        self._balances: dict[int, Decimal] = dict(balances)
+        self._locked: dict[int, Decimal] = {asset_id: Decimal("0") for asset_id in balances}
+        self._positions: dict[int, _Position] = {}
+        self._orders: dict[int, FakeOrder] = {}
+        self._client_orders: dict[int, FakeOrder] = {}  # client_order_index -> order, kept after it closes
+
+        self._rng = random.Random(seed)
+        self._forced_failures: deque[int] = deque()
+        self._order_ids = itertools.count(1)
+        self._seq = itertools.count(1)
+        self._tx_ids = itertools.count(1)
+        self._nonces: dict[int, int] = {}  # next nonce expected per API key
+
+        # Observability for tests and benchmarks
+        self.calls: Counter = Counter()
+        self.fills: list[FakeFill] = []
+        self.rejects: list[tuple[int, str]] = []  # (order_index, reason)
+
+        # SDK-shaped API objects
+        self.api_client = _FakeApiClient()
+        self.order_api = _FakeOrderApi(self)
+        self.account_api = _FakeAccountApi(self)
+        self.funding_api = _FakeFundingApi(self)
+        self.root_api = _FakeRootApi(self)
+        self.signer_client = _FakeSignerClient(self)
+
+    # -------------------------------------------------------------------------
+    # Market control
+    # -------------------------------------------------------------------------
+
+    def market(self, market: Union[int, str]) -> FakeMarket:
+        """Look up a market by id or symbol."""
+        if isinstance(market, int):
+            return self.markets[market]
+        for m in self.markets.values():
+            if m.symbol == market:
+                return m
+        raise KeyError(f"Unknown market: {market}")
+
+    def quote(self, market: FakeMarket) -> tuple[int, int]:
+        """External best bid and ask in price units.
+
+        A zero spread gives a locked book at the price (so the mid equals
+        it exactly); otherwise bid and ask are at least one tick apart.
+        """
+        if not self.spread_pct:
+            price = market.to_price_int(market.price)
+            return price, price
+        half = self.spread_pct / 2
+        bid = market.to_price_int(market.price * (1 - half), ROUND_FLOOR)
+        ask = market.to_price_int(market.price * (1 + half), ROUND_CEILING)
+        return bid, max(ask, bid + 1)
+
+    def set_price(
+        self,
+        market: Union[int, str],
+        price: Decimal,
+        volume: Optional[Decimal] = None,
+    ) -> list[FakeFill]:
+        """Move the external price, filling resting orders it trades through.
+
+        Args:
+            market: Market id or symbol
+            price: New external price
+            volume: Base amount the move trades against resting orders (None = unlimited)
+
+        Returns:
+            Fills generated by the move
+        """
+        m = self.market(market)
+        m.price = Decimal(price)
+        start = len(self.fills)
+
+        price_int = m.to_price_int(m.price)
+        remaining = None if volume is None else int(Decimal(volume).scaleb(m.size_decimals))
+
+        # Bids at or above the new price get hit, asks at or below get lifted,
+        # best price first and oldest first within a price
+        book = [o for o in self._orders.values() if o.market_id == m.market_id and not o.is_trigger]
+        crossed = sorted(
+            (o for o in book if not o.is_ask and o.price >= price_int),
+            key=lambda o: (-o.price, o.seq),
+        ) + sorted(
+            (o for o in book if o.is_ask and o.price <= price_int),
+            key=lambda o: (o.price, o.seq),
+        )
+        for order in crossed:
+            if remaining is not None and remaining <= 0:
+                break
+            size = order.remaining if remaining is None else min(order.remaining, remaining)
+            self._execute(m, order, size, order.price, maker=True)
+            if remaining is not None:
+                remaining -= size
+
+        self._trigger_orders(m)
+        return self.fills[start:]
+
+    def set_funding_rate(self, market: Union[int, str], rate: Decimal):
+        self.market(market).funding_rate = Decimal(rate)
+
+    def fail_next(self, count: int = 1, status: int = 503):
+        """Make the next `count` API calls fail with the given HTTP status."""
+        self._forced_failures.extend([status] * count)
+
+    def open_orders(self, market_id: Optional[int] = None) -> list[FakeOrder]:
+        return [o for o in self._orders.values() if market_id is None or o.market_id == market_id]
+
+    def balance(self, asset_id: int) -> tuple[Decimal, Decimal]:
+        """(total, locked) spot balance for an asset."""
+        return self._balances.get(asset_id, Decimal("0")), self._locked.get(asset_id, Decimal("0"))
+
+    def position(self, market: Union[int, str]) -> Decimal:
+        """Signed perp position size."""
+        pos = self._positions.get(self.market(market).market_id)
+        return pos.size if pos else Decimal("0")
+
+    def get_stats(self) -> dict:
+        return {
+            "api_calls": sum(self.calls.values()),
+            "calls": dict(self.calls),
+            "open_orders": len(self._orders),
+            "fills": len(self.fills),
+            "rejects": len(self.rejects),
+        }
+
+    # -------------------------------------------------------------------------
+    # Transport simulation
+    # -------------------------------------------------------------------------
+
+    async def _request(self, name: str):
+        """Account for one API round trip: latency, then injected faults."""
+        self.calls[name] += 1
+        metrics.count("api_calls")
+
+        delay = self.latency
+        if self.jitter:
+            delay += self._rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        status = None
+        if self._forced_failures:
+            status = self._forced_failures.popleft()
+        elif self.error_rate or self.rate_limit_rate:
+            roll = self._rng.random()
+            if roll < self.rate_limit_rate:
+                status = 429
+            elif roll < self.rate_limit_rate + self.error_rate:
+                status = 503
+        if status is not None:
+            raise ApiException(status=status, reason=_API_ERROR_REASONS.get(status, "Error"))
+
+    def _tx_response(self, order_index: Optional[int] = None):
+        tx_hash = f"{next(self._tx_ids):064x}"
+        resp = SimpleNamespace(
+            code=200,
+            message=None,
+            tx_hash=tx_hash,
+            predicted_execution_time_ms=int(time.time() * 1000),
+            volume_quota_remaining=0,
+        )
+        if self.return_order_index and order_index is not None:
+            resp.order_index = order_index
+        return SimpleNamespace(tx_hash=tx_hash), resp, None
+
+    def _bad_request(self, message: str) -> BadRequestException:
+        return BadRequestException(status=400, reason="Bad Request", body=json.dumps({"code": 400, "message": message}))
+
+    def _apply_tx(self, tx: dict):
+        """Apply a signed transaction, enforcing nonce order per API key.
+
+        Rejected transactions raise BadRequestException without using their
+        nonce, like the live sendTx endpoint.
+        """
+        key = tx["api_key_index"]
+        expected = self._nonces.get(key, 0)
+        if tx["nonce"] != expected:
+            raise self._bad_request(f"invalid nonce: expected {expected}, got {tx['nonce']}")
+
+        kind, params = tx["kind"], tx["params"]
+        if kind == "create_order":
+            _, resp, error = self._submit(
+                params["market_index"], params["client_order_index"], params["base_amount"], params["price"],
+                params["is_ask"], params["order_type"], params["time_in_force"], params["reduce_only"],
+                params["trigger_price"],
+            )
+            if error:
+                raise self._bad_request(error)
+        elif kind == "cancel_order":
+            order = self._orders.get(params["order_index"])
+            if order is not None and order.market_id == params["market_index"]:
+                self._cancel(order)
+            _, resp, _ = self._tx_response()
+        elif kind == "modify_order":
+            order = self._orders.get(params["order_index"])
+            if order is None or order.market_id != params["market_index"]:
+                raise self._bad_request("order not found")
+            error = self._modify(order, params["base_amount"], params["price"], params["trigger_price"])
+            if error:
+                raise self._bad_request(error)
+            _, resp, _ = self._tx_response()
+        elif kind == "cancel_all_orders":
+            for order in list(self._orders.values()):
+                self._cancel(order)
+            _, resp, _ = self._tx_response()
+        else:
+            raise self._bad_request(f"unsupported transaction {kind}")
+        self._nonces[key] = expected + 1
+        return resp
+
+    # -------------------------------------------------------------------------
+    # Matching and settlement
+    # -------------------------------------------------------------------------
+
+    def _reject(self, order_index: int, reason: str):
+        self.rejects.append((order_index, reason))
+        log.debug("Fake exchange cancelled order %s: %s", order_index, reason)
+
+    def _submit(
+        self,
+        market_id: int,
+        client_order_index: int,
+        base_amount: int,
+        price: int,
+        is_ask: bool,
+        order_type: int,
+        time_in_force: int,
+        reduce_only: bool = False,
+        trigger_price: int = 0,
+    ) -> tuple:
+        """Validate and process an order transaction (returns the SDK's (tx, resp, error))."""
+        m = self.markets.get(market_id)
+        if m is None:
+            return None, None, f"invalid market index {market_id}"
+        if order_type not in _ORDER_TYPE_NAMES and order_type != SignerClient.ORDER_TYPE_MARKET:
+            return None, None, f"unsupported order type {order_type}"
+        size = m.to_size(base_amount)
+        if base_amount <= 0 or size < m.min_base_amount or size * m.to_price(price) < m.min_quote_amount:
+            return None, None, "invalid order base or quote amount"
+
+        order = FakeOrder(
+            order_index=next(self._order_ids),
+            client_order_index=client_order_index,
+            market_id=market_id,
+            is_ask=bool(is_ask),
+            price=price,
+            size=base_amount,
+            order_type=order_type,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only,
+            trigger_price=trigger_price,
+            created_at=int(time.time() * 1000),
+            seq=next(self._seq),
+        )
+        result = self._tx_response(order.order_index)
+        if client_order_index:
+            self._client_orders[client_order_index] = order
+
+        if order.is_trigger:
+            self._orders[order.order_index] = order
+            self._trigger_orders(m)
+            return result
+
+        bid, ask = self.quote(m)
+        crosses = order.price <= bid if order.is_ask else order.price >= ask
+        if order.order_type == SignerClient.ORDER_TYPE_MARKET or order.time_in_force == SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL:
+            if crosses:
+                self._take(m, order)
+            else:
+                self._reject(order.order_index, "too much slippage")
+            return result
+
+        if crosses:
+            if order.time_in_force == SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY:
+                self._reject(order.order_index, "post-only order would cross")
+            else:
+                self._take(m, order)
+            return result
+
+        if m.is_spot:
+            asset_id, amount = self._lock_amount(m, order)
+            total, locked = self.balance(asset_id)
+            if total - locked < amount:
+                self._reject(order.order_index, "not enough balance")
+                return result
+            self._locked[asset_id] = locked + amount
+
+        self._orders[order.order_index] = order
+        return result
+
+    def _modify(self, order: FakeOrder, base_amount: int, price: int, trigger_price: int) -> Optional[str]:
+        """Re-price a resting order in place; `base_amount` is its new remaining size.
+
+        The order keeps its index but goes to the back of the queue. Like a
+        new order, a modified one that can no longer rest is cancelled rather
+        than rejected.
+        """
+        m = self.markets[order.market_id]
+        size = m.to_size(base_amount)
+        if base_amount <= 0 or size < m.min_base_amount or size * m.to_price(price) < m.min_quote_amount:
+            return "invalid order base or quote amount"
+
+        if order.is_trigger:
+            order.size, order.price, order.trigger_price = order.filled + base_amount, price, trigger_price
+            order.seq = next(self._seq)
+            self._trigger_orders(m)
+            return None
+
+        self._cancel(order)
+        order.size, order.price = order.filled + base_amount, price
+        order.seq = next(self._seq)
+
+        bid, ask = self.quote(m)
+        if (order.price <= bid if order.is_ask else order.price >= ask):
+            if order.time_in_force == SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY:
+                self._reject(order.order_index, "post-only order would cross")
+            else:
+                self._take(m, order)
+            return None
+
+        if m.is_spot:
+            asset_id, amount = self._lock_amount(m, order)
+            total, locked = self.balance(asset_id)
+            if total - locked < amount:
+                self._reject(order.order_index, "not enough balance")
+                return None
+            self._locked[asset_id] = locked + amount
+
+        self._orders[order.order_index] = order
+        return None
+
+    def _lock_amount(self, m: FakeMarket, order: FakeOrder, size: Optional[int] = None) -> tuple[int, Decimal]:
+        """Asset and amount a resting spot order reserves (for `size`, default the remainder)."""
+        size = m.to_size(order.remaining if size is None else size)
+        if order.is_ask:
+            return m.base_asset_id, size
+        return m.quote_asset_id, size * m.to_price(order.price)
+
+    def _take(self, m: FakeMarket, order: FakeOrder):
+        """Fill an incoming order in full at the external quote."""
+        bid, ask = self.quote(m)
+        price_int = bid if order.is_ask else ask
+        if m.is_spot:
+            size = m.to_size(order.remaining)
+            if order.is_ask:
+                asset_id, needed = m.base_asset_id, size
+            else:
+                asset_id, needed = m.quote_asset_id, size * m.to_price(price_int) * (1 + m.taker_fee)
+            total, locked = self.balance(asset_id)
+            if total - locked < needed:
+                self._orders.pop(order.order_index, None)
+                self._reject(order.order_index, "not enough balance")
+                return
+        self._execute(m, order, order.remaining, price_int, maker=False)
+
+    def _cancel(self, order: FakeOrder):
+        """Remove a resting order and release what it had locked."""
+        self._orders.pop(order.order_index, None)
+        m = self.markets[order.market_id]
+        if m.is_spot and not order.is_trigger:
+            asset_id, amount = self._lock_amount(m, order)
+            self._locked[asset_id] -= amount
+
+    def _execute(self, m: FakeMarket, order: FakeOrder, size_int: int, price_int: int, maker: bool):
+        """Settle a fill of `size_int` at `price_int` and retire the order once complete."""
+        if order.reduce_only and not m.is_spot:
+            pos = self._positions.get(m.market_id, _Position())
+            closable = pos.size if order.is_ask else -pos.size
+            closable_int = int(max(Decimal("0"), closable).scaleb(m.size_decimals))
+            size_int = min(size_int, closable_int)
+            if size_int <= 0:
+                self._orders.pop(order.order_index, None)
+                self._reject(order.order_index, "reduce-only")
+                return
+
+        size = m.to_size(size_int)
+        price = m.to_price(price_int)
+        notional = size * price
+        fee = notional * (m.maker_fee if maker else m.taker_fee)
+
+        if m.is_spot:
+            if maker:
+                asset_id, amount = self._lock_amount(m, order, size_int)
+                self._locked[asset_id] -= amount
+            if order.is_ask:
+                self._adjust(m.base_asset_id, -size)
+                self._adjust(m.quote_asset_id, notional - fee)
+            else:
+                self._adjust(m.quote_asset_id, -(notional + fee))
+                self._adjust(m.base_asset_id, size)
+        else:
+            self._apply_perp_fill(m.market_id, -size if order.is_ask else size, price)
+            self.collateral -= fee
+
+        order.filled += size_int
+        if order.remaining <= 0:
+            self._orders.pop(order.order_index, None)
+
+        self.fills.append(FakeFill(
+            order_index=order.order_index,
+            market_id=m.market_id,
+            is_ask=order.is_ask,
+            price=price,
+            size=size,
+            fee=fee,
+            maker=maker,
+            timestamp=time.time(),
+        ))
+
+    def _adjust(self, asset_id: int, delta: Decimal):
+        self._balances[asset_id] = self._balances.get(asset_id, Decimal("0")) + delta
+        self._locked.setdefault(asset_id, Decimal("0"))
+
+    def _apply_perp_fill(self, market_id: int, delta: Decimal, price: Decimal):
+        """Update a position with a signed fill, realizing PnL on the closed part."""
+        pos = self._positions.setdefault(market_id, _Position())
+        if pos.size == 0 or (pos.size > 0) == (delta > 0):
+            new_size = pos.size + delta
+            pos.entry = (pos.entry * abs(pos.size) + price * abs(delta)) / abs(new_size)
+            pos.size = new_size
+            return
+
+        closed = min(abs(delta), abs(pos.size))
+        direction = 1 if pos.size > 0 else -1
+        self.collateral += (price - pos.entry) * closed * direction
+        pos.size += delta
+        if pos.size == 0:
+            pos.entry = Decimal("0")
+        elif abs(delta) > closed:
+            # Flipped through zero: the remainder opened at the fill price
+            pos.entry = price
+
+    def _trigger_orders(self, m: FakeMarket):
+        """Fire stop-loss / take-profit orders whose trigger the price has reached."""
+        price_int = m.to_price_int(m.price)
+        for order in sorted(self._orders.values(), key=lambda o: o.seq):
+            if order.market_id != m.market_id or not order.is_trigger:
+                continue
+            rising = not order.is_ask if order.order_type == SignerClient.ORDER_TYPE_STOP_LOSS else order.is_ask
+            hit = price_int >= order.trigger_price if rising else price_int <= order.trigger_price
+            if hit:
+                self._take(m, order)
+                self._orders.pop(order.order_index, None)
+
+    # -------------------------------------------------------------------------
+    # API views
+    # -------------------------------------------------------------------------
+
+    def _order_view(self, order: FakeOrder):
+        m = self.markets[order.market_id]
+        if order.order_index in self._orders:
+            status = "open"
+        elif order.remaining <= 0:
+            status = "filled"
+        else:
+            status = "canceled"
+        return SimpleNamespace(
+            order_index=order.order_index,
+            client_order_index=order.client_order_index,
+            market_index=order.market_id,
+            is_ask=order.is_ask,
+            price=str(m.to_price(order.price)),
+            initial_base_amount=str(m.to_size(order.size)),
+            remaining_base_amount=str(m.to_size(order.remaining)),
+            filled_base_amount=str(m.to_size(order.filled)),
+            trigger_price=str(m.to_price(order.trigger_price)),
+            reduce_only=order.reduce_only,
+            status=status,
+            type=_ORDER_TYPE_NAMES[order.order_type],
+            created_at=order.created_at,
+        )
+
+    def _account_view(self):
+        positions = []
+        unrealized_total = Decimal("0")
+        for market_id, pos in self._positions.items():
+            m = self.markets[market_id]
+            unrealized = (m.price - pos.entry) * pos.size
+            unrealized_total += unrealized
+            positions.append(SimpleNamespace(
+                market_id=market_id,
+                symbol=m.symbol,
+                position=str(abs(pos.size)),
+                sign=-1 if pos.size < 0 else 1,
+                avg_entry_price=str(pos.entry),
+                unrealized_pnl=str(unrealized),
+                liquidation_price="0",
+            ))
+
+        assets = []
+        total_value = self.collateral + unrealized_total
+        for asset_id, total in sorted(self._balances.items()):
+            locked = self._locked.get(asset_id, Decimal("0"))
+            assets.append(SimpleNamespace(
+                asset_id=asset_id,
+                balance=str(total - locked),
+                locked_balance=str(locked),
+            ))
+            total_value += total * self._asset_price(asset_id)
+
+        return SimpleNamespace(
+            index=self.account_index,
+            l1_address="0x0000000000000000000000000000000000000000",
+            collateral=str(self.collateral),
+            available_balance=str(self.collateral + unrealized_total),
+            positions=positions,
+            assets=assets,
+            total_asset_value=str(total_value),
+        )
+
+    def _asset_price(self, asset_id: int) -> Decimal:
+        """USDC value of one unit of an asset (quote assets are 1)."""
+        for m in self.markets.values():
+            if m.is_spot and m.base_asset_id == asset_id:
+                return m.price
+        return Decimal("1")
+
+    def _book_view(self, market_id: int, limit: int):
+        m = self.markets[market_id]
+        bid, ask = self.quote(m)
+        bids: dict[int, int] = {bid: 0}
+        asks: dict[int, int] = {ask: 0}
+        for order in self._orders.values():
+            if order.market_id == market_id and not order.is_trigger:
+                side = asks if order.is_ask else bids
+                side[order.price] = side.get(order.price, 0) + order.remaining
+
+        def _levels(levels: dict[int, int], reverse: bool):
+            return [
+                SimpleNamespace(price=str(m.to_price(p)), remaining_base_amount=str(m.to_size(s)))
+                for p, s in sorted(levels.items(), reverse=reverse)[:limit]
+            ]
+
+        return SimpleNamespace(bids=_levels(bids, True), asks=_levels(asks, False))
+
+    def _trades_view(self, market_id: int, limit: int):
+        """Our fills as public trades, newest first (trade_id = position in the fill log)."""
+        trades = [
+            SimpleNamespace(
+                trade_id=trade_id,
+                market_id=fill.market_id,
+                price=str(fill.price),
+                size=str(fill.size),
+                # A maker fill's side is the resting side; a taker fill hit the other one
+                is_maker_ask=fill.is_ask if fill.maker else not fill.is_ask,
+                timestamp=int(fill.timestamp * 1000),
+            )
+            for trade_id, fill in enumerate(self.fills)
+            if fill.market_id == market_id
+        ]
+        return SimpleNamespace(code=200, trades=trades[::-1][:limit])
+
+
+class _FakeApiClient:
+    async def close(self):
+        pass
+
+
+class _FakeOrderApi:
+    def __init__(self, exchange: FakeExchange):
+        self._exchange = exchange
+
+    async def order_book_details(self, **kwargs):
+        await self._exchange._request("order_book_details")
+        perp, spot = [], []
+        for m in self._exchange.markets.values():
+            details = SimpleNamespace(
+                symbol=m.symbol,
+                market_id=m.market_id,
+                base_asset_id=m.base_asset_id,
+                quote_asset_id=m.quote_asset_id,
+                min_base_amount=str(m.min_base_amount),
+                min_quote_amount=str(m.min_quote_amount),
+                size_decimals=m.size_decimals,
+                price_decimals=m.price_decimals,
+                taker_fee=str(m.taker_fee),
+                maker_fee=str(m.maker_fee),
+                last_trade_price=float(m.price),
+            )
+            (spot if m.is_spot else perp).append(details)
+        return SimpleNamespace(order_book_details=perp, spot_order_book_details=spot)
+
+    async def account_active_orders(self, account_index: int, market_id: int, auth: Optional[str] = None, **kwargs):
+        await self._exchange._request("account_active_orders")
+        orders = [
+            self._exchange._order_view(o)
+            for o in sorted(self._exchange.open_orders(market_id), key=lambda o: o.seq)
+        ]
+        return SimpleNamespace(code=200, orders=orders)
+
+    async def account_orders(self, client_order_indexes: str, account_index: Optional[int] = None, **kwargs):
+        await self._exchange._request("account_orders")
+        indexes = [int(index) for index in client_order_indexes.split(",") if index]
+        orders = [
+            self._exchange._order_view(self._exchange._client_orders[index])
+            for index in indexes if index in self._exchange._client_orders
+        ]
+        return SimpleNamespace(code=200, orders=orders)
+
+    async def order_book_orders(self, market_id: int, limit: int, **kwargs):
+        await self._exchange._request("order_book_orders")
+        return self._exchange._book_view(market_id, limit)
+
+    async def recent_trades(self, market_id: int, limit: int, **kwargs):
+        await self._exchange._request("recent_trades")
+        return self._exchange._trades_view(market_id, limit)
+
+
+class _FakeAccountApi:
+    def __init__(self, exchange: FakeExchange):
+        self._exchange = exchange
+
+    async def account(self, by: str, value: str, **kwargs):
+        await self._exchange._request("account")
+        return SimpleNamespace(code=200, accounts=[self._exchange._account_view()])
+
+    async def accounts_by_l1_address(self, l1_address: str, **kwargs):
+        await self._exchange._request("accounts_by_l1_address")
+        return SimpleNamespace(sub_accounts=[SimpleNamespace(index=self._exchange.account_index)])
+
+
+class _FakeFundingApi:
+    def __init__(self, exchange: FakeExchange):
+        self._exchange = exchange
+
+    async def funding_rates(self, **kwargs):
+        await self._exchange._request("funding_rates")
+        rates = [
+            SimpleNamespace(market_id=m.market_id, exchange="lighter", symbol=m.symbol, rate=float(m.funding_rate))
+            for m in self._exchange.markets.values() if not m.is_spot
+        ]
+        return SimpleNamespace(funding_rates=rates)
+
+
+class _FakeRootApi:
+    def __init__(self, exchange: FakeExchange):
+        self._exchange = exchange
+
+    async def status(self, **kwargs):
+        await self._exchange._request("status")
+        return SimpleNamespace(status=200, network_id=1, timestamp=int(time.time()))
+
+
+class _FakeNonceManager(OptimisticNonceManager):
+    """The SDK's optimistic nonce manager, fetching from the fake exchange."""
+
+    def __init__(self, exchange: FakeExchange):
+        super().__init__(account_index=exchange.account_index, api_client=None,
+                         api_keys_list=[_FAKE_API_KEY_INDEX])
+        self._exchange = exchange
+
+    async def _fetch_nonce(self, api_key: int) -> int:
+        await self._exchange._request("next_nonce")
+        return self._exchange._nonces.get(api_key, 0)
+
+
+class _FakeSignerClient:
+    """Accepts the SignerClient calls LighterClient makes.
+
+    sign_* produce a JSON "signature" (optionally taking sign_seconds, like
+    the native signer) that send_tx applies in nonce order; the older
+    create_order/cancel_order calls skip signing and nonces entirely.
+    """
+
+    def __init__(self, exchange: FakeExchange):
+        self._exchange = exchange
+        self.nonce_manager = _FakeNonceManager(exchange)
+
+    def _sign(self, kind: str, nonce: int, api_key_index: int, **params):
+        if self._exchange.sign_seconds:
+            time.sleep(self._exchange.sign_seconds)
+        tx_info = json.dumps({"kind": kind, "nonce": nonce, "api_key_index": api_key_index, "params": params})
+        return _TX_TYPES[kind], tx_info, hashlib.sha256(tx_info.encode()).hexdigest(), None
+
+    def sign_create_order(
+        self,
+        market_index: int,
+        client_order_index: int,
+        base_amount: int,
+        price: int,
+        is_ask: bool,
+        order_type: int,
+        time_in_force: int,
+        reduce_only: bool = False,
+        trigger_price: int = 0,
+        order_expiry: int = -1,
+        *,
+        nonce: int = -1,
+        api_key_index: int = 255,
+        **kwargs,
+    ):
+        return self._sign(
+            "create_order", nonce, api_key_index, market_index=market_index, client_order_index=client_order_index,
+            base_amount=base_amount, price=price, is_ask=int(is_ask), order_type=order_type,
+            time_in_force=time_in_force, reduce_only=bool(reduce_only), trigger_price=trigger_price,
+            order_expiry=order_expiry,
+        )
+
+    def sign_cancel_order(self, market_index: int, order_index: int, *, nonce: int = -1, api_key_index: int = 255,
+                          **kwargs):
+        return self._sign("cancel_order", nonce, api_key_index, market_index=market_index, order_index=order_index)
+
+    def sign_modify_order(self, market_index: int, order_index: int, base_amount: int, price: int,
+                          trigger_price: int = 0, *, nonce: int = -1, api_key_index: int = 255, **kwargs):
+        return self._sign("modify_order", nonce, api_key_index, market_index=market_index, order_index=order_index,
+                          base_amount=base_amount, price=price, trigger_price=trigger_price)
+
+    def sign_cancel_all_orders(self, time_in_force: int, timestamp_ms: int, *, nonce: int = -1,
+                               api_key_index: int = 255, **kwargs):
+        return self._sign("cancel_all_orders", nonce, api_key_index, time_in_force=time_in_force,
+                          timestamp_ms=timestamp_ms)
+
+    async def send_tx(self, tx_type: int, tx_info: str):
+        await self._exchange._request("send_tx")
+        return self._exchange._apply_tx(json.loads(tx_info))
+
+    async def send_tx_batch(self, tx_types: list[int], tx_infos: list[str]):
+        """Apply transactions in order; the first rejection raises, leaving earlier ones applied."""
+        await self._exchange._request("send_tx_batch")
+        hashes = [self._exchange._apply_tx(json.loads(tx_info)).tx_hash for tx_info in tx_infos]
+        return SimpleNamespace(
+            code=200,
+            message=None,
+            tx_hash=hashes,
+            predicted_execution_time_ms=int(time.time() * 1000),
+            volume_quota_remaining=0,
+        )
+
+    async def create_order(
+        self,
+        market_index: int,
+        client_order_index: int,
+        base_amount: int,
+        price: int,
+        is_ask: bool,
+        order_type: int,
+        time_in_force: int,
+        reduce_only: bool = False,
+        trigger_price: int = 0,
+        **kwargs,
+    ):
+        await self._exchange._request("send_tx")
+        return self._exchange._submit(
+            market_index, client_order_index, base_amount, price, is_ask,
+            order_type, time_in_force, reduce_only, trigger_price,
+        )
+
+    async def create_market_order(
+        self,
+        market_index: int,
+        client_order_index: int,
+        base_amount: int,
+        avg_execution_price: int,
+        is_ask: bool,
+        reduce_only: bool = False,
+        **kwargs,
+    ):
+        await self._exchange._request("send_tx")
+        return self._exchange._submit(
+            market_index, client_order_index, base_amount, avg_execution_price, is_ask,
+            SignerClient.ORDER_TYPE_MARKET, SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL, reduce_only,
+        )
+
+    async def cancel_order(self, market_index: int, order_index: int, **kwargs):
+        await self._exchange._request("send_tx")
+        order = self._exchange._orders.get(order_index)
+        if order is not None and order.market_id == market_index:
+            self._exchange._cancel(order)
+        return self._exchange._tx_response()
+
+    async def cancel_all_orders(self, time_in_force: int, timestamp_ms: int, **kwargs):
+        await self._exchange._request("send_tx")
+        for order in list(self._exchange._orders.values()):
+            self._exchange._cancel(order)
+        return self._exchange._tx_response()
+
+    def create_auth_token_with_expiry(self, deadline: int = SignerClient.DEFAULT_10_MIN_AUTH_EXPIRY, **kwargs):
+        return f"fake-auth:{self._exchange.account_index}:{deadline}", None
+
+    async def close(self):
+        pass
@@ -30,12 +30,24 @@ class FloorProtection:
         """Check portfolio value against floor protection threshold."""
         portfolio_value = await self._calculate_portfolio_value(current_price)
 
-        log.debug(f"Floor check: price=${current_price}, portfolio=${portfolio_value:.2f}")
+        log.debug("Floor check: price=$%s, portfolio=$%.2f", current_price, portfolio_value)
 
         # Emergency exit if portfolio value drops to buffer threshold
         if portfolio_value <= self.config["emergency_buffer"]:
             await self._emergency_exit(current_price, portfolio_value)
 
+    async def portfolio_value(self, price: Decimal) -> Decimal:
+        """Portfolio value at the given LIT price, as check() computes it."""
+        return await self._calculate_portfolio_value(price)
+
+    async def force_exit(self, price: Decimal):
+        """Run the emergency exit now, whatever this account's own value.
+
+        For breaches decided elsewhere: the multi-account coordinator applies
+        the floor to the sum of every account's value.
+        """
+        await self._emergency_exit(price, await self._calculate_portfolio_value(price))
+
     async def _calculate_portfolio_value(self, price: Decimal) -> Decimal:
         """Calculate total portfolio value using actual exchange balances.
 
@@ -79,7 +91,9 @@ class FloorProtection:
 
         total = lit_value + usdc_balance
 
-        log.debug(f"Portfolio: LIT={lit_balance:.2f}(${lit_value:.2f}) + USDC=${usdc_balance:.2f} = ${total:.2f}")
+        log.debug(
+            "Portfolio: LIT=%.2f($%.2f) + USDC=$%.2f = $%.2f", lit_balance, lit_value, usdc_balance, total
+        )
 
         return total
 
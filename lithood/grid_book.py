@@ -0,0 +1,321 @@
+# lithood/grid_book.py
+"""In-memory book of a grid's open orders, in arrays indexed by ladder rung."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from lithood.ladder import PriceLadder
+from lithood.types import Order, OrderSide, OrderStatus
+
+# Column of each side in the per-rung arrays
+_COLUMN = {OrderSide.BUY: 0, OrderSide.SELL: 1}
+
+
+class GridBook:
+    """Open grid orders by (ladder rung, side).
+
+    Row r of every array is rung `base + r`; column 0 holds the buy and
+    column 1 the sell resting on that rung. Alongside the Order itself the
+    book keeps remaining size (in size units), placement time and last fill
+    time as numeric arrays, so counts and totals are vectorized and a level
+    or order id is found in O(1). The few orders whose price is not on the
+    ladder (e.g. adopted by reconciliation) are kept in a side map.
+
+    The book mirrors what the engine writes to StateManager; the database
+    stays the persistent record.
+
+    For reconciling every tick, the book also keeps a fingerprint of the
+    last exchange snapshot per slot and flags the slots it changed itself
+    since, so changes() only has to look at levels where either side moved.
+    """
+
+    def __init__(self, ladder: PriceLadder, size_decimals: int, capacity: int = 64):
+        """Initialize an empty book.
+
+        Args:
+            ladder: Ladder whose rungs are the book's levels
+            size_decimals: Decimal places of a size unit
+            capacity: Rungs to allocate up front (grown on demand)
+        """
+        self.ladder = ladder
+        self.size_decimals = size_decimals
+        self._base = -(capacity // 2)
+        self._orders = np.empty((capacity, 2), dtype=object)
+        self._open = np.zeros((capacity, 2), dtype=bool)
+        self._remaining = np.zeros((capacity, 2), dtype=np.int64)
+        self._placed_at = np.zeros((capacity, 2), dtype=np.float64)
+        self._last_fill = np.zeros((capacity, 2), dtype=np.float64)
+        self._exchange_fp = np.zeros((capacity, 2), dtype=np.int64)
+        self._dirty = np.zeros((capacity, 2), dtype=bool)
+        self._slots: dict[str, tuple[int, int]] = {}
+        self._loose: dict[str, Order] = {}
+        # Bumped on every change, so a snapshot taken before one can be told apart
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._slots) + len(self._loose)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """Open order by id."""
+        slot = self._slots.get(order_id)
+        if slot is not None:
+            return self._orders[slot]
+        return self._loose.get(order_id)
+
+    def at(self, side: OrderSide, price: Decimal) -> Optional[Order]:
+        """Open order of `side` at `price`, if any."""
+        slot = self._slot_for(side, price)
+        if slot is not None:
+            return self._orders[slot] if self._open[slot] else None
+        return next((o for o in self._loose.values() if o.side == side and o.price == price), None)
+
+    def rung_of(self, order_id: str) -> Optional[int]:
+        """Ladder rung of an open order (None if unknown or off the ladder)."""
+        slot = self._slots.get(order_id)
+        return slot[0] + self._base if slot is not None else None
+
+    def orders(self) -> List[Order]:
+        """All open orders, lowest rung first (buy before sell), then off-ladder ones."""
+        return list(self._orders[self._open]) + list(self._loose.values())
+
+    def count(self, side: OrderSide) -> int:
+        """Number of open orders on a side."""
+        return int(self._open[:, _COLUMN[side]].sum()) + sum(1 for o in self._loose.values() if o.side == side)
+
+    def remaining(self, side: OrderSide) -> Decimal:
+        """Total unfilled size resting on a side."""
+        column = _COLUMN[side]
+        units = int(self._remaining[:, column][self._open[:, column]].sum())
+        loose = sum((o.size - o.filled_size for o in self._loose.values() if o.side == side), Decimal("0"))
+        return Decimal(units).scaleb(-self.size_decimals) + loose
+
+    def last_fill_time(self) -> Optional[float]:
+        """Time of the most recent fill recorded on a resting order (epoch seconds)."""
+        latest = float(self._last_fill.max()) if self._last_fill.size else 0.0
+        return latest or None
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def add(self, order: Order):
+        """Track an open order (replacing any entry with the same id)."""
+        self.remove(order.id)
+        self.version += 1
+        slot = self._slot_for(order.side, order.price, grow=True)
+        if slot is None or self._open[slot]:
+            # Off the ladder, or the level is taken: keep it, outside the arrays
+            self._loose[order.id] = order
+            return
+        self._orders[slot] = order
+        self._open[slot] = True
+        self._remaining[slot] = self._units(order.size - order.filled_size)
+        self._placed_at[slot] = order.created_at.timestamp()
+        self._last_fill[slot] = order.filled_at.timestamp() if order.filled_at else 0.0
+        self._dirty[slot] = True
+        self._slots[order.id] = slot
+
+    def remove(self, order_id: str) -> Optional[Order]:
+        """Stop tracking an order (filled, cancelled or replaced)."""
+        slot = self._slots.pop(order_id, None)
+        if slot is None:
+            order = self._loose.pop(order_id, None)
+            if order is not None:
+                self.version += 1
+            return order
+        self.version += 1
+        order = self._orders[slot]
+        self._orders[slot] = None
+        self._open[slot] = False
+        self._remaining[slot] = 0
+        self._last_fill[slot] = 0.0
+        self._dirty[slot] = True
+        return order
+
+    def record_fill(self, order_id: str, filled_size: Decimal, when: Optional[float] = None):
+        """Record a partial fill: the order's filled size is now `filled_size`."""
+        order = self.get(order_id)
+        if order is None:
+            return
+        self.version += 1
+        order.filled_size = filled_size
+        order.status = OrderStatus.PARTIALLY_FILLED
+        order.filled_at = datetime.fromtimestamp(when) if when else datetime.now()
+        slot = self._slots.get(order_id)
+        if slot is not None:
+            self._remaining[slot] = self._units(order.size - filled_size)
+            self._last_fill[slot] = order.filled_at.timestamp()
+            self._dirty[slot] = True
+
+    def recheck(self, exchange_order: Order):
+        """Have the next changes() look at an exchange order's level again."""
+        slot = self._slot_for(exchange_order.side, exchange_order.price)
+        if slot is not None:
+            self._dirty[slot] = True
+
+    def load(self, orders: Iterable[Order]):
+        """Replace the book's contents with `orders`."""
+        self.clear()
+        for order in orders:
+            self.add(order)
+
+    def clear(self):
+        self._orders[:] = None
+        self._open[:] = False
+        self._remaining[:] = 0
+        self._last_fill[:] = 0.0
+        self._dirty[:] = True
+        self.version += 1
+        self._slots.clear()
+        self._loose.clear()
+
+    # -------------------------------------------------------------------------
+    # Exchange snapshots
+    # -------------------------------------------------------------------------
+
+    def match(
+        self, exchange_orders: Iterable[Order], placed_before: Optional[float] = None
+    ) -> tuple[list[tuple[Order, Order]], List[Order], List[Order]]:
+        """Pair an active-orders snapshot with the book in one pass over it.
+
+        Exchange orders are matched by id, falling back to price and side
+        (ids from placement are tx hashes, the snapshot reports order indexes).
+
+        Args:
+            exchange_orders: The market's active orders on the exchange
+            placed_before: Leave out book orders placed after this time
+                (epoch seconds) - the snapshot may not show them yet
+
+        Returns:
+            Tuple of ((book order, exchange order) pairs, book orders missing
+            from the snapshot, snapshot orders not in the book)
+        """
+        return self._match(exchange_orders, self._open, placed_before)
+
+    def changes(
+        self, exchange_orders: List[Order], placed_before: Optional[float] = None
+    ) -> Optional[tuple[list[tuple[Order, Order]], List[Order], List[Order]]]:
+        """match() restricted to the levels that changed since the last snapshot.
+
+        A level is looked at if its exchange fingerprint (a hash of the
+        orders resting there) differs from the previous snapshot's, or if
+        the book changed it since; orders off the ladder are always looked
+        at. Every other level must still agree with the book - a resting
+        order on both sides or on neither. If one does not, something
+        drifted unseen and None is returned: the caller should match() the
+        whole snapshot instead.
+
+        Args:
+            exchange_orders: The market's active grid orders on the exchange
+            placed_before: As for match(); such levels stay flagged until
+                their orders are old enough to judge
+
+        Returns:
+            As match(), for the changed levels only, or None on a mismatch
+        """
+        fingerprint = np.zeros_like(self._exchange_fp)
+        resting = np.zeros(self._open.shape, dtype=np.int32)
+        located = []
+        for exchange_order in exchange_orders:
+            # Most orders are known by id and still at the book's price
+            slot = self._slots.get(exchange_order.id)
+            if slot is None or self._orders[slot].price != exchange_order.price:
+                slot = self._slot_for(exchange_order.side, exchange_order.price)
+            located.append((slot, exchange_order))
+            if slot is not None:
+                fingerprint[slot] ^= hash((exchange_order.id, exchange_order.filled_size))
+                resting[slot] += 1
+
+        touched = (fingerprint != self._exchange_fp) | self._dirty
+        self._exchange_fp = fingerprint
+        recent = self._open & (self._placed_at > placed_before) if placed_before is not None else None
+        if (~touched & (self._open != (resting > 0))).any():
+            self._dirty = recent if recent is not None else np.zeros_like(self._dirty)
+            return None
+
+        # Off-ladder book orders are always checked, so their exchange orders must be too
+        loose = {o.id for o in self._loose.values()} | {(o.side, o.price) for o in self._loose.values()}
+        subset = [o for slot, o in located
+                  if slot is None or touched[slot] or (loose and (o.id in loose or (o.side, o.price) in loose))]
+        result = self._match(subset, self._open & touched, placed_before)
+        # Levels whose order is too recent to judge are looked at again next time
+        self._dirty = touched & recent if recent is not None else np.zeros_like(self._dirty)
+        return result
+
+    def _match(
+        self, exchange_orders: Iterable[Order], candidates: np.ndarray, placed_before: Optional[float]
+    ) -> tuple[list[tuple[Order, Order]], List[Order], List[Order]]:
+        """match() for the book orders in `candidates` (a mask) and off the ladder."""
+        seen = np.zeros_like(self._open)
+        seen_loose: set[str] = set()
+        matched, unknown = [], []
+        for exchange_order in exchange_orders:
+            slot = self._slots.get(exchange_order.id)
+            loose = self._loose.get(exchange_order.id)
+            if slot is None and loose is None:
+                slot = self._slot_for(exchange_order.side, exchange_order.price)
+                if slot is not None and (not self._open[slot] or seen[slot]):
+                    slot = None
+                if slot is None:
+                    loose = next((o for o in self._loose.values() if o.id not in seen_loose
+                                  and o.side == exchange_order.side and o.price == exchange_order.price), None)
+            if slot is not None:
+                seen[slot] = True
+                matched.append((self._orders[slot], exchange_order))
+            elif loose is not None:
+                seen_loose.add(loose.id)
+                matched.append((loose, exchange_order))
+            else:
+                unknown.append(exchange_order)
+
+        missing_mask = candidates & ~seen
+        if placed_before is not None:
+            recent = self._placed_at > placed_before
+            missing_mask &= ~recent
+            matched = [(o, e) for o, e in matched if o.created_at.timestamp() <= placed_before]
+        missing = list(self._orders[missing_mask])
+        missing += [o for o in self._loose.values() if o.id not in seen_loose
+                    and (placed_before is None or o.created_at.timestamp() <= placed_before)]
+        return matched, missing, unknown
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _units(self, size: Decimal) -> int:
+        return int(size.scaleb(self.size_decimals))
+
+    def _slot_for(self, side: OrderSide, price: Decimal, grow: bool = False) -> Optional[tuple[int, int]]:
+        """Array slot of a price level, or None if the price is not a rung (or not allocated)."""
+        tick = self.ladder.to_tick(price)
+        rung = self.ladder.index_of(tick) if self.ladder.to_price(tick) == price else None
+        if rung is None:
+            return None
+        row = rung - self._base
+        if not 0 <= row < len(self._open):
+            if not grow:
+                return None
+            row = self._grow(rung)
+        return row, _COLUMN[side]
+
+    def _grow(self, rung: int) -> int:
+        """Reallocate the arrays to cover `rung` (with headroom); returns its row."""
+        rows = len(self._open)
+        low = min(self._base, rung - rows // 2)
+        high = max(self._base + rows, rung + rows // 2 + 1)
+        offset = self._base - low
+        for name in ("_orders", "_open", "_remaining", "_placed_at", "_last_fill", "_exchange_fp", "_dirty"):
+            old = getattr(self, name)
+            new = np.empty((high - low, 2), dtype=object) if old.dtype == object else np.zeros((high - low, 2), old.dtype)
+            new[offset:offset + rows] = old
+            setattr(self, name, new)
+        self._base = low
+        self._slots = {order_id: (row + offset, column) for order_id, (row, column) in self._slots.items()}
+        return rung - self._base
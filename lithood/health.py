@@ -0,0 +1,170 @@
+# lithood/health.py
+"""Background connection health monitoring with proactive reconnection."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from lithood.logger import log
+from lithood.retry import ConnectionMonitor
+
+
+class RttTracker:
+    """Rolling window of round-trip times with percentile queries."""
+
+    def __init__(self, window: int = 120):
+        self._samples: deque = deque(maxlen=window)
+
+    def record(self, rtt: float):
+        """Record a round-trip time in seconds."""
+        self._samples.append(rtt)
+
+    def reset(self):
+        """Drop all samples (e.g. after the transport was rebuilt)."""
+        self._samples.clear()
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the pct-th percentile RTT, or None if no samples yet."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def snapshot(self) -> dict:
+        """Get current RTT stats in seconds."""
+        return {
+            "count": len(self._samples),
+            "last": self._samples[-1] if self._samples else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class HealthMonitor:
+    """Pings a lightweight endpoint on its own cadence and reconnects proactively.
+
+    Runs as a background task so a dead or degraded connection is rebuilt
+    before the trading loop needs it, instead of being discovered by a
+    failing order or price fetch.
+    """
+
+    # Minimum samples before a slow p95 alone counts as degraded
+    MIN_SAMPLES_FOR_RTT_CHECK = 10
+
+    def __init__(
+        self,
+        ping: Callable[[], Awaitable],
+        connection_monitor: ConnectionMonitor,
+        interval: float = 5.0,
+        timeout: float = 3.0,
+        degraded_rtt: float = 2.0,
+        failure_threshold: int = 2,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            ping: Coroutine function hitting a cheap endpoint
+            connection_monitor: Shared monitor that owns the reconnect logic
+            interval: Seconds between pings
+            timeout: Seconds before a ping counts as failed
+            degraded_rtt: p95 RTT (seconds) above which the connection is rebuilt
+            failure_threshold: Consecutive ping failures before reconnecting
+        """
+        self._ping = ping
+        self._connection_monitor = connection_monitor
+        self.interval = interval
+        self.timeout = timeout
+        self.degraded_rtt = degraded_rtt
+        self.failure_threshold = failure_threshold
+
+        self.rtt = RttTracker()
+        self.consecutive_failures = 0
+        self.proactive_reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background ping task (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+            log.info(f"Health monitor started (every {self.interval}s)")
+
+    async def stop(self):
+        """Stop the background ping task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self):
+        while True:
+            await self.check_once()
+            await asyncio.sleep(self.interval)
+
+    async def check_once(self) -> bool:
+        """Run one ping and reconnect if health has degraded.
+
+        Returns:
+            True if the ping succeeded, False otherwise
+        """
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self._ping(), timeout=self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.consecutive_failures += 1
+            self._connection_monitor.record_failure()
+            log.warning(f"Health ping failed ({self.consecutive_failures}/{self.failure_threshold}): {e}")
+            ok = False
+        else:
+            self.rtt.record(time.monotonic() - start)
+            self.consecutive_failures = 0
+            self._connection_monitor.record_success()
+            ok = True
+
+        reason = self._degraded_reason()
+        if reason:
+            await self._reconnect(reason)
+        return ok
+
+    def _degraded_reason(self) -> Optional[str]:
+        """Return why the connection is considered degraded, or None if healthy."""
+        if self.consecutive_failures >= self.failure_threshold:
+            return f"{self.consecutive_failures} consecutive ping failures"
+        if len(self.rtt) >= self.MIN_SAMPLES_FOR_RTT_CHECK:
+            p95 = self.rtt.percentile(95)
+            if p95 is not None and p95 > self.degraded_rtt:
+                return f"p95 RTT {p95 * 1000:.0f}ms > {self.degraded_rtt * 1000:.0f}ms"
+        return None
+
+    async def _reconnect(self, reason: str):
+        log.warning(f"Connection degraded ({reason}) - reconnecting proactively")
+        self._connection_monitor.mark_unhealthy()
+        if await self._connection_monitor.ensure_connected():
+            self.proactive_reconnects += 1
+            self.consecutive_failures = 0
+            self.rtt.reset()
+
+    def get_stats(self) -> dict:
+        """Get health monitor statistics."""
+        stats = self.rtt.snapshot()
+        stats.update({
+            "running": self.running,
+            "consecutive_failures": self.consecutive_failures,
+            "proactive_reconnects": self.proactive_reconnects,
+        })
+        return stats
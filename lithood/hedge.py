@@ -12,7 +12,8 @@ v2.1 CHANGES:
 -------------
 - Exchange-native stop-loss orders (instead of bot-managed polling)
 - Stop-loss is placed on exchange after opening short
-- Trailing stop cancels old and places new stop-loss order
+- Trailing stop moves the stop-loss order with one modify transaction
+  (the stop never leaves the book; its order id is cached in state)
 """
 
 import asyncio
@@ -78,6 +79,7 @@ class HedgeManager:
                     )
                     if stop_order:
                         self.state.set("hedge_stop_order_placed", True)
+                        self._remember_stop_order(stop_order)
                         log.info(f"Stop-loss order placed @ ${stop_price:.3f}")
                     else:
                         log.error("Failed to place stop-loss order")
@@ -85,6 +87,7 @@ class HedgeManager:
                 else:
                     log.info(f"Existing stop-loss order found @ ${existing_stop.price}")
                     self.state.set("hedge_stop_order_placed", True)
+                    self._remember_stop_order(existing_stop)
             return
 
         await self.open_short()
@@ -152,6 +155,7 @@ class HedgeManager:
 
         if stop_order:
             self.state.set("hedge_stop_order_placed", True)
+            self._remember_stop_order(stop_order)
             log.info(f"  Stop-loss order placed on exchange @ ${stop_price:.3f} (+{self.config['stop_loss_pct']*100:.0f}%)")
         else:
             log.error("Failed to place stop-loss order on exchange - will use bot-managed fallback")
@@ -242,40 +246,77 @@ class HedgeManager:
         """Cancel the active stop-loss order."""
         stop_order = await self._find_stop_loss_order()
         if stop_order is None:
+            self._remember_stop_order(None)
             return True  # No order to cancel
 
         market = self.client.get_market(self.symbol, MarketType.PERP)
         success = await self.client.cancel_order(stop_order.id, market_id=market.market_id)
         if success:
+            self._remember_stop_order(None)
             log.info(f"Cancelled stop-loss order {stop_order.id}")
         else:
             log.error(f"Failed to cancel stop-loss order {stop_order.id}")
         return success
 
+    def _remember_stop_order(self, order: Optional[Order]):
+        """Cache the stop-loss order's exchange index, to pick it out when trailing it.
+
+        Only numeric ids are order indexes - a live placement reports its
+        tx hash instead, in which case the next update takes any stop it finds.
+        """
+        order_id = order.id if order is not None and self.client.is_order_index(order.id) else None
+        self.state.set("hedge_stop_order_id", order_id)
+
     async def _update_stop_loss_order(self, new_stop_price: Decimal):
-        """Update stop-loss by cancelling old and placing new."""
+        """Move the stop-loss to a new trigger price with one modify transaction.
+
+        The stop stays on the exchange throughout: if the modify (or the
+        client's place-then-cancel fallback) fails, the old stop is left as it was.
+        The stop is looked up first, even with its id cached: a modify of a stop
+        cancelled outside the bot would be accepted and leave the short without
+        one, so a missing stop is placed afresh instead.
+        """
         size_str = self.state.get("hedge_size")
         size = Decimal(size_str) if size_str else self.config["short_size"]
+        market = self.client.get_market(self.symbol, MarketType.PERP)
+        if market is None:
+            log.error(f"Market not found: {self.symbol} perp")
+            return
 
-        # Cancel existing stop-loss
-        await self._cancel_stop_loss_order()
+        snapshot = await self.client.get_active_orders_by_market([market.market_id])
+        if market.market_id not in snapshot:
+            log.error("Could not look up the stop-loss order - leaving it as it is")
+            return
+        stops = [o for o in snapshot[market.market_id]
+                 if o.side == OrderSide.BUY and o.order_type == OrderType.STOP_LOSS]
+        stop_id = self.state.get("hedge_stop_order_id")
+        stop_order = next((o for o in stops if o.id == stop_id), stops[0] if stops else None)
+        if stop_id and (stop_order is None or stop_order.id != stop_id):
+            log.warning(f"Stop-loss order {stop_id} is no longer on the exchange")
+            self._remember_stop_order(stop_order)
 
-        # Place new stop-loss at lower price
-        stop_order = await self.client.place_stop_loss_order(
-            symbol=self.symbol,
-            market_type=MarketType.PERP,
-            side=OrderSide.BUY,
-            size=size,
-            trigger_price=new_stop_price,
-            reduce_only=True,
-        )
+        if stop_order is None:
+            log.warning("No stop-loss order found on exchange - placing one now")
+            new_order = await self.client.place_stop_loss_order(
+                symbol=self.symbol,
+                market_type=MarketType.PERP,
+                side=OrderSide.BUY,
+                size=size,
+                trigger_price=new_stop_price,
+                reduce_only=True,
+            )
+        else:
+            new_order = await self.client.modify_order(stop_order, price=new_stop_price, size=size)
 
-        if stop_order:
+        if new_order:
             self.state.set("hedge_stop_price", str(new_stop_price))
             self.state.set("hedge_stop_order_placed", True)
-        else:
+            self._remember_stop_order(new_order)
+        elif stop_order is None:
             log.error("Failed to place updated stop-loss order")
             self.state.set("hedge_stop_order_placed", False)
+        else:
+            log.error(f"Failed to move stop-loss order {stop_order.id} - keeping it @ ${stop_order.price}")
 
     async def check(self, current_price: Decimal):
         """Check hedge status - detect stop trigger and smart re-entry.
@@ -285,7 +326,7 @@ class HedgeManager:
         When ACTIVE:
         - Exchange handles stop-loss automatically
         - We detect if position closed and update state
-        - Trailing stop: cancel old, place new stop at lower price
+        - Trailing stop: modify the stop order down to a lower price
 
         When INACTIVE:
         - Re-entry condition 1: Price at or below bot entry price
@@ -313,7 +354,7 @@ class HedgeManager:
         With exchange-native stop-loss:
         - Exchange automatically closes position when stop triggers
         - We detect this by checking if position is gone
-        - Trailing stop: cancel old stop, place new one at lower price
+        - Trailing stop: modify the stop order down to a lower price
         """
         # Check if stop-loss was triggered by exchange (position closed)
         positions = await self.client.get_positions()
@@ -335,6 +376,7 @@ class HedgeManager:
 
             self.state.set("hedge_active", False)
             self.state.set("hedge_stop_order_placed", False)
+            self._remember_stop_order(None)
             self.state.set("last_stop_loss_time", time.time())
             self.state.log_hedge_action("stop_loss", stop_price, size, pnl=pnl)
 
@@ -357,7 +399,7 @@ class HedgeManager:
         if current_price < entry_price * Decimal("0.90"):
             new_stop = current_price * (1 + self.config["stop_loss_pct"])
             if new_stop < stop_price:
-                # Update stop-loss on exchange (cancel old, place new)
+                # Move the stop-loss order on the exchange
                 await self._update_stop_loss_order(new_stop)
                 log.info(f"Trailing stop updated: ${stop_price:.3f} -> ${new_stop:.3f}")
 
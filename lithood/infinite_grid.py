@@ -3,22 +3,36 @@
 
 DESIGN:
 -------
-- Grid re-centers when price reaches top or bottom level
+- Grid re-centers when price reaches top or bottom level, moving resting
+  orders onto the new levels with modify transactions
 - No core sells - all capital in the cycling grid
 - Captures volatility through continuous buy/sell cycling
 """
 
 import asyncio
+import dataclasses
+import time
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
 from typing import Optional, Set, List
 
 from lithood.client import LighterClient
 from lithood.state import StateManager
-from lithood.types import Order, OrderSide, MarketType, OrderStatus
-from lithood.config import SPOT_SYMBOL
+from lithood.types import Order, OrderSide, MarketType, OrderStatus, OrderType
+from lithood.config import PRICE_QUANTUM, SPOT_SYMBOL
+from lithood.grid_book import GridBook
+from lithood.instrumentation import metrics, timed
+from lithood.ladder import PriceLadder
 from lithood.logger import log
 
+# Client order indices of this engine's orders are scoped to this name (see StateManager.reserve_client_order)
+ORDER_SOURCE = "infinite_grid"
+
+
+def grid_level(price: Decimal) -> int:
+    """Grid level of a price: the price in PRICE_QUANTUM ticks, stable across recenters."""
+    return int(price.quantize(PRICE_QUANTUM).scaleb(-PRICE_QUANTUM.as_tuple().exponent))
+
 
 class InfiniteGridConfig:
     """Configuration for infinite grid."""
@@ -40,31 +54,76 @@ class InfiniteGridConfig:
 class InfiniteGridEngine:
     """Manages infinite grid trading with adaptive recentering."""
 
-    # Reconciliation interval in seconds (30 minutes)
+    # Full reconciliation interval in seconds (30 minutes); check_fills
+    # reconciles the levels that changed on every tick
     RECONCILE_INTERVAL = 30 * 60
 
-    def __init__(self, client: LighterClient, state: StateManager, config: InfiniteGridConfig = None):
+    # Orders younger than this are not checked for fills (exchange state may lag placement)
+    FILL_GRACE_SECONDS = 30
+
+    def __init__(
+        self,
+        client: LighterClient,
+        state: StateManager,
+        config: InfiniteGridConfig = None,
+        symbol: str = SPOT_SYMBOL,
+        market_type: MarketType = MarketType.SPOT,
+    ):
+        """Initialize the engine.
+
+        Args:
+            client: Connected client (may be shared by several engines)
+            state: State store; give each engine on a shared database its
+                own StateManager.namespace() so counters don't collide
+            config: Grid configuration
+            symbol: Market symbol to trade
+            market_type: SPOT or PERP
+        """
         self.client = client
         self.state = state
         self.config = config or InfiniteGridConfig()
-        self.symbol = SPOT_SYMBOL
-        self.market_type = MarketType.SPOT
+        self.symbol = symbol
+        self.market_type = market_type
 
         # Grid state
         self._grid_center: Decimal = Decimal("0")
         self._buy_levels: List[Decimal] = []
         self._sell_levels: List[Decimal] = []
 
+        # Levels are rungs of a price ladder anchored at the first center;
+        # a recenter moves the center rung (see _generate_levels)
+        self._ladder: Optional[PriceLadder] = None
+        self._center_index = 0
+        self._buy_ticks: List[int] = []
+        self._sell_ticks: List[int] = []
+
+        # Open orders indexed by rung, mirroring the orders table (see _build_book)
+        self._book: Optional[GridBook] = None
+
         # Reconciliation tracking
         self._last_reconcile_time: Optional[datetime] = None
+        # Ids of untracked exchange orders seen in the last fill check, not adopted yet
+        self._untracked: Set[str] = set()
 
-        # Processing lock to prevent duplicate counter-orders from same partial fill
-        # Uses asyncio.Lock for atomic check-and-add operations
-        self._processing_lock = asyncio.Lock()
-        self._processing_orders: set[str] = set()
+        # Serializes fill handling, recentering and reconciliation so they can
+        # run as independent tasks without mutating the order book concurrently
+        self._book_lock = asyncio.Lock()
 
-    async def initialize(self) -> bool:
-        """Initialize grid centered on current price.
+        # In-memory mirror of the persisted counters (read by metrics without querying)
+        self.stats = {
+            "cycles": int(self.state.get("infinite_grid_cycles", "0")),
+            "profit": Decimal(self.state.get("infinite_grid_profit", "0")),
+            "recenters": int(self.state.get("infinite_grid_recenters", "0")),
+            "buy_fills": int(self.state.get("infinite_grid_buy_fills", "0")),
+            "sell_fills": int(self.state.get("infinite_grid_sell_fills", "0")),
+        }
+
+    async def initialize(self, fresh: bool = False) -> bool:
+        """Resume the grid persisted in state, or start one centered on current price.
+
+        Args:
+            fresh: Cancel every order and start a new grid even if the
+                previous one could be resumed
 
         Returns:
             True if initialization successful, False otherwise
@@ -74,6 +133,14 @@ class InfiniteGridEngine:
             log.error("Failed to get mid price - cannot initialize infinite grid")
             return False
 
+        if not fresh and not self.state.get("grid_paused"):
+            resumed = await self._resume(entry_price)
+            if resumed:
+                return True
+            if resumed is False:
+                log.warning("Could not resume the previous grid - starting a fresh one")
+            self._ladder = self._book = None
+
         # Clear stale orders - abort if cancellation fails
         if not await self._clear_all_grid_orders():
             log.error("Failed to clear existing orders - aborting initialization to prevent order accumulation")
@@ -84,8 +151,9 @@ class InfiniteGridEngine:
             return True  # Not an error, just skipped
 
         self._grid_center = entry_price
+        self._build_book(entry_price)
 
-        log.info(f"Initializing infinite grid. Center: ${entry_price}")
+        log.info(f"Initializing infinite grid on {self.symbol} ({self.market_type.value}). Center: ${entry_price}")
 
         # Generate levels
         self._generate_levels(entry_price)
@@ -97,32 +165,167 @@ class InfiniteGridEngine:
         log.info("Infinite grid initialized")
         return True
 
-    def _generate_levels(self, center: Decimal):
-        """Generate buy and sell price levels around center."""
-        spacing = self.config.level_spacing_pct
+    async def _resume(self, current_price: Decimal) -> Optional[bool]:
+        """Pick up the grid persisted in state instead of cancelling it.
+
+        The ladder is rebuilt from its persisted origin and the levels from
+        the persisted center, then the tracked orders are paired with the
+        exchange's: matches are kept, untracked orders on a free grid level
+        are adopted, and orders off the grid are cancelled. A fill check
+        then counters whatever filled while the bot was down, the grid is
+        recentered if price has moved past its edge, and only levels still
+        empty get new orders.
+
+        Args:
+            current_price: Current market price
+
+        Returns:
+            True if resumed, False if resuming failed, None if state holds
+            no grid this configuration can resume
+        """
+        center = self.state.get("infinite_grid_center")
+        origin = self.state.get("infinite_grid_ladder_origin")
+        spacing = self.state.get("infinite_grid_ladder_spacing")
+        if center is None or origin is None:
+            return None
+        if spacing is None or Decimal(spacing) != self.config.level_spacing_pct:
+            log.info(f"Level spacing changed from {spacing} to {self.config.level_spacing_pct} - not resuming")
+            return None
+
+        market = self.client.get_market(self.symbol, self.market_type)
+        if market is None:
+            log.error(f"Market not found: {self.symbol}_{self.market_type.value}")
+            return False
+        try:
+            exchange_orders = await self.client.get_active_orders(market_id=market.market_id)
+        except Exception as e:
+            log.error(f"Failed to get active orders to resume grid: {e}")
+            return False
+
+        self._build_book(Decimal(origin))
+        self._grid_center = Decimal(center)
+        self._generate_levels(self._grid_center)
+        log.info(
+            f"Resuming infinite grid on {self.symbol} ({self.market_type.value}). "
+            f"Center: ${center}, {len(self._book)} tracked orders, {len(exchange_orders)} on exchange"
+        )
+
+        def on_grid(price: Decimal) -> bool:
+            rung = self._ladder.index_of(self._ladder.to_tick(price))
+            return rung is not None and abs(rung - self._center_index) <= self.config.num_levels
+
+        grid_orders = [o for o in exchange_orders if o.order_type == OrderType.LIMIT]
+        matched, _, unknown = self._book.match(grid_orders)
+        strays = [(order, exchange_order) for order, exchange_order in matched if not on_grid(order.price)]
+        for exchange_order in unknown:
+            if on_grid(exchange_order.price) and self._book.at(exchange_order.side, exchange_order.price) is None:
+                log.info(f"Adopting untracked {exchange_order.side.value} @ ${exchange_order.price}")
+                if self._adopt_orphan(exchange_order):
+                    continue
+            strays.append((None, exchange_order))
+        log.info(f"Resume: keeping {len(grid_orders) - len(strays)} orders, cancelling {len(strays)} strays")
+
+        results = await asyncio.gather(
+            *(self.client.cancel_order(exchange_order.id, market_id=market.market_id) for _, exchange_order in strays)
+        )
+        cancelled = set()
+        for (order, exchange_order), ok in zip(strays, results):
+            if not ok:
+                log.error(f"Failed to cancel stray {exchange_order.side.value} @ ${exchange_order.price}")
+                continue
+            cancelled.add(exchange_order.id)
+            if order is not None:
+                self.state.mark_cancelled(order.id)
+                self._book.remove(order.id)
+
+        async with self._book_lock:
+            await self._check_fills([o for o in grid_orders if o.id not in cancelled])
+            if not await self._check_and_recenter(current_price):
+                log.warning("Recenter failed while resuming - will retry on next iteration")
+            # Levels left empty by fills while down may now be across the market
+            await self._place_initial_orders(self._grid_center, market_price=current_price)
+
+        log.info("Infinite grid resumed")
+        return True
 
-        # Generate buy levels (below center)
-        self._buy_levels = []
-        for i in range(1, self.config.num_levels + 1):
-            price = center * ((1 - spacing) ** i)
-            self._buy_levels.append(price.quantize(Decimal("0.0001")))
+    def _generate_levels(self, center: Decimal):
+        """Generate buy and sell price levels around the ladder rung nearest center.
 
-        # Generate sell levels (above center)
-        self._sell_levels = []
-        for i in range(1, self.config.num_levels + 1):
-            price = center * ((1 + spacing) ** i)
-            price = price.quantize(Decimal("0.0001"))
-            self._sell_levels.append(price)
+        The ladder is built on first use, anchored at center; later calls
+        only move the center rung, so levels the old and new grid share keep
+        their exact price.
+        """
+        if self._ladder is None:
+            self._build_book(center)
+        self._center_index = self._ladder.nearest(self._ladder.to_tick(center))
+        self._buy_ticks, self._sell_ticks = self._ladder.levels(self._center_index, self.config.num_levels)
+        self._buy_levels = [self._ladder.to_price(tick) for tick in self._buy_ticks]
+        self._sell_levels = [self._ladder.to_price(tick) for tick in self._sell_ticks]
 
         log.info(f"Generated {len(self._buy_levels)} buy levels, {len(self._sell_levels)} sell levels")
 
-    async def _place_initial_orders(self, center: Decimal):
-        """Place buy and sell orders."""
-        for price in self._buy_levels:
-            await self._place_grid_buy(price)
+    def _build_book(self, center: Decimal):
+        """Anchor a new price ladder at center and load this market's open orders into a book on it."""
+        market = self.client.get_market(self.symbol, self.market_type)
+        quantum_decimals = -PRICE_QUANTUM.as_tuple().exponent
+        self._ladder = PriceLadder(
+            center, self.config.level_spacing_pct, market.price_decimals if market else quantum_decimals
+        )
+        self._book = GridBook(self._ladder, market.size_decimals if market else quantum_decimals)
+        # Persisted so a restart can rebuild the same ladder (see _resume)
+        self.state.set("infinite_grid_ladder_origin", str(center))
+        self.state.set("infinite_grid_ladder_spacing", str(self.config.level_spacing_pct))
+        if market is not None:
+            self._book.load(
+                self.state.get_pending_orders(market.market_id)
+                + self.state.get_orders_by_status(OrderStatus.PARTIALLY_FILLED, market.market_id)
+            )
+
+    async def _place_initial_orders(self, center: Decimal, market_price: Optional[Decimal] = None):
+        """Place buy and sell orders.
+
+        The whole ladder goes out as one pipelined submission (buys, then
+        sells) instead of one round trip per level. Levels that already have
+        an open order are skipped, as are levels that would cross
+        market_price if given (buys at or above it, sells at or below).
+        """
+        if self.state.get("grid_paused"):
+            return
+
+        market = self.client.get_market(self.symbol, self.market_type)
+        if market is None:
+            log.error(f"Market not found: {self.symbol}_{self.market_type.value}")
+            return
 
-        for price in self._sell_levels:
-            await self._place_grid_sell(price)
+        slots = []
+        for side, levels in ((OrderSide.BUY, self._buy_levels), (OrderSide.SELL, self._sell_levels)):
+            for price in levels:
+                if self._book.at(side, price) is not None:
+                    log.info(f"{side.value.upper()} order already exists at ${price}, skipping placement")
+                elif market_price is not None and (price >= market_price if side == OrderSide.BUY
+                                                   else price <= market_price):
+                    log.info(f"{side.value.upper()} level ${price} would cross ${market_price}, leaving it empty")
+                else:
+                    slots.append((side, price, grid_level(price)))
+
+        claims = await self._claim_client_orders(market.market_id, [(side, level) for side, _, level in slots])
+        to_place = []
+        for (side, price, level), claim in zip(slots, claims):
+            if claim is None:
+                log.error(f"Failed to place grid {side.value} at ${price}: earlier attempt could not be checked")
+            elif isinstance(claim, int):
+                to_place.append((side, price, level, claim))
+
+        orders = await self.client.place_limit_orders(
+            self.symbol, self.market_type,
+            [(side, price, self.config.lit_per_order) for side, price, _, _ in to_place],
+            client_order_indexes=[index for _, _, _, index in to_place],
+        )
+        for (side, price, level, _), order in zip(to_place, orders):
+            if order is None:
+                log.error(f"Failed to place grid {side.value} at ${price}")
+            else:
+                self._record_grid_order(order, level)
 
     async def _clear_all_grid_orders(self, max_retries: int = 3, verify_delay: float = 1.0) -> bool:
         """Cancel all orders on the exchange and verify cancellation.
@@ -143,15 +346,13 @@ class InfiniteGridEngine:
             return False
 
         # Get local pending orders for this market before cancellation
-        local_pending = [
-            o for o in self.state.get_pending_orders()
-            if o.market_id == market.market_id
-        ]
-        local_partial = [
-            o for o in self.state.get_orders_by_status(OrderStatus.PARTIALLY_FILLED)
-            if o.market_id == market.market_id
-        ]
-        local_orders = local_pending + local_partial
+        if self._book is not None:
+            local_orders = self._book.orders()
+        else:
+            local_orders = (
+                self.state.get_pending_orders(market.market_id)
+                + self.state.get_orders_by_status(OrderStatus.PARTIALLY_FILLED, market.market_id)
+            )
 
         if not local_orders:
             # No local orders to cancel, but check exchange for orphans
@@ -190,6 +391,8 @@ class InfiniteGridEngine:
                     for order in local_orders:
                         try:
                             self.state.mark_cancelled(order.id)
+                            if self._book is not None:
+                                self._book.remove(order.id)
                         except Exception as e:
                             log.warning(f"Failed to mark order {order.id} as cancelled: {e}")
                     log.info("All orders successfully cancelled and verified")
@@ -223,76 +426,132 @@ class InfiniteGridEngine:
 
     async def _place_grid_buy(self, price: Decimal) -> Optional[Order]:
         """Place a grid buy order."""
+        return await self._place_grid_order(OrderSide.BUY, price)
+
+    async def _place_grid_sell(self, price: Decimal) -> Optional[Order]:
+        """Place a grid sell order."""
+        return await self._place_grid_order(OrderSide.SELL, price)
+
+    async def _place_grid_order(self, side: OrderSide, price: Decimal) -> Optional[Order]:
+        """Place a grid order, keeping at most one open order per level.
+
+        Duplicates are checked against local state, not the exchange: the
+        order's client order index is reserved before it is sent, and a retry
+        after an attempt with no result asks the exchange for that index
+        rather than placing the order again.
+        """
         if self.state.get("grid_paused"):
             return None
 
-        # Check if order already exists at this price to prevent duplicates
         market = self.client.get_market(self.symbol, self.market_type)
-        if market is not None:
-            try:
-                active_orders = await self.client.get_active_orders(market_id=market.market_id)
-                # Quantize prices for comparison to handle precision differences
-                target_price = price.quantize(Decimal("0.0001"))
-                existing = [o for o in active_orders
-                           if o.price.quantize(Decimal("0.0001")) == target_price and o.side == OrderSide.BUY]
-                if existing:
-                    log.info(f"BUY order already exists at ${price}, skipping placement")
-                    return existing[0]
-            except Exception as e:
-                log.warning(f"Failed to check for existing buy order at ${price}: {e}")
+        if market is None:
+            log.error(f"Market not found: {self.symbol}_{self.market_type.value}")
+            return None
+
+        level = grid_level(price)
+        existing = self._book.at(side, price)
+        if existing is not None:
+            log.info(f"{side.value.upper()} order already exists at ${price}, skipping placement")
+            return existing
+
+        claim = (await self._claim_client_orders(market.market_id, [(side, level)]))[0]
+        if claim is None:
+            log.error(f"Failed to place grid {side.value} at ${price}: earlier attempt could not be checked")
+            return None
+        if isinstance(claim, Order):
+            return claim
 
         order = await self.client.place_limit_order(
             symbol=self.symbol,
             market_type=self.market_type,
-            side=OrderSide.BUY,
+            side=side,
             price=price,
             size=self.config.lit_per_order,
+            client_order_index=claim,
         )
         if order is None:
-            log.error(f"Failed to place grid buy at ${price}")
+            log.error(f"Failed to place grid {side.value} at ${price}")
             return None
 
-        self.state.save_order(order)
-        log.info(f"INF-GRID BUY: {self.config.lit_per_order} LIT @ ${price}")
+        self._record_grid_order(order, level)
         return order
 
-    async def _place_grid_sell(self, price: Decimal) -> Optional[Order]:
-        """Place a grid sell order."""
-        if self.state.get("grid_paused"):
-            return None
+    async def _claim_client_orders(self, market_id: int, slots: list[tuple[OrderSide, int]]) -> list:
+        """Reserve the client order index for each order about to be placed.
 
-        # Check if order already exists at this price to prevent duplicates
-        market = self.client.get_market(self.symbol, self.market_type)
-        if market is not None:
-            try:
-                active_orders = await self.client.get_active_orders(market_id=market.market_id)
-                # Quantize prices for comparison to handle precision differences
-                target_price = price.quantize(Decimal("0.0001"))
-                existing = [o for o in active_orders
-                           if o.price.quantize(Decimal("0.0001")) == target_price and o.side == OrderSide.SELL]
-                if existing:
-                    log.info(f"SELL order already exists at ${price}, skipping placement")
-                    return existing[0]
-            except Exception as e:
-                log.warning(f"Failed to check for existing sell order at ${price}: {e}")
+        An index left over from an attempt whose outcome is unknown is looked
+        up on the exchange first (one lookup for all of them). If that order
+        got there it is recorded instead of being placed again; if it was
+        cancelled on arrival, the level moves on to a fresh index.
 
-        order = await self.client.place_limit_order(
-            symbol=self.symbol,
-            market_type=self.market_type,
-            side=OrderSide.SELL,
-            price=price,
-            size=self.config.lit_per_order,
-        )
-        if order is None:
-            log.error(f"Failed to place grid sell at ${price}")
-            return None
+        Args:
+            market_id: Market of the orders
+            slots: (side, grid level) per order
 
+        Returns:
+            Per slot: the index to place the order with, the Order an earlier
+            attempt already placed, or None if the exchange could not be asked
+        """
+        claims = [self.state.reserve_client_order(ORDER_SOURCE, market_id, side, level) for side, level in slots]
+        unresolved = [index for index, pending in claims if pending]
+        found = await self.client.get_orders_by_client_index(unresolved) if unresolved else {}
+
+        results = []
+        for (side, level), (index, pending) in zip(slots, claims):
+            if not pending:
+                results.append(index)
+            elif found is None:
+                results.append(None)
+            elif index not in found:
+                # The earlier attempt never reached the exchange: send it now
+                results.append(index)
+            elif found[index].status == OrderStatus.CANCELLED:
+                self.state.resolve_client_order(index, found[index].id)
+                results.append(self.state.reserve_client_order(ORDER_SOURCE, market_id, side, level)[0])
+            else:
+                order = found[index]
+                log.info(f"{side.value.upper()} order {order.id} from an earlier attempt is on the exchange, "
+                         f"recording it")
+                # Track it from scratch so check_fills picks up any fills since
+                order.status = OrderStatus.PENDING
+                order.filled_size = Decimal("0")
+                self._record_grid_order(order, level)
+                results.append(order)
+        return results
+
+    def _record_grid_order(self, order: Order, level: int):
+        """Save a placed grid order (resolving its client order index) and log it."""
+        order.grid_level = level
         self.state.save_order(order)
-        log.info(f"INF-GRID SELL: {self.config.lit_per_order} LIT @ ${price}")
-        return order
+        self._book.add(order)
+        log.info(
+            "INF-GRID %s: %s LIT @ $%s", order.side.value.upper(), order.size, order.price,
+            extra={"order_id": order.id, "market": self.symbol, "side": order.side.value, "price": str(order.price)},
+        )
+
+    @property
+    def book_version(self) -> int:
+        """Changes made to the open-order book so far (see check_fills)."""
+        return self._book.version if self._book is not None else 0
+
+    async def check_fills(self, active_orders: Optional[List[Order]] = None, book_version: Optional[int] = None):
+        """Check for filled orders and cycle. Ratchet floor on profitable cycles.
 
-    async def check_fills(self):
-        """Check for filled orders and cycle. Ratchet floor on profitable cycles."""
+        Args:
+            active_orders: This market's active orders if the caller already
+                fetched them (e.g. one snapshot shared by several engines)
+            book_version: book_version read before active_orders was fetched;
+                if the book has changed since, the snapshot is stale and
+                this check is skipped
+        """
+        async with self._book_lock:
+            if book_version is not None and book_version != self.book_version:
+                log.debug("Skipping fill check: the order book changed after the snapshot was taken")
+                return
+            await self._check_fills(active_orders)
+
+    @timed("check_fills")
+    async def _check_fills(self, active_orders: Optional[List[Order]] = None):
         if self.state.get("grid_paused"):
             return
 
@@ -301,60 +560,74 @@ class InfiniteGridEngine:
             log.error(f"Market not found: {self.symbol}_{self.market_type.value}")
             return
 
-        try:
-            active_orders = await self.client.get_active_orders(market_id=market.market_id)
-        except Exception as e:
-            log.error(f"Failed to get active orders: {e}")
+        if self._book is None:
+            log.error("Cannot check fills: grid not initialized")
             return
 
-        # Use order ID for matching (fixes map collision when multiple orders at same price/side)
-        active_by_id = {o.id: o for o in active_orders}
-        # Keep price/side map as fallback for orders placed before this fix
-        active_by_price_side = {(o.price, o.side): o for o in active_orders}
-
-        grace_cutoff = datetime.now() - timedelta(seconds=30)
-
-        # Check our pending and partially filled orders
-        # (partially filled orders need continued monitoring for more fills)
-        orders_to_check = (
-            self.state.get_pending_orders()
-            + self.state.get_orders_by_status(OrderStatus.PARTIALLY_FILLED)
-        )
-        for order in orders_to_check:
-            if order.market_id != market.market_id:
-                continue
-            if order.created_at > grace_cutoff:
-                continue
-
-            # Atomic check-and-add to prevent duplicate counter-orders
-            async with self._processing_lock:
-                if order.id in self._processing_orders:
-                    continue
-                self._processing_orders.add(order.id)
-
+        if active_orders is None:
             try:
-                # Try ID match first, fall back to price/side for backward compatibility
-                exchange_order = active_by_id.get(order.id)
-                if exchange_order is None:
-                    exchange_order = active_by_price_side.get((order.price, order.side))
+                active_orders = await self.client.get_active_orders(market_id=market.market_id)
+            except Exception as e:
+                log.error(f"Failed to get active orders: {e}")
+                return
+
+        # Pair the snapshot with our pending and partially filled orders (by id,
+        # else price/side), looking only at levels whose orders changed since
+        # the last snapshot - unless an unchanged level disagrees with the book,
+        # then at all of them. Orders in their grace period are left out.
+        # Missing orders filled; matched ones may have new partial fills.
+        grid_orders = [o for o in active_orders if o.order_type == OrderType.LIMIT]
+        placed_before = time.time() - self.FILL_GRACE_SECONDS
+        changes = self._book.changes(grid_orders, placed_before=placed_before)
+        if changes is None:
+            metrics.count("reconcile_full_passes")
+            changes = self._book.match(grid_orders, placed_before=placed_before)
+        matched, missing, unknown = changes
+
+        # An untracked order may be one just cancelled, still in a stale
+        # snapshot. Adopt it only if it carries a client order index we sent
+        # but never recorded, or it was in the previous snapshot too and is
+        # past the grace period; anything else is left to reconcile_orders.
+        previous, self._untracked = self._untracked, set()
+        for exchange_order in unknown:
+            index = exchange_order.client_order_index
+            if (index and self.state.is_unresolved_client_order(ORDER_SOURCE, index)) or (
+                exchange_order.id in previous and exchange_order.created_at.timestamp() <= placed_before
+            ):
+                log.warning(f"Adopting untracked grid {exchange_order.side.value} @ ${exchange_order.price}")
+                self._adopt_orphan(exchange_order)
+            else:
+                self._untracked.add(exchange_order.id)
+                self._book.recheck(exchange_order)
+        to_check = [(order, None) for order in missing]
+        to_check += [(order, exchange_order) for order, exchange_order in matched
+                     if exchange_order.filled_size > order.filled_size]
+
+        # Record every detected fill before placing any counter-order, so a
+        # level whose order just filled is not mistaken for one still open
+        detected: list[tuple[Order, Decimal]] = []
+        for order, exchange_order in to_check:
+            if exchange_order is None:
+                # Order is no longer active - fully filled; the counter-order
+                # covers only what partial fills have not already countered
+                self.state.mark_filled(order.id, order.size)
+                self._book.remove(order.id)
+                detected.append((order, order.size - order.filled_size))
+            else:
+                # Order is still active but has new partial fill
+                new_fill_amount = exchange_order.filled_size - order.filled_size
+                log.info(
+                    f"Partial fill detected: {new_fill_amount:.4f} of {order.size:.4f} "
+                    f"@ ${order.price} ({order.side.value})"
+                )
+                # Update local state with new filled amount (keep as PARTIALLY_FILLED)
+                self.state.mark_partially_filled(order.id, exchange_order.filled_size)
+                self._book.record_fill(order.id, exchange_order.filled_size)
+                detected.append((order, new_fill_amount))
 
-                if exchange_order is None:
-                    # Order is no longer active - fully filled
-                    await self._on_full_fill(order)
-                elif exchange_order.filled_size > order.filled_size:
-                    # Order is still active but has new partial fill
-                    new_fill_amount = exchange_order.filled_size - order.filled_size
-                    log.info(
-                        f"Partial fill detected: {new_fill_amount:.4f} of {order.size:.4f} "
-                        f"@ ${order.price} ({order.side.value})"
-                    )
-                    # Update local state with new filled amount (keep as PARTIALLY_FILLED)
-                    self.state.mark_partially_filled(order.id, exchange_order.filled_size)
-                    # Place counter-order for only the newly filled portion
-                    await self._place_counter_order(order, new_fill_amount)
-            finally:
-                async with self._processing_lock:
-                    self._processing_orders.discard(order.id)
+        for order, filled_size in detected:
+            if filled_size > 0:
+                await self._place_counter_order(order, filled_size)
 
     async def _on_full_fill(self, order: Order):
         """Handle full fill - mark filled and place counter-order for remaining size."""
@@ -363,6 +636,7 @@ class InfiniteGridEngine:
 
         # Mark the order as fully filled
         self.state.mark_filled(order.id, order.size)
+        self._book.remove(order.id)
 
         # Only place counter-order for the remaining unfilled portion
         if remaining_size > 0:
@@ -378,29 +652,16 @@ class InfiniteGridEngine:
 
         if order.side == OrderSide.BUY:
             # Buy filled -> sell 2% higher
-            sell_price = (order.price * (1 + spacing)).quantize(Decimal("0.0001"))
-            log.info(f"BUY FILLED @ ${order.price} ({filled_size} LIT) -> sell @ ${sell_price}")
+            sell_price = self._ladder.counter_price(order.side, order.price)
+            log.info(
+                "BUY FILLED @ $%s (%s LIT) -> sell @ $%s", order.price, filled_size, sell_price,
+                extra={"order_id": order.id, "market": self.symbol, "side": "buy", "price": str(order.price)},
+            )
             counter_order = await self._place_grid_sell(sell_price)
 
             if counter_order is None:
                 if retry_count < max_retries:
-                    # Check if order already exists at this price (placement may have succeeded)
-                    market = self.client.get_market(self.symbol, self.market_type)
-                    if market is not None:
-                        try:
-                            active_orders = await self.client.get_active_orders(market_id=market.market_id)
-                            existing = [o for o in active_orders if o.price == sell_price and o.side == OrderSide.SELL]
-                            if existing:
-                                log.info(f"Order already exists at ${sell_price} SELL, skipping retry")
-                                counter_order = existing[0]
-                                # Save to local state if not already tracked
-                                self.state.save_order(counter_order)
-                                fills = int(self.state.get("infinite_grid_buy_fills", "0"))
-                                self.state.set("infinite_grid_buy_fills", str(fills + 1))
-                                return
-                        except Exception as e:
-                            log.warning(f"Failed to check for existing order: {e}")
-
+                    # A retry looks up the same client order index, so it cannot double-place
                     log.warning(f"Counter-order failed, retrying ({retry_count + 1}/{max_retries})...")
                     await asyncio.sleep(2 ** retry_count)  # Exponential backoff
                     await self._place_counter_order(order, filled_size, retry_count + 1)
@@ -410,42 +671,22 @@ class InfiniteGridEngine:
                               f"Order lost at ${sell_price}")
                     return
 
-            fills = int(self.state.get("infinite_grid_buy_fills", "0"))
-            self.state.set("infinite_grid_buy_fills", str(fills + 1))
+            self._bump_stat("buy_fills")
 
         else:
             # Sell filled -> buy 2% lower
-            buy_price = (order.price * (1 - spacing)).quantize(Decimal("0.0001"))
+            buy_price = self._ladder.counter_price(order.side, order.price)
             profit = filled_size * order.price * spacing  # Approximate profit
 
-            log.info(f"SELL FILLED @ ${order.price} ({filled_size} LIT) -> buy @ ${buy_price} (profit ~${profit:.2f})")
+            log.info(
+                "SELL FILLED @ $%s (%s LIT) -> buy @ $%s (profit ~$%.2f)", order.price, filled_size, buy_price, profit,
+                extra={"order_id": order.id, "market": self.symbol, "side": "sell", "price": str(order.price)},
+            )
             counter_order = await self._place_grid_buy(buy_price)
 
             if counter_order is None:
                 if retry_count < max_retries:
-                    # Check if order already exists at this price (placement may have succeeded)
-                    market = self.client.get_market(self.symbol, self.market_type)
-                    if market is not None:
-                        try:
-                            active_orders = await self.client.get_active_orders(market_id=market.market_id)
-                            existing = [o for o in active_orders if o.price == buy_price and o.side == OrderSide.BUY]
-                            if existing:
-                                log.info(f"Order already exists at ${buy_price} BUY, skipping retry")
-                                counter_order = existing[0]
-                                # Save to local state if not already tracked
-                                self.state.save_order(counter_order)
-                                # Update profit tracking
-                                total_profit = Decimal(self.state.get("infinite_grid_profit", "0"))
-                                total_profit += profit
-                                self.state.set("infinite_grid_profit", str(total_profit))
-                                fills = int(self.state.get("infinite_grid_sell_fills", "0"))
-                                self.state.set("infinite_grid_sell_fills", str(fills + 1))
-                                cycles = int(self.state.get("infinite_grid_cycles", "0"))
-                                self.state.set("infinite_grid_cycles", str(cycles + 1))
-                                return
-                        except Exception as e:
-                            log.warning(f"Failed to check for existing order: {e}")
-
+                    # A retry looks up the same client order index, so it cannot double-place
                     log.warning(f"Counter-order failed, retrying ({retry_count + 1}/{max_retries})...")
                     await asyncio.sleep(2 ** retry_count)  # Exponential backoff
                     await self._place_counter_order(order, filled_size, retry_count + 1)
@@ -456,15 +697,14 @@ class InfiniteGridEngine:
                     return
 
             # Update profit tracking
-            total_profit = Decimal(self.state.get("infinite_grid_profit", "0"))
-            total_profit += profit
-            self.state.set("infinite_grid_profit", str(total_profit))
+            self._bump_stat("profit", profit)
+            self._bump_stat("sell_fills")
+            self._bump_stat("cycles")
 
-            fills = int(self.state.get("infinite_grid_sell_fills", "0"))
-            self.state.set("infinite_grid_sell_fills", str(fills + 1))
-
-            cycles = int(self.state.get("infinite_grid_cycles", "0"))
-            self.state.set("infinite_grid_cycles", str(cycles + 1))
+    def _bump_stat(self, key: str, delta=1):
+        """Increment a grid counter in memory and persist it."""
+        self.stats[key] += delta
+        self.state.set(f"infinite_grid_{key}", str(self.stats[key]))
 
     async def check_and_recenter(self, current_price: Decimal) -> bool:
         """Check if price has reached grid edge and recenter if needed.
@@ -475,7 +715,11 @@ class InfiniteGridEngine:
         Returns:
             True if no recenter needed or recenter successful, False if recenter failed
         """
-        if not self._buy_levels or not self._sell_levels:
+        async with self._book_lock:
+            return await self._check_and_recenter(current_price)
+
+    async def _check_and_recenter(self, current_price: Decimal) -> bool:
+        if not self._buy_ticks or not self._sell_ticks:
             return True
 
         threshold = self.config.recenter_threshold
@@ -483,23 +727,28 @@ class InfiniteGridEngine:
         # Ensure threshold doesn't exceed list length
         if threshold <= 0:
             return True
-        sell_threshold = min(threshold, len(self._sell_levels))
-        buy_threshold = min(threshold, len(self._buy_levels))
+        sell_threshold = min(threshold, len(self._sell_ticks))
+        buy_threshold = min(threshold, len(self._buy_ticks))
 
         # Near top? (price approaching highest sell)
-        if current_price >= self._sell_levels[-sell_threshold]:
+        if self._ladder.to_tick(current_price, ROUND_FLOOR) >= self._sell_ticks[-sell_threshold]:
             log.info(f"Price ${current_price} near top of grid - recentering")
             return await self._recenter(current_price)
 
         # Near bottom? (price approaching lowest buy)
-        if current_price <= self._buy_levels[-buy_threshold]:
+        if self._ladder.to_tick(current_price, ROUND_CEILING) <= self._buy_ticks[-buy_threshold]:
             log.info(f"Price ${current_price} near bottom of grid - recentering")
             return await self._recenter(current_price)
 
         return True
 
+    @timed("recenter")
     async def _recenter(self, new_center: Decimal) -> bool:
-        """Cancel all orders and rebuild grid around new center.
+        """Rebuild grid around new center.
+
+        Resting orders are moved onto the new levels (see _shift_orders); if
+        that cannot be done cleanly, every order is cancelled instead, as
+        before. Empty levels are then filled.
 
         Args:
             new_center: New center price for the grid
@@ -509,30 +758,126 @@ class InfiniteGridEngine:
         """
         log.info(f"RECENTERING grid from ${self._grid_center} to ${new_center}")
 
-        # Cancel all existing orders - abort if cancellation fails
-        if not await self._clear_all_grid_orders():
-            log.error(
-                f"Failed to clear orders during recenter - aborting to prevent order accumulation. "
-                f"Grid center remains at ${self._grid_center}"
-            )
-            return False
+        old_grid = self._grid_levels_state()
+
+        # Regenerate levels (floor is preserved)
+        self._generate_levels(new_center)
+
+        if not await self._shift_orders():
+            # Cancel all existing orders - abort if cancellation fails
+            log.warning("Could not move all orders onto the new levels - cancelling all orders")
+            if not await self._clear_all_grid_orders():
+                self._restore_grid_levels(old_grid)
+                log.error(
+                    f"Failed to clear orders during recenter - aborting to prevent order accumulation. "
+                    f"Grid center remains at ${self._grid_center}"
+                )
+                return False
 
         # Update center
         self._grid_center = new_center
         self.state.set("infinite_grid_center", str(new_center))
 
-        # Regenerate levels (floor is preserved)
-        self._generate_levels(new_center)
-
-        # Place new orders
+        # Place orders on the levels still empty
         await self._place_initial_orders(new_center)
 
-        recenters = int(self.state.get("infinite_grid_recenters", "0"))
-        self.state.set("infinite_grid_recenters", str(recenters + 1))
+        self._bump_stat("recenters")
 
         log.info(f"Grid recentered. New center: ${new_center}")
         return True
 
+    def _grid_levels_state(self) -> tuple:
+        return (self._grid_center, self._center_index, self._buy_ticks, self._sell_ticks,
+                self._buy_levels, self._sell_levels)
+
+    def _restore_grid_levels(self, saved: tuple):
+        (self._grid_center, self._center_index, self._buy_ticks, self._sell_ticks,
+         self._buy_levels, self._sell_levels) = saved
+
+    async def _shift_orders(self) -> bool:
+        """Move resting grid orders onto the current levels.
+
+        Orders already on a level of their side stay where they are. Other
+        untouched orders are modified onto the free levels of their side
+        (nearest first) - one transaction each, all pipelined together -
+        and whatever is left over, including partially filled orders, is
+        cancelled. Orders no longer on the exchange are left to check_fills.
+
+        Returns:
+            True if every order was kept, moved or cancelled, False otherwise
+        """
+        market = self.client.get_market(self.symbol, self.market_type)
+        if market is None:
+            log.error("Cannot shift orders: market not found")
+            return False
+
+        try:
+            exchange_orders = await self.client.get_active_orders(market_id=market.market_id)
+        except Exception as e:
+            log.warning(f"Failed to get active orders for recenter: {e}")
+            return False
+        # New levels as rungs: the center rung +/- 1..n
+        rungs = {
+            OrderSide.BUY: [self._center_index - i for i in range(1, len(self._buy_ticks) + 1)],
+            OrderSide.SELL: [self._center_index + i for i in range(1, len(self._sell_ticks) + 1)],
+        }
+        level_rungs = {side: set(side_rungs) for side, side_rungs in rungs.items()}
+
+        matched, _, _ = self._book.match(exchange_orders)
+        held: Set[tuple] = set()
+        leftovers = []
+        for order, exchange_order in matched:
+            key = (order.side, self._book.rung_of(order.id))
+            if order.status == OrderStatus.PENDING and key[1] in level_rungs[order.side] and key not in held:
+                held.add(key)
+            else:
+                leftovers.append((order, exchange_order))
+
+        free = {side: [r for r in side_rungs if (side, r) not in held] for side, side_rungs in rungs.items()}
+        moves, cancels = [], []
+        for order, exchange_order in leftovers:
+            if order.status == OrderStatus.PENDING and exchange_order.filled_size == 0 and free[order.side]:
+                moves.append((order, exchange_order, self._ladder.price(free[order.side].pop(0))))
+            else:
+                cancels.append((order, exchange_order))
+
+        if not moves and not cancels:
+            return True
+        log.info(f"Recenter: keeping {len(held)} orders, moving {len(moves)}, cancelling {len(cancels)}")
+
+        results = await asyncio.gather(
+            *(self.client.modify_order(dataclasses.replace(order, id=exchange_order.id), price)
+              for order, exchange_order, price in moves),
+            *(self.client.cancel_order(exchange_order.id, market_id=market.market_id)
+              for _, exchange_order in cancels),
+        )
+
+        # Free the cancelled orders' levels before moved orders take them
+        ok = True
+        for (order, _), cancelled in zip(cancels, results[len(moves):]):
+            if cancelled:
+                self.state.mark_cancelled(order.id)
+                self._book.remove(order.id)
+            else:
+                log.error(f"Failed to cancel grid {order.side.value} @ ${order.price}")
+                ok = False
+        for (order, _, price), modified in zip(moves, results):
+            if modified is None:
+                log.error(f"Failed to move grid {order.side.value} @ ${order.price} to ${price}")
+                ok = False
+                continue
+            if modified.id != order.id:
+                self.state.mark_cancelled(order.id)
+            self._book.remove(order.id)
+            modified.grid_level = grid_level(price)
+            self.state.save_order(modified)
+            self._book.add(modified)
+            log.info(
+                "INF-GRID %s: moved %s LIT $%s -> $%s", order.side.value.upper(), modified.size, order.price, price,
+                extra={"order_id": modified.id, "market": self.symbol, "side": order.side.value, "price": str(price)},
+            )
+        return ok
+
     def pause(self):
         """Pause grid trading."""
         self.state.set("grid_paused", True)
@@ -557,12 +902,25 @@ class InfiniteGridEngine:
             "center": self._grid_center,
             "buy_levels": len(self._buy_levels),
             "sell_levels": len(self._sell_levels),
-            "cycles": int(self.state.get("infinite_grid_cycles", "0")),
-            "profit": Decimal(self.state.get("infinite_grid_profit", "0")),
-            "recenters": int(self.state.get("infinite_grid_recenters", "0")),
+            "open_buys": self._book.count(OrderSide.BUY) if self._book else 0,
+            "open_sells": self._book.count(OrderSide.SELL) if self._book else 0,
+            "cycles": self.stats["cycles"],
+            "profit": self.stats["profit"],
+            "recenters": self.stats["recenters"],
             "paused": self.state.get("grid_paused", False),
         }
 
+    def _adopt_orphan(self, order: Order) -> bool:
+        """Track an exchange order missing from local state as a grid order."""
+        try:
+            order.grid_level = grid_level(order.price)
+            self.state.save_order(order)
+            self._book.add(order)
+            return True
+        except Exception as e:
+            log.error(f"Failed to save orphan order {order.id}: {e}")
+            return False
+
     async def maybe_reconcile(self) -> bool:
         """Run reconciliation if enough time has passed. Returns True if reconciliation ran."""
         now = datetime.now()
@@ -585,6 +943,10 @@ class InfiniteGridEngine:
         2. Orphan orders: On exchange but not in local state (shouldn't happen, but log if found)
         3. Count mismatch: Total open orders doesn't match expected
         """
+        async with self._book_lock:
+            await self._reconcile_orders()
+
+    async def _reconcile_orders(self):
         log.info("=" * 50)
         log.info("  ORDER RECONCILIATION CHECK")
         log.info("=" * 50)
@@ -600,55 +962,37 @@ class InfiniteGridEngine:
             log.error(f"Cannot reconcile: failed to get exchange orders: {e}")
             return
 
-        # Get local pending/partially filled orders
-        local_pending = self.state.get_pending_orders()
-        local_partial = self.state.get_orders_by_status(OrderStatus.PARTIALLY_FILLED)
-        local_orders = [o for o in local_pending + local_partial if o.market_id == market.market_id]
+        if self._book is None:
+            log.error("Cannot reconcile: grid not initialized")
+            return
 
-        # Build lookup maps
-        exchange_by_id = {o.id: o for o in exchange_orders}
-        exchange_by_price_side = {(o.price, o.side): o for o in exchange_orders}
-        local_by_id = {o.id: o for o in local_orders}
+        # Pair the snapshot with our pending/partially filled orders in one pass
+        _, ghost_orders, orphan_orders = self._book.match(exchange_orders)
 
         # Count orders by side
         exchange_buys = sum(1 for o in exchange_orders if o.side == OrderSide.BUY)
-        exchange_sells = sum(1 for o in exchange_orders if o.side == OrderSide.SELL)
-        local_buys = sum(1 for o in local_orders if o.side == OrderSide.BUY)
-        local_sells = sum(1 for o in local_orders if o.side == OrderSide.SELL)
+        exchange_sells = len(exchange_orders) - exchange_buys
+        local_buys = self._book.count(OrderSide.BUY)
+        local_sells = self._book.count(OrderSide.SELL)
 
         log.info(f"  Exchange orders: {len(exchange_orders)} ({exchange_buys} buys, {exchange_sells} sells)")
-        log.info(f"  Local orders:    {len(local_orders)} ({local_buys} buys, {local_sells} sells)")
+        log.info(f"  Local orders:    {local_buys + local_sells} ({local_buys} buys, {local_sells} sells)")
 
         issues_found = 0
         orders_fixed = 0
 
-        # Check for ghost orders (in local but not on exchange)
-        ghost_orders = []
-        for order in local_orders:
-            # Try ID match first, then price/side fallback
-            on_exchange = exchange_by_id.get(order.id)
-            if on_exchange is None:
-                on_exchange = exchange_by_price_side.get((order.price, order.side))
-
-            if on_exchange is None:
-                ghost_orders.append(order)
-
+        # Ghost orders: in local but not on exchange
         if ghost_orders:
             issues_found += len(ghost_orders)
             log.warning(f"  Found {len(ghost_orders)} GHOST orders (local but not on exchange):")
 
             # Grace period to avoid processing orders that check_fills already handled
             # or orders that were just placed and haven't synced yet
-            grace_cutoff = datetime.now() - timedelta(seconds=30)
+            grace_cutoff = datetime.now() - timedelta(seconds=self.FILL_GRACE_SECONDS)
 
             for order in ghost_orders:
                 log.warning(f"    - {order.side.value} @ ${order.price} (id={order.id})")
 
-                # Skip if already processed by check_fills (marked FILLED)
-                if order.status == OrderStatus.FILLED:
-                    log.info(f"    -> Already marked FILLED, skipping")
-                    continue
-
                 # Skip recently created orders (may not have synced yet)
                 if order.created_at > grace_cutoff:
                     log.info(f"    -> Order too recent, skipping")
@@ -662,20 +1006,7 @@ class InfiniteGridEngine:
                 except Exception as e:
                     log.error(f"    -> Failed to process ghost order: {e}")
 
-        # Check for orphan orders (on exchange but not in local state)
-        orphan_orders = []
-        for order in exchange_orders:
-            in_local = local_by_id.get(order.id)
-            if in_local is None:
-                # Try price/side match as fallback
-                found = False
-                for local_order in local_orders:
-                    if local_order.price == order.price and local_order.side == order.side:
-                        found = True
-                        break
-                if not found:
-                    orphan_orders.append(order)
-
+        # Orphan orders: on exchange but not in local state
         if orphan_orders:
             issues_found += len(orphan_orders)
             log.warning(f"  Found {len(orphan_orders)} ORPHAN orders (on exchange but not in local state):")
@@ -683,11 +1014,8 @@ class InfiniteGridEngine:
                 log.warning(f"    - {order.side.value} @ ${order.price} (id={order.id})")
                 # Add to local state so we track it
                 log.info(f"    -> Adding to local state...")
-                try:
-                    self.state.save_order(order)
+                if self._adopt_orphan(order):
                     orders_fixed += 1
-                except Exception as e:
-                    log.error(f"    -> Failed to save orphan order: {e}")
 
         # Summary
         if issues_found == 0:
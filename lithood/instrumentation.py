@@ -0,0 +1,238 @@
+# lithood/instrumentation.py
+"""Lightweight timing spans, latency histograms, counters and event-loop lag sampling."""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# Log-linear buckets: 16 sub-buckets per power of two (~6% relative precision)
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + ((value >> shift) & (_SUB_BUCKETS - 1))
+
+
+def _bucket_value(index: int) -> int:
+    """Lower bound of a bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    return (_SUB_BUCKETS + index % _SUB_BUCKETS) << shift
+
+
+class Histogram:
+    """HDR-style log-linear histogram of non-negative integers (e.g. nanoseconds).
+
+    Recording is O(1) with no allocation once a bucket exists, so it is
+    cheap enough to leave on in the trading hot path.
+    """
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, pct: float) -> Optional[int]:
+        """Value at the pct-th percentile (bucket lower bound, clamped to min/max)."""
+        if not self.count:
+            return None
+        target = max(1, int(round(pct / 100 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """(upper bound, cumulative count) pairs in ascending order."""
+        result = []
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            result.append((_bucket_value(index + 1), seen))
+        return result
+
+    def cumulative_counts(self, bounds: list[int]) -> list[int]:
+        """Count of values <= each bound (bounds ascending; exact to bucket precision)."""
+        ordered = sorted(self.counts.items())
+        result = []
+        seen = 0
+        i = 0
+        for bound in bounds:
+            while i < len(ordered) and _bucket_value(ordered[i][0] + 1) - 1 <= bound:
+                seen += ordered[i][1]
+                i += 1
+            result.append(seen)
+        return result
+
+    def reset(self):
+        self.counts.clear()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def snapshot(self, scale: float = 1e-6) -> dict:
+        """Summary stats; the default scale converts nanoseconds to milliseconds."""
+        def _scaled(value):
+            return None if value is None else round(value * scale, 3)
+
+        return {
+            "count": self.count,
+            "mean": _scaled(self.total / self.count) if self.count else None,
+            "p50": _scaled(self.percentile(50)),
+            "p90": _scaled(self.percentile(90)),
+            "p99": _scaled(self.percentile(99)),
+            "max": _scaled(self.max),
+        }
+
+
+# Per-tick counters for the supervised task currently running (see Instrumentation.tick)
+_current_tick: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("lithood_tick", default=None)
+
+
+class Instrumentation:
+    """Registry of named latency histograms and counters."""
+
+    def __init__(self):
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+
+    def histogram(self, name: str) -> Histogram:
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        return hist
+
+    def record_ns(self, name: str, elapsed_ns: int):
+        self.histogram(name).record(elapsed_ns)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+        tick = _current_tick.get()
+        if tick is not None:
+            tick[name] = tick.get(name, 0) + n
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block into the `name` histogram (works around awaits too)."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.histogram(name).record(time.perf_counter_ns() - start)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator timing every call of a sync or async function."""
+        def decorator(func):
+            label = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start = time.perf_counter_ns()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        self.histogram(label).record(time.perf_counter_ns() - start)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.histogram(label).record(time.perf_counter_ns() - start)
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def tick(self, name: str):
+        """Scope one supervised tick: time it and record counters (e.g. API calls) per tick."""
+        counts: dict[str, int] = {}
+        token = _current_tick.set(counts)
+        start = time.perf_counter_ns()
+        try:
+            yield counts
+        finally:
+            _current_tick.reset(token)
+            self.histogram(f"tick.{name}").record(time.perf_counter_ns() - start)
+            self.histogram(f"api_calls_per_tick.{name}").record(counts.get("api_calls", 0))
+
+    def get_stats(self) -> dict:
+        """Histogram summaries (ms for timings, raw for api_calls_per_tick) and counters."""
+        return {
+            "histograms": {
+                name: hist.snapshot(scale=1 if name.startswith("api_calls_per_tick.") else 1e-6)
+                for name, hist in sorted(self.histograms.items())
+            },
+            "counters": dict(self.counters),
+        }
+
+    def reset(self):
+        self.histograms.clear()
+        self.counters.clear()
+
+
+class LoopLagSampler:
+    """Measures event-loop lag: how late a sleep(interval) wakes up."""
+
+    def __init__(self, registry: "Instrumentation", interval: float = 0.5, name: str = "loop_lag"):
+        self.registry = registry
+        self.interval = interval
+        self.name = name
+        self.last_lag_ns = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="loop-lag-sampler")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        interval_ns = int(self.interval * 1e9)
+        while True:
+            expected = time.perf_counter_ns() + interval_ns
+            await asyncio.sleep(self.interval)
+            self.last_lag_ns = max(0, time.perf_counter_ns() - expected)
+            self.registry.record_ns(self.name, self.last_lag_ns)
+
+
+# Process-wide registry
+metrics = Instrumentation()
+span = metrics.span
+timed = metrics.timed
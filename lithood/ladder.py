@@ -0,0 +1,160 @@
+# lithood/ladder.py
+"""Geometric price ladder held as integer price ticks, shared across recenters."""
+
+from bisect import bisect_left
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import List, Optional
+
+from lithood.types import OrderSide
+
+
+class PriceLadder:
+    """Grid price levels as a sorted list of integer ticks.
+
+    Rung k is origin * (1 + spacing) ** k, rounded to a tick of
+    10 ** -price_decimals. Rungs are computed once (and extended on demand),
+    so a grid centered anywhere on the ladder is an index range: recentering
+    shifts the center index instead of recomputing prices, levels that both
+    grids share keep the same price, and the counter-order for a fill on
+    rung k is rung k +/- 1.
+    """
+
+    def __init__(self, origin: Decimal, spacing: Decimal, price_decimals: int, span: int = 128):
+        """Initialize the ladder.
+
+        Args:
+            origin: Price of rung 0 (usually the first grid center)
+            spacing: Geometric spacing between rungs (e.g. 0.02 = 2%)
+            price_decimals: Decimal places of a price tick
+            span: Rungs to precompute on each side of the origin
+        """
+        if spacing <= 0:
+            raise ValueError(f"Ladder spacing must be positive, got {spacing}")
+        self.spacing = Decimal(spacing)
+        self.price_decimals = price_decimals
+        self._step = 1 + self.spacing
+        origin_tick = self.to_tick(Decimal(origin))
+        if origin_tick * self.spacing < 1:
+            raise ValueError(f"Ladder spacing {spacing} is below one price tick at {origin}")
+
+        # _ticks[i] is rung i - _zero; _top/_bottom are the exact (unrounded) end rungs
+        self._ticks: List[int] = [origin_tick]
+        self._zero = 0
+        self._top = self._bottom = Decimal(origin_tick)
+        self._extend_up(span)
+        self._extend_down(span)
+
+    # -------------------------------------------------------------------------
+    # Conversion
+    # -------------------------------------------------------------------------
+
+    def to_tick(self, price: Decimal, rounding: str = ROUND_HALF_EVEN) -> int:
+        """Price in ticks (round with ROUND_FLOOR / ROUND_CEILING for exact >= / <= tests)."""
+        return int(price.scaleb(self.price_decimals).to_integral_value(rounding=rounding))
+
+    def to_price(self, tick: int) -> Decimal:
+        """Price of a tick."""
+        return Decimal(tick).scaleb(-self.price_decimals)
+
+    # -------------------------------------------------------------------------
+    # Rungs
+    # -------------------------------------------------------------------------
+
+    @property
+    def lowest(self) -> int:
+        """Index of the lowest rung (the ladder stops before prices reach zero)."""
+        return -self._zero
+
+    def tick(self, index: int) -> int:
+        """Tick of rung `index`, extending the ladder if needed."""
+        top = len(self._ticks) - 1 - self._zero
+        if index > top:
+            self._extend_up(max(index - top, len(self._ticks)))
+        if index < self.lowest:
+            self._extend_down(max(self.lowest - index, len(self._ticks)))
+            if index < self.lowest:
+                raise IndexError(f"Rung {index} is below the lowest price tick")
+        return self._ticks[index + self._zero]
+
+    def price(self, index: int) -> Decimal:
+        """Price of rung `index`."""
+        return self.to_price(self.tick(index))
+
+    def nearest(self, tick: int) -> int:
+        """Index of the rung closest to `tick` (lower rung on a tie)."""
+        while tick > self._ticks[-1]:
+            self._extend_up(len(self._ticks))
+        while tick < self._ticks[0] and self._extend_down(len(self._ticks)):
+            pass
+        pos = bisect_left(self._ticks, tick)
+        if pos == len(self._ticks):
+            pos -= 1
+        elif pos > 0 and tick - self._ticks[pos - 1] <= self._ticks[pos] - tick:
+            pos -= 1
+        return pos - self._zero
+
+    def index_of(self, tick: int) -> Optional[int]:
+        """Index of the rung at exactly `tick`, or None if `tick` is not on the ladder."""
+        index = self.nearest(tick)
+        return index if self._ticks[index + self._zero] == tick else None
+
+    def levels(self, center: int, num_levels: int) -> tuple[List[int], List[int]]:
+        """Buy and sell level ticks around rung `center`, nearest first.
+
+        Args:
+            center: Rung index of the grid center (no order rests on it)
+            num_levels: Levels per side
+
+        Returns:
+            Tuple of (buy_ticks, sell_ticks); fewer buys if the ladder bottom is reached
+        """
+        sells = [self.tick(center + i) for i in range(1, num_levels + 1)]
+        buys = []
+        for i in range(1, num_levels + 1):
+            if center - i < self.lowest:
+                self._extend_down(num_levels)
+                if center - i < self.lowest:
+                    break
+            buys.append(self.tick(center - i))
+        return buys, sells
+
+    def counter_tick(self, side: OrderSide, tick: int) -> int:
+        """Tick of the counter-order for a fill at `tick`: one rung up for a buy, down for a sell.
+
+        A fill off the ladder (e.g. an order from an earlier ladder) is
+        countered at tick * (1 +/- spacing).
+        """
+        index = self.index_of(tick)
+        if side == OrderSide.BUY:
+            if index is not None:
+                return self.tick(index + 1)
+            return int((tick * self._step).to_integral_value(rounding=ROUND_HALF_EVEN))
+        if index is not None and index - 1 >= self.lowest:
+            return self.tick(index - 1)
+        return int((tick * (1 - self.spacing)).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+    def counter_price(self, side: OrderSide, price: Decimal) -> Decimal:
+        """Price of the counter-order for a fill of `side` at `price` (see counter_tick)."""
+        return self.to_price(self.counter_tick(side, self.to_tick(price)))
+
+    def _extend_up(self, count: int):
+        for _ in range(count):
+            self._top *= self._step
+            self._ticks.append(int(self._top.to_integral_value(rounding=ROUND_HALF_EVEN)))
+
+    def _extend_down(self, count: int) -> bool:
+        """Add up to `count` rungs below the ladder; False once the bottom (one tick) is reached."""
+        added = []
+        for _ in range(count):
+            bottom = self._bottom / self._step
+            tick = int(bottom.to_integral_value(rounding=ROUND_HALF_EVEN))
+            if tick < 1 or tick >= (added[-1] if added else self._ticks[0]):
+                break
+            self._bottom = bottom
+            added.append(tick)
+        if not added:
+            return False
+        added.reverse()
+        self._ticks[:0] = added
+        self._zero += len(added)
+        return True
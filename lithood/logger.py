@@ -1,32 +1,69 @@
 # lithood/logger.py
 """Logging configuration for the bot."""
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 
-from lithood.config import LOG_LEVEL
+from lithood.config import LOG_LEVEL, LOG_FORMAT
 
+# Structured fields picked up from `extra=` (e.g. log.info(..., extra={"order_id": ...}))
+STRUCTURED_FIELDS = ("order_id", "market", "side", "price", "size", "latency_ms")
 
-def setup_logger(name: str = "lithood") -> logging.Logger:
-    """Set up logger with console and file handlers."""
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
 
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with structured fields from `extra=`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock prepare() renders the message on the calling thread; here the
+    record is queued as-is, so %-style args are only formatted in the
+    background (callers must pass values that won't be mutated later).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _build_handlers() -> list[logging.Handler]:
+    """Console and file handlers that run on the listener thread."""
+    if LOG_FORMAT.lower() == "json":
+        console_format = file_format = JsonFormatter()
+    else:
+        console_format = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(message)s",
+            datefmt="%H:%M:%S"
+        )
+        file_format = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+        )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
-    console_format = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%H:%M:%S"
-    )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
 
     # File handler
     log_dir = Path("logs")
@@ -35,12 +72,31 @@ def setup_logger(name: str = "lithood") -> logging.Logger:
 
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
 
+    return [console_handler, file_handler]
+
+
+def setup_logger(name: str = "lithood") -> logging.Logger:
+    """Set up logger with queued console and file handlers.
+
+    The logger itself only enqueues records; formatting and stdout/disk
+    writes happen on a QueueListener thread so log I/O never blocks the
+    event loop. The listener is flushed and stopped at interpreter exit.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
+
+    # Prevent duplicate handlers
+    if logger.handlers:
+        return logger
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(_DeferredQueueHandler(log_queue))
     return logger
 
 
@@ -0,0 +1,138 @@
+# lithood/metrics_server.py
+"""Embedded asyncio HTTP endpoint exposing bot metrics in Prometheus text format."""
+
+import asyncio
+from typing import Callable, Iterable, Optional
+
+from lithood.instrumentation import Histogram, Instrumentation, metrics
+from lithood.logger import log
+
+# Histogram bucket upper bounds in seconds (Prometheus needs a stable set)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collector returns metric families: (name, type, help, [(labels, value), ...])
+MetricFamily = tuple[str, str, str, list[tuple[dict, float]]]
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{str(v)}"' for k, v in sorted(labels.items()))
+    return "{" + inner + "}"
+
+
+def _render_histogram(lines: list[str], name: str, labels: dict, hist: Histogram):
+    bounds_ns = [int(b * 1e9) for b in LATENCY_BUCKETS]
+    for bound, count in zip(LATENCY_BUCKETS, hist.cumulative_counts(bounds_ns)):
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(bound)})} {count}")
+    lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {hist.count}")
+    lines.append(f"{name}_sum{_labels(labels)} {hist.total / 1e9}")
+    lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+
+def render_registry(registry: Instrumentation) -> list[str]:
+    """Render instrumentation counters and timing histograms."""
+    lines = []
+    for name, value in sorted(registry.counters.items()):
+        metric = f"lithood_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+
+    # Dedicated families for loop lag and DB commits, the rest share one by operation
+    dedicated = {"loop_lag": "lithood_event_loop_lag_seconds", "db_commit": "lithood_db_commit_seconds"}
+    for key, metric in dedicated.items():
+        hist = registry.histograms.get(key)
+        if hist is not None:
+            lines.append(f"# TYPE {metric} histogram")
+            _render_histogram(lines, metric, {}, hist)
+
+    operations = [
+        (name, hist) for name, hist in sorted(registry.histograms.items())
+        if name not in dedicated and not name.startswith("api_calls_per_tick.")
+    ]
+    if operations:
+        metric = "lithood_latency_seconds"
+        lines.append(f"# HELP {metric} Operation latency by instrumented span")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, hist in operations:
+            _render_histogram(lines, metric, {"op": name}, hist)
+    return lines
+
+
+class MetricsServer:
+    """Serves GET /metrics from in-memory state; nothing runs until scraped."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+        registry: Instrumentation = metrics,
+    ):
+        """Initialize the server.
+
+        Args:
+            host: Interface to bind (keep on localhost unless scraped remotely)
+            port: TCP port
+            registry: Instrumentation registry to export
+        """
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._collectors: list[Collector] = []
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    def add_collector(self, collector: Collector):
+        """Register a callable returning extra metric families (read from memory only)."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = render_registry(self.registry)
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                log.warning(f"Metrics collector failed: {e}")
+                continue
+            for name, metric_type, help_text, samples in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(labels)} {float(value)}")
+        return "\n".join(lines) + "\n"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        log.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Drain headers
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, content_type, body = "200 OK", "text/plain; version=0.0.4", self.render()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", "not found\n"
+
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,383 @@
+# lithood/montecarlo.py
+"""Monte Carlo stress test of the grid plus hedge against the portfolio floor."""
+
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+from lithood.config import FLOOR_CONFIG, HEDGE_CONFIG
+from lithood.infinite_grid import InfiniteGridConfig
+from lithood.logger import log
+
+SECONDS_PER_YEAR = 365 * 86400
+
+# Steps of returns generated per batch (bounds memory to paths x chunk)
+_CHUNK_STEPS = 256
+
+
+# =============================================================================
+# Path models: each returns a (paths, steps) array of log returns
+# =============================================================================
+
+@dataclass
+class GBM:
+    """Geometric Brownian motion with annualized drift and volatility."""
+    vol: float
+    drift: float = 0.0
+
+    def sample(self, rng: np.random.Generator, paths: int, steps: int, dt: float) -> np.ndarray:
+        mu = (self.drift - 0.5 * self.vol ** 2) * dt
+        return mu + self.vol * math.sqrt(dt) * rng.standard_normal((paths, steps))
+
+
+@dataclass
+class JumpDiffusion:
+    """Merton jump diffusion: GBM plus Poisson jumps with normal log sizes.
+
+    intensity is jumps per year; jump_mean/jump_std are in log-return
+    units (jump_mean=-0.15 is a ~14% gap down).
+    """
+    vol: float
+    intensity: float
+    jump_mean: float
+    jump_std: float
+    drift: float = 0.0
+
+    def sample(self, rng: np.random.Generator, paths: int, steps: int, dt: float) -> np.ndarray:
+        returns = GBM(self.vol, self.drift).sample(rng, paths, steps, dt)
+        counts = rng.poisson(self.intensity * dt, (paths, steps))
+        jumped = counts > 0
+        n = counts[jumped]
+        returns[jumped] += self.jump_mean * n + self.jump_std * np.sqrt(n) * rng.standard_normal(n.size)
+        return returns
+
+
+@dataclass
+class Bootstrap:
+    """Block bootstrap of historical log returns (keeps volatility clustering).
+
+    The historical returns must be sampled at the simulation step.
+    """
+    returns: np.ndarray
+    block: int = 24
+
+    def sample(self, rng: np.random.Generator, paths: int, steps: int, dt: float) -> np.ndarray:
+        returns = np.asarray(self.returns, dtype=np.float64)
+        block = max(1, min(self.block, len(returns)))
+        blocks = -(-steps // block)
+        starts = rng.integers(0, len(returns) - block + 1, (paths, blocks))
+        index = (starts[:, :, None] + np.arange(block)[None, None, :]).reshape(paths, -1)[:, :steps]
+        return returns[index]
+
+
+def log_returns(prices: np.ndarray) -> np.ndarray:
+    """Log returns of a price series."""
+    return np.diff(np.log(np.asarray(prices, dtype=np.float64)))
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+@dataclass
+class BufferStats:
+    """Outcome of one emergency_buffer setting across all paths."""
+    buffer: float
+    trigger_probability: float  # emergency exit fired within the horizon
+    breach_probability: float  # value after the exit ended below the hard floor
+    trigger_days: dict  # percentiles of time to trigger (triggered paths only)
+    mean_exit_value: Optional[float]
+    worst_exit_value: Optional[float]
+    expected_profit: float  # grid profit, stopped at the exit
+    expected_final_value: float  # exit value on triggered paths, end value otherwise
+
+
+@dataclass
+class StressResult:
+    """Monte Carlo summary (amounts in USDC)."""
+    model: str
+    paths: int
+    steps: int
+    step_seconds: float
+    start_value: float
+    floor_value: float
+    buffers: list[BufferStats]
+    final_value_quantiles: dict  # without any emergency exit
+    mean_cycles: float
+    mean_recenters: float
+    mean_hedge_pnl: float
+    hedge_stop_probability: float
+    seconds: float = 0.0
+    params: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _quantiles(values: np.ndarray) -> dict:
+    if values.size == 0:
+        return {}
+    return {f"p{p}": float(v) for p, v in zip(_PERCENTILES, np.percentile(values, _PERCENTILES))}
+
+
+# =============================================================================
+# Simulator
+# =============================================================================
+
+class StressSimulator:
+    """Runs the grid, hedge and floor rules over many paths at once.
+
+    All state is per-path NumPy arrays and each step is a handful of
+    vectorized operations, so cost is O(steps) Python iterations however
+    many paths there are.
+
+    The grid is modelled on a geometric lattice around its center: resting
+    buys below the price and sells above it with one empty slot where the
+    last fill happened. A move through k levels fills k orders, and their
+    counter-orders keep the lattice intact, so the whole grid reduces to a
+    center and a gap index per path. Recenters happen at the same level as
+    in the engine (recenter_threshold from the edge). Differences from the
+    engine: buys sit at (1+s)^-k rather than (1-s)^k, fill detection is
+    immediate, and prices are step closes (no intra-step extremes).
+
+    The hedge follows HedgeManager: a short with a stop at entry x
+    (1 + stop_loss_pct), trailing once price is 10% below entry, re-entry
+    after the cooldown at the bot entry price or on a pullback from the
+    recent high. A triggered stop fills at the step close, so gaps through
+    it are paid in full. Funding accrues at a constant hourly rate.
+
+    Every emergency_buffer candidate is evaluated in the same pass: paths
+    run on regardless and each buffer records the first step at which the
+    portfolio value (spot value plus hedge PnL) fell to it, and the value
+    left after liquidating at that step.
+    """
+
+    def __init__(
+        self,
+        config: InfiniteGridConfig,
+        start_price: float,
+        initial_lit: float,
+        initial_usdc: float = 0.0,
+        hedge_config: dict = HEDGE_CONFIG,
+        floor_value: float = float(FLOOR_CONFIG["floor_value"]),
+        liquidation_slippage: float = 0.01,
+        funding_rate_hourly: float = 0.0,
+        maker_fee: float = 0.0,
+    ):
+        """Initialize the simulator.
+
+        Args:
+            config: Grid configuration
+            start_price: Price at the start of every path
+            initial_lit: Starting LIT inventory
+            initial_usdc: Starting USDC
+            hedge_config: HEDGE_CONFIG-shaped dict (ignored unless enabled)
+            floor_value: Hard floor the emergency exit must protect
+            liquidation_slippage: Fraction lost when dumping LIT on exit
+            funding_rate_hourly: Funding paid to shorts per hour (negative = shorts pay)
+            maker_fee: Fee rate on grid fills
+        """
+        self.config = config
+        self.start_price = float(start_price)
+        self.initial_lit = float(initial_lit)
+        self.initial_usdc = float(initial_usdc)
+        self.hedge_config = hedge_config
+        self.floor_value = float(floor_value)
+        self.liquidation_slippage = float(liquidation_slippage)
+        self.funding_rate_hourly = float(funding_rate_hourly)
+        self.maker_fee = float(maker_fee)
+
+    def run(
+        self,
+        model,
+        paths: int = 10000,
+        horizon_days: float = 30,
+        step_seconds: float = 3600,
+        buffers: Optional[Sequence[float]] = None,
+        seed: int = 0,
+    ) -> StressResult:
+        """Simulate and summarize.
+
+        Args:
+            model: Path model (GBM, JumpDiffusion or Bootstrap)
+            paths: Number of paths
+            horizon_days: Simulated time
+            step_seconds: Step length (also the floor-check cadence)
+            buffers: emergency_buffer values to evaluate
+                (default: FLOOR_CONFIG["emergency_buffer"])
+            seed: RNG seed
+
+        Returns:
+            StressResult
+        """
+        started = time.perf_counter()
+        rng = np.random.default_rng(seed)
+        steps = max(1, int(round(horizon_days * 86400 / step_seconds)))
+        dt = step_seconds / SECONDS_PER_YEAR
+        step_hours = step_seconds / 3600
+        buffer_values = np.array(
+            sorted(buffers) if buffers else [float(FLOOR_CONFIG["emergency_buffer"])], dtype=np.float64
+        )
+
+        cfg = self.config
+        spacing = float(cfg.level_spacing_pct)
+        size = float(cfg.lit_per_order)
+        levels = cfg.num_levels
+        growth = 1.0 + spacing
+        log_growth = math.log(growth)
+        threshold = cfg.recenter_threshold
+        recenter_index = levels - threshold + 1 if 0 < threshold <= levels else math.inf
+
+        hedge = self.hedge_config
+        hedge_on = bool(hedge["enabled"]) and float(hedge["short_size"]) > 0
+        short_size = float(hedge["short_size"]) if hedge_on else 0.0
+        stop_pct = float(hedge["stop_loss_pct"])
+        pullback = float(hedge["reentry_pullback_pct"])
+        cooldown_steps = hedge["re_entry_cooldown_hours"] * 3600 / step_seconds
+
+        # Grid state
+        log_price = np.full(paths, math.log(self.start_price))
+        center = log_price.copy()
+        gap = np.zeros(paths, dtype=np.int64)
+        inventory = np.full(paths, self.initial_lit)
+        cash = np.full(paths, self.initial_usdc)
+        profit = np.zeros(paths)
+        cycles = np.zeros(paths, dtype=np.int64)
+        recenters = np.zeros(paths, dtype=np.int64)
+
+        # Hedge state
+        active = np.full(paths, hedge_on)
+        entry = np.full(paths, self.start_price)
+        stop = entry * (1 + stop_pct)
+        recent_high = entry.copy()
+        last_stop_step = np.full(paths, -np.inf)
+        hedge_realized = np.zeros(paths)
+        stopped_out = np.zeros(paths, dtype=bool)
+
+        # Per-buffer trigger records
+        n_buffers = len(buffer_values)
+        trigger_step = np.full((n_buffers, paths), -1, dtype=np.int64)
+        exit_value = np.zeros((n_buffers, paths))
+        exit_profit = np.zeros((n_buffers, paths))
+
+        start_value = self.initial_usdc + self.initial_lit * self.start_price
+        if start_value <= buffer_values.max():
+            log.warning(f"Start value ${start_value:,.2f} is at or below a buffer - those trigger immediately")
+
+        step = 0
+        while step < steps:
+            chunk = model.sample(rng, paths, min(_CHUNK_STEPS, steps - step), dt)
+            for column in range(chunk.shape[1]):
+                log_price += chunk[:, column]
+                price = np.exp(log_price)
+                level = (log_price - center) / log_growth
+
+                # Price rose through sells above the gap
+                filled_up = np.maximum(np.minimum(np.floor(level), levels) - gap, 0).astype(np.int64)
+                # Price fell through buys below the gap
+                filled_down = np.maximum(gap - np.maximum(np.ceil(level), -levels), 0).astype(np.int64)
+
+                base = np.exp(center)
+                up = filled_up > 0
+                if up.any():
+                    notional = size * base[up] * growth ** (gap[up] + 1) * (growth ** filled_up[up] - 1) / spacing
+                    cash[up] += notional * (1 - self.maker_fee)
+                    inventory[up] -= size * filled_up[up]
+                    profit[up] += notional * spacing
+                    cycles[up] += filled_up[up]
+                    gap[up] += filled_up[up]
+                down = filled_down > 0
+                if down.any():
+                    low = gap[down] - filled_down[down]
+                    notional = size * base[down] * growth ** low * (growth ** filled_down[down] - 1) / spacing
+                    cash[down] -= notional * (1 + self.maker_fee)
+                    inventory[down] += size * filled_down[down]
+                    gap[down] = low
+
+                recenter = (level >= recenter_index) | (level <= -recenter_index)
+                if recenter.any():
+                    center[recenter] = log_price[recenter]
+                    gap[recenter] = 0
+                    recenters[recenter] += 1
+
+                if hedge_on:
+                    np.maximum(recent_high, price, out=recent_high)
+                    hit = active & (price >= stop)
+                    if hit.any():
+                        hedge_realized[hit] += (entry[hit] - price[hit]) * short_size
+                        active[hit] = False
+                        stopped_out[hit] = True
+                        last_stop_step[hit] = step
+                    trail = active & (price < entry * 0.90)
+                    stop = np.where(trail, np.minimum(stop, price * (1 + stop_pct)), stop)
+                    hedge_realized[active] += self.funding_rate_hourly * short_size * price[active] * step_hours
+
+                    ready = ~active & (step - last_stop_step >= cooldown_steps)
+                    at_entry = ready & (price <= self.start_price)
+                    on_pullback = ready & ~at_entry & (price <= recent_high * (1 - pullback))
+                    reenter = at_entry | on_pullback
+                    if reenter.any():
+                        active[reenter] = True
+                        entry[reenter] = price[reenter]
+                        stop[reenter] = price[reenter] * (1 + stop_pct)
+                        recent_high[on_pullback] = price[on_pullback]
+
+                hedge_pnl = hedge_realized + np.where(active, (entry - price) * short_size, 0.0)
+                value = cash + inventory * price + hedge_pnl
+
+                pending = trigger_step < 0
+                if pending.any():
+                    fired = pending & (value[None, :] <= buffer_values[:, None])
+                    if fired.any():
+                        liquidation = value - self.liquidation_slippage * np.abs(inventory) * price
+                        b, p = np.nonzero(fired)
+                        trigger_step[b, p] = step
+                        exit_value[b, p] = liquidation[p]
+                        exit_profit[b, p] = profit[p]
+                step += 1
+
+        final_value = value
+        stats = []
+        for b, buffer in enumerate(buffer_values):
+            fired = trigger_step[b] >= 0
+            exits = exit_value[b][fired]
+            stats.append(BufferStats(
+                buffer=float(buffer),
+                trigger_probability=float(fired.mean()),
+                breach_probability=float((exits < self.floor_value).sum() / paths),
+                trigger_days=_quantiles((trigger_step[b][fired] + 1) * step_seconds / 86400),
+                mean_exit_value=float(exits.mean()) if exits.size else None,
+                worst_exit_value=float(exits.min()) if exits.size else None,
+                expected_profit=float(np.where(fired, exit_profit[b], profit).mean()),
+                expected_final_value=float(np.where(fired, exit_value[b], final_value).mean()),
+            ))
+
+        return StressResult(
+            model=type(model).__name__,
+            paths=paths,
+            steps=steps,
+            step_seconds=step_seconds,
+            start_value=start_value,
+            floor_value=self.floor_value,
+            buffers=stats,
+            final_value_quantiles=_quantiles(final_value),
+            mean_cycles=float(cycles.mean()),
+            mean_recenters=float(recenters.mean()),
+            mean_hedge_pnl=float(hedge_pnl.mean()),
+            hedge_stop_probability=float(stopped_out.mean()),
+            seconds=time.perf_counter() - started,
+            params={
+                "num_levels": cfg.num_levels,
+                "level_spacing_pct": str(cfg.level_spacing_pct),
+                "lit_per_order": str(cfg.lit_per_order),
+                "recenter_threshold": cfg.recenter_threshold,
+                "hedge_short_size": short_size,
+                **{k: v for k, v in vars(model).items() if isinstance(v, (int, float))},
+            },
+        )
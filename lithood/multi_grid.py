@@ -0,0 +1,187 @@
+# lithood/multi_grid.py
+"""Hosts several infinite-grid engines (one per market) on one client and event loop."""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+
+from lithood.client import LighterClient
+from lithood.config import FILL_CHECK_INTERVAL_SECONDS, POLL_INTERVAL_SECONDS
+from lithood.infinite_grid import InfiniteGridConfig, InfiniteGridEngine
+from lithood.logger import log
+from lithood.retry import RETRY_PERSISTENT
+from lithood.state import StateManager
+from lithood.supervisor import SupervisedTask
+from lithood.types import MarketType
+
+
+@dataclass
+class GridSpec:
+    """One market to run a grid on."""
+    symbol: str
+    market_type: MarketType
+    config: InfiniteGridConfig
+
+    @property
+    def key(self) -> str:
+        # Same form as the client's market cache key, e.g. "LIT/USDC_spot"
+        return f"{self.symbol}_{self.market_type.value}"
+
+    @classmethod
+    def parse(cls, value: str) -> "GridSpec":
+        """Parse SYMBOL:TYPE[:AMOUNT[:LEVELS[:SPACING]]], e.g. LIT:perp:200:10:0.02."""
+        parts = value.split(":")
+        if len(parts) < 2:
+            raise ValueError(f"Expected SYMBOL:TYPE[:AMOUNT[:LEVELS[:SPACING]]], got {value}")
+        symbol, market_type = parts[0], MarketType(parts[1])
+        amount = Decimal(parts[2]) if len(parts) > 2 else Decimal("350")
+        levels = int(parts[3]) if len(parts) > 3 else 15
+        spacing = Decimal(parts[4]) if len(parts) > 4 else Decimal("0.02")
+        return cls(symbol, market_type, InfiniteGridConfig(
+            num_levels=levels,
+            level_spacing_pct=spacing,
+            lit_per_order=amount,
+            total_grid_lit=amount * levels * 2,
+            recenter_threshold=2,
+        ))
+
+
+class MultiGridHost:
+    """Runs one InfiniteGridEngine per market over a shared client.
+
+    Engines share the client's connection pool, auth token and signer, and
+    keep their counters and flags in their own StateManager namespace
+    (``<symbol>_<type>:``). Market data is fanned out: each tick fetches
+    every market's mid price concurrently, and one concurrent active-orders
+    snapshot covers every engine's fill check, instead of each engine
+    polling on its own. A market whose snapshot failed is skipped for that
+    tick rather than read as "no orders".
+    """
+
+    def __init__(self, client: LighterClient, state: StateManager, specs: list[GridSpec]):
+        """Initialize the host.
+
+        Args:
+            client: Connected client shared by all engines
+            state: Shared state database
+            specs: Markets to run (one engine each)
+        """
+        keys = [spec.key for spec in specs]
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Duplicate markets in grid specs: {', '.join(keys)}")
+        self.client = client
+        self.state = state
+        self.specs = specs
+        self.engines: dict[str, InfiniteGridEngine] = {
+            spec.key: InfiniteGridEngine(
+                client, state.namespace(spec.key), spec.config,
+                symbol=spec.symbol, market_type=spec.market_type,
+            )
+            for spec in specs
+        }
+        self.prices: dict[str, Decimal] = {}
+        self._market_ids: dict[str, int] = {}
+
+    async def initialize(self, fresh: bool = False) -> bool:
+        """Initialize every engine concurrently.
+
+        Args:
+            fresh: Start new grids instead of resuming the persisted ones
+
+        Returns:
+            True if all engines initialized
+        """
+        for key, engine in self.engines.items():
+            market = self.client.get_market(engine.symbol, engine.market_type)
+            if market is None:
+                log.error(f"Market not found: {key}")
+                return False
+            self._market_ids[key] = market.market_id
+
+        results = await asyncio.gather(
+            *(engine.initialize(fresh) for engine in self.engines.values()), return_exceptions=True
+        )
+        ok = True
+        for key, result in zip(self.engines, results):
+            if result is not True:
+                log.error(f"Grid {key} failed to initialize: {result}")
+                ok = False
+        return ok
+
+    async def refresh_prices(self):
+        """Fetch every market's mid price concurrently."""
+        keys = list(self.engines)
+        prices = await asyncio.gather(
+            *(self.client.get_mid_price(e.symbol, e.market_type) for e in self.engines.values())
+        )
+        for key, price in zip(keys, prices):
+            if price is not None:
+                self.prices[key] = price
+
+    async def check_fills(self):
+        """One active-orders snapshot for all markets, then every engine's fill check.
+
+        The snapshot is fetched outside the engines' locks, so an engine whose
+        book changed meanwhile (e.g. a recenter) skips it.
+        """
+        versions = {key: engine.book_version for key, engine in self.engines.items()}
+        snapshot = await self.client.get_active_orders_by_market(list(self._market_ids.values()))
+        await asyncio.gather(*(
+            engine.check_fills(snapshot[self._market_ids[key]], book_version=versions[key])
+            for key, engine in self.engines.items()
+            if self._market_ids.get(key) in snapshot
+        ))
+
+    async def recenter_if_needed(self):
+        results = await asyncio.gather(*(
+            engine.check_and_recenter(self.prices[key])
+            for key, engine in self.engines.items()
+            if key in self.prices
+        ))
+        if not all(results):
+            log.warning("Recenter failed on at least one grid - will retry on next iteration")
+
+    async def maybe_reconcile(self):
+        await asyncio.gather(*(engine.maybe_reconcile() for engine in self.engines.values()))
+
+    async def cancel_all(self) -> bool:
+        results = await asyncio.gather(*(engine.cancel_all() for engine in self.engines.values()))
+        return all(results)
+
+    def supervised_tasks(self, price_interval: float = 2.0, reconcile_interval: float = 60) -> list[SupervisedTask]:
+        """The host's periodic work, for a Supervisor."""
+        return [
+            SupervisedTask("fills", self.check_fills, interval=FILL_CHECK_INTERVAL_SECONDS, priority=0),
+            SupervisedTask("price", self.refresh_prices, interval=price_interval, priority=1, timeout=15,
+                           backoff=RETRY_PERSISTENT),
+            SupervisedTask("recenter", self.recenter_if_needed, interval=POLL_INTERVAL_SECONDS, priority=2),
+            SupervisedTask("reconcile", self.maybe_reconcile, interval=reconcile_interval, priority=5),
+        ]
+
+    def get_stats(self) -> dict[str, dict]:
+        """Per-market engine stats plus fill counts and the last price."""
+        return {
+            key: {
+                **engine.get_stats(),
+                "buy_fills": engine.stats["buy_fills"],
+                "sell_fills": engine.stats["sell_fills"],
+                "price": self.prices.get(key),
+            }
+            for key, engine in self.engines.items()
+        }
+
+    def collect_metrics(self):
+        """Per-market metric families (in-memory only)."""
+        def per_market(stat: str):
+            return [({"market": key}, engine.stats[stat]) for key, engine in self.engines.items()]
+
+        return [
+            ("lithood_grid_fills_total", "counter", "Grid order fills",
+             [({"market": key, "side": "buy"}, e.stats["buy_fills"]) for key, e in self.engines.items()]
+             + [({"market": key, "side": "sell"}, e.stats["sell_fills"]) for key, e in self.engines.items()]),
+            ("lithood_grid_cycles_total", "counter", "Completed buy/sell cycles", per_market("cycles")),
+            ("lithood_grid_realized_profit_usdc", "gauge", "Approximate realized profit", per_market("profit")),
+            ("lithood_grid_recenters_total", "counter", "Grid recenters", per_market("recenters")),
+            ("lithood_price", "gauge", "Last mid price",
+             [({"market": key}, price) for key, price in self.prices.items()]),
+        ]
@@ -0,0 +1,62 @@
+# lithood/nonce.py
+"""Per-API-key nonce allocation, synced from the exchange once and then assigned locally."""
+
+from typing import Awaitable, Callable, Optional
+
+from lithood.instrumentation import metrics, span
+
+
+class NonceAllocator:
+    """Next nonce for one API key.
+
+    The exchange's next nonce is fetched on first use; after that, nonces are
+    handed out from a local counter so several transactions can be signed and
+    in flight at once. The owner rewinds the counter when transactions it
+    allocated for were never applied, and resyncs when it no longer knows
+    what the exchange has seen.
+    """
+
+    def __init__(self, api_key_index: int, fetch: Callable[[int], Awaitable[int]]):
+        """Initialize the allocator.
+
+        Args:
+            api_key_index: API key slot the nonces belong to
+            fetch: Coroutine returning the exchange's next nonce for an API key
+        """
+        self.api_key_index = api_key_index
+        self._fetch = fetch
+        self._next: Optional[int] = None
+        self.resyncs = 0
+
+    @property
+    def next_nonce(self) -> Optional[int]:
+        """Next nonce to hand out (None until synced)."""
+        return self._next
+
+    async def allocate(self, count: int = 1) -> int:
+        """Reserve `count` consecutive nonces.
+
+        Returns:
+            The first reserved nonce
+        """
+        if self._next is None:
+            await self.resync()
+        first = self._next
+        self._next += count
+        return first
+
+    async def resync(self) -> int:
+        """Refetch the exchange's next nonce and continue from it."""
+        with span("nonce.resync"):
+            self._next = await self._fetch(self.api_key_index)
+        self.resyncs += 1
+        metrics.count("nonce_resyncs")
+        return self._next
+
+    def rewind(self, nonce: int):
+        """Continue from `nonce` - it and everything allocated after it were never used."""
+        self._next = nonce
+
+    def invalidate(self):
+        """Forget the counter; the next allocate() refetches it."""
+        self._next = None
@@ -0,0 +1,162 @@
+# lithood/profiling.py
+"""On-demand cProfile, asyncio task-stack and tracemalloc dumps triggered by signals."""
+
+import asyncio
+import cProfile
+import io
+import pstats
+import signal
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from lithood.logger import log
+
+
+class Profiler:
+    """Runtime profiling toggles for a live bot.
+
+    SIGUSR1 starts/stops a cProfile session (auto-stopped after
+    ``max_seconds`` so a forgotten session can't slow the bot for long).
+    SIGUSR2 dumps every asyncio task's stack and toggles tracemalloc; the
+    second SIGUSR2 writes the top allocators and stops tracing.
+    Output files go to ``logs/``.
+    """
+
+    def __init__(self, out_dir: str = "logs", max_seconds: float = 60.0, top: int = 30):
+        """Initialize the profiler.
+
+        Args:
+            out_dir: Directory for dumps
+            max_seconds: Auto-stop a cProfile or tracemalloc session after this long
+            top: Number of entries in text summaries
+        """
+        self.out_dir = Path(out_dir)
+        self.max_seconds = max_seconds
+        self.top = top
+        self._profile: Optional[cProfile.Profile] = None
+        self._profile_timer: Optional[asyncio.TimerHandle] = None
+        self._tracemalloc_timer: Optional[asyncio.TimerHandle] = None
+
+    def install(self, loop: asyncio.AbstractEventLoop):
+        """Register SIGUSR1/SIGUSR2 handlers on the running loop."""
+        loop.add_signal_handler(signal.SIGUSR1, self.toggle_cprofile)
+        loop.add_signal_handler(signal.SIGUSR2, self._on_sigusr2)
+        log.info("Profiling hooks installed (SIGUSR1: cProfile, SIGUSR2: task stacks + tracemalloc)")
+
+    def _path(self, prefix: str, suffix: str) -> Path:
+        self.out_dir.mkdir(exist_ok=True)
+        return self.out_dir / f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{suffix}"
+
+    # -------------------------------------------------------------------------
+    # cProfile
+    # -------------------------------------------------------------------------
+
+    @property
+    def profiling(self) -> bool:
+        return self._profile is not None
+
+    def toggle_cprofile(self):
+        if self.profiling:
+            self.stop_cprofile()
+        else:
+            self.start_cprofile()
+
+    def start_cprofile(self):
+        if self.profiling:
+            return
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        loop = asyncio.get_running_loop()
+        self._profile_timer = loop.call_later(self.max_seconds, self._auto_stop_cprofile)
+        log.warning(f"cProfile started (auto-stops after {self.max_seconds:.0f}s)")
+
+    def _auto_stop_cprofile(self):
+        log.warning("cProfile session hit its time limit")
+        self.stop_cprofile()
+
+    def stop_cprofile(self) -> Optional[Path]:
+        """Stop profiling and write .pstats plus a text summary sorted by cumulative time."""
+        if not self.profiling:
+            return None
+        self._profile.disable()
+        if self._profile_timer is not None:
+            self._profile_timer.cancel()
+            self._profile_timer = None
+
+        path = self._path("profile", "pstats")
+        self._profile.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(self._profile, stream=summary).sort_stats("cumulative").print_stats(self.top)
+        path.with_suffix(".txt").write_text(summary.getvalue())
+        self._profile = None
+        log.warning(f"cProfile stopped - wrote {path}")
+        return path
+
+    # -------------------------------------------------------------------------
+    # Task stacks and tracemalloc
+    # -------------------------------------------------------------------------
+
+    def _on_sigusr2(self):
+        self.dump_task_stacks()
+        self.toggle_tracemalloc()
+
+    def dump_task_stacks(self) -> Path:
+        """Write the current stack of every asyncio task."""
+        path = self._path("tasks", "txt")
+        tasks = asyncio.all_tasks()
+        with path.open("w") as f:
+            f.write(f"{len(tasks)} tasks\n\n")
+            for task in sorted(tasks, key=lambda t: t.get_name()):
+                f.write(f"=== {task.get_name()} ({'done' if task.done() else 'pending'}) ===\n")
+                task.print_stack(file=f)
+                f.write("\n")
+        log.warning(f"Dumped {len(tasks)} asyncio task stacks to {path}")
+        return path
+
+    def toggle_tracemalloc(self):
+        if tracemalloc.is_tracing():
+            self.stop_tracemalloc()
+        else:
+            self.start_tracemalloc()
+
+    def start_tracemalloc(self, frames: int = 10):
+        if tracemalloc.is_tracing():
+            return
+        tracemalloc.start(frames)
+        loop = asyncio.get_running_loop()
+        self._tracemalloc_timer = loop.call_later(self.max_seconds, self._auto_stop_tracemalloc)
+        log.warning(f"tracemalloc started (auto-stops after {self.max_seconds:.0f}s)")
+
+    def _auto_stop_tracemalloc(self):
+        log.warning("tracemalloc session hit its time limit")
+        self.stop_tracemalloc()
+
+    def stop_tracemalloc(self) -> Optional[Path]:
+        """Write the top allocators by line and stop tracing."""
+        if not tracemalloc.is_tracing():
+            return None
+        if self._tracemalloc_timer is not None:
+            self._tracemalloc_timer.cancel()
+            self._tracemalloc_timer = None
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        path = self._path("tracemalloc", "txt")
+        with path.open("w") as f:
+            f.write(f"current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n\n")
+            for stat in snapshot.statistics("lineno")[:self.top]:
+                f.write(f"{stat}\n")
+        log.warning(f"tracemalloc stopped - wrote top {self.top} allocators to {path}")
+        return path
+
+    def stop_all(self):
+        """Flush any active sessions (call on shutdown)."""
+        self.stop_cprofile()
+        self.stop_tracemalloc()
@@ -4,6 +4,7 @@
 import asyncio
 import functools
 from typing import TypeVar, Callable, Any, Optional, Tuple, Type
+from lithood.instrumentation import metrics
 from lithood.logger import log
 
 T = TypeVar('T')
@@ -104,10 +105,12 @@ async def retry_async(
 
             # Last attempt failed
             if attempt >= config.max_retries:
+                metrics.count("retries_exhausted")
                 log.error(f"{operation_name} failed after {attempt + 1} attempts: {e}")
                 return None, e
 
             # Calculate delay and wait
+            metrics.count("retries")
             delay = calculate_delay(attempt, config)
             log.warning(f"{operation_name} failed (attempt {attempt + 1}/{config.max_retries + 1}): {e}")
             log.warning(f"  Retrying in {delay:.1f}s...")
@@ -168,6 +171,10 @@ class ConnectionMonitor:
         if self.consecutive_failures >= self.CONNECTION_FAILURE_THRESHOLD:
             self.is_connected = False
 
+    def mark_unhealthy(self):
+        """Force the next ensure_connected() call to reconnect."""
+        self.is_connected = False
+
     async def ensure_connected(self, timeout: float = 60.0) -> bool:
         """
         Ensure connection is healthy, reconnect if needed.
@@ -200,9 +207,11 @@ class ConnectionMonitor:
                     await self.reconnect_callback()
                     self.is_connected = True
                     self.consecutive_failures = 0
+                    metrics.count("reconnects")
                     log.info("Reconnection successful")
                     return True
                 except Exception as e:
+                    metrics.count("reconnect_failures")
                     if attempt >= config.max_retries:
                         log.error(f"Reconnection failed after {attempt + 1} attempts: {e}")
                         return False
@@ -0,0 +1,381 @@
+# lithood/signing.py
+"""Transaction signing on a thread pool, with nonces allocated locally and sends pipelined per API key."""
+
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from lighter import RespSendTx
+from lighter.exceptions import BadRequestException
+
+from lithood.config import SIGNER_THREADS, TX_BATCH_SIZE, TX_MAX_REPLAYS
+from lithood.instrumentation import metrics, span
+from lithood.logger import log
+from lithood.nonce import NonceAllocator
+
+# sendTx response code for an accepted transaction
+CODE_OK = 200
+
+# (tx_info, response, error) - the same shape the SDK's create_order/cancel_order return
+TxResult = tuple[Optional[str], Any, Optional[str]]
+
+
+@dataclass
+class TxRequest:
+    """One transaction to sign and send.
+
+    ``kind`` names the SignerClient signing method (``sign_<kind>``) and the
+    timing spans (``sign.<kind>``, ``send.<kind>``); ``params`` are its
+    arguments apart from nonce and api_key_index.
+    """
+    kind: str
+    params: dict = field(default_factory=dict)
+
+
+def _error_text(e: Exception) -> str:
+    # Same trimming as the SDK: the last line carries the API's message
+    return str(e).strip().split("\n")[-1]
+
+
+@dataclass
+class _Tx:
+    """A queued transaction and, once signed, its nonce and payload."""
+    request: TxRequest
+    future: asyncio.Future
+    replays: int = 0
+    nonce: int = -1
+    tx_type: int = 0
+    tx_info: str = ""
+    tx_hash: str = ""
+
+    def resolve(self, result: TxResult):
+        if not self.future.done():
+            self.future.set_result(result)
+
+
+class TxPipeline:
+    """Signs and sends one API key's transactions in nonce order, several per round trip.
+
+    Callers queue transactions and await their results. A single runner
+    takes the queue in order, assigns consecutive nonces from the key's
+    NonceAllocator, signs each batch in parallel and sends it with one
+    sendTxBatch call (sendTx for a lone transaction). The next batch is
+    signed while the previous one is on the wire, so a ladder placement or
+    a burst of counter-orders from several grids costs a few round trips
+    instead of one per order. Only one batch is ever on the wire, which
+    keeps the sequencer seeing nonces in order.
+
+    When a send fails, the allocator is resynced from the exchange.
+    Transactions below the exchange's next nonce were applied; the rest of
+    the failed batch and the already-signed next batch are re-signed from
+    that nonce. After a rejected batch the survivors go one per round trip
+    until the culprit is isolated; a lone transaction rejected for its
+    nonce is replayed up to ``max_replays`` times, any other rejection is
+    returned to its caller. A response with a non-OK code counts as a
+    rejection. Transactions cut off by a transport error are reported
+    failed rather than resent - the caller's retry decides that.
+    """
+
+    def __init__(
+        self,
+        allocator: NonceAllocator,
+        sign: Callable[[TxRequest, int, int], Awaitable[tuple]],
+        signer,
+        batch_size: int = TX_BATCH_SIZE,
+        max_replays: int = TX_MAX_REPLAYS,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            allocator: Nonce source for this API key
+            sign: Coroutine (request, nonce, api_key_index) -> (tx_type, tx_info, tx_hash, error)
+            signer: SignerClient providing send_tx and send_tx_batch
+            batch_size: Most transactions per round trip
+            max_replays: Replays of a nonce-rejected transaction before giving up
+        """
+        self.allocator = allocator
+        self._sign = sign
+        self._signer = signer
+        self.batch_size = max(1, batch_size)
+        self.max_replays = max_replays
+        self._queue: deque[_Tx] = deque()
+        self._singles = 0  # Transactions still to send one at a time after a rejected batch
+        self._runner: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.sent = 0
+        self.round_trips = 0
+        self.replays = 0
+
+    async def submit(self, requests: list[TxRequest]) -> list[TxResult]:
+        """Queue transactions (sent in this order) and wait for their results.
+
+        Returns:
+            One (tx_info, response, error) per request, in order
+        """
+        loop = asyncio.get_running_loop()
+        txs = [_Tx(request, loop.create_future()) for request in requests]
+        self._queue.extend(txs)
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run(), name=f"tx-pipeline-{self.allocator.api_key_index}")
+        return list(await asyncio.gather(*(tx.future for tx in txs)))
+
+    async def _run(self):
+        in_flight: Optional[asyncio.Task] = None
+        in_flight_batch: list[_Tx] = []
+        try:
+            while self._queue or in_flight is not None:
+                # Sign the next batch while the previous one is on the wire
+                signed = await self._sign_batch(self._take_batch()) if self._queue else []
+                if in_flight is not None:
+                    broken = await in_flight
+                    if broken is not None:
+                        # Nonces after the failure are void: re-sign from the exchange's next nonce
+                        requeue, resume_at = broken
+                        self._queue.extendleft(reversed(requeue + signed))
+                        signed = []
+                        if resume_at is None:
+                            self.allocator.invalidate()
+                        else:
+                            self.allocator.rewind(resume_at)
+                in_flight_batch = signed
+                in_flight = asyncio.create_task(self._send(signed)) if signed else None
+        except Exception as e:
+            log.error(f"Transaction pipeline for API key {self.allocator.api_key_index} failed: {e}")
+            self.allocator.invalidate()
+            for tx in in_flight_batch + list(self._queue):
+                tx.resolve((None, None, str(e)))
+            self._queue.clear()
+
+    def _take_batch(self) -> list[_Tx]:
+        size = 1 if self._singles else self.batch_size
+        return [self._queue.popleft() for _ in range(min(size, len(self._queue)))]
+
+    async def _sign_batch(self, batch: list[_Tx]) -> list[_Tx]:
+        """Assign consecutive nonces and sign in parallel; signing failures are answered and dropped."""
+        key = self.allocator.api_key_index
+        while batch:
+            try:
+                first = await self.allocator.allocate(len(batch))
+            except Exception as e:
+                log.warning(f"Could not fetch nonce for API key {key}: {e}")
+                for tx in batch:
+                    tx.resolve((None, None, str(e)))
+                return []
+
+            signed = await asyncio.gather(*(self._sign(tx.request, first + i, key) for i, tx in enumerate(batch)))
+            failed = False
+            for i, (tx, (tx_type, tx_info, tx_hash, error)) in enumerate(zip(batch, signed)):
+                if error is not None:
+                    tx.resolve((None, None, error))
+                    failed = True
+                else:
+                    tx.nonce, tx.tx_type, tx.tx_info, tx.tx_hash = first + i, tx_type, tx_info, tx_hash
+            if not failed:
+                return batch
+            # A signing failure leaves a gap in the nonces: renumber the rest
+            self.allocator.rewind(first)
+            batch = [tx for tx in batch if not tx.future.done()]
+        return batch
+
+    async def _send(self, batch: list[_Tx]) -> Optional[tuple[list[_Tx], Optional[int]]]:
+        """Send a signed batch and answer its callers.
+
+        Returns:
+            None if the nonce sequence continues after the batch, otherwise
+            (transactions to re-sign, exchange's next nonce or None if unknown)
+        """
+        if len(batch) == 1:
+            self._singles = max(0, self._singles - 1)
+        kind = batch[0].request.kind if len(batch) == 1 else "batch"
+        self.round_trips += 1
+        try:
+            with span(f"send.{kind}"):
+                if len(batch) == 1:
+                    resp = await self._signer.send_tx(tx_type=batch[0].tx_type, tx_info=batch[0].tx_info)
+                    responses = [resp]
+                else:
+                    resp = await self._signer.send_tx_batch(
+                        [tx.tx_type for tx in batch], [tx.tx_info for tx in batch]
+                    )
+                    hashes = list(resp.tx_hash or []) if resp.code == CODE_OK else []
+                    responses = [self._tx_response(hashes[i], resp) if i < len(hashes) and hashes[i] else None
+                                 for i in range(len(batch))]
+        except BadRequestException as e:
+            return await self._recover(batch, _error_text(e), nonce_error="invalid nonce" in str(e))
+        except Exception as e:
+            return await self._recover(batch, str(e), transport=True)
+
+        if resp.code != CODE_OK:
+            # Rejected without an exception: same handling as a BadRequest
+            error = f"{resp.message or 'transaction rejected'} (code {resp.code})"
+            return await self._recover(batch, error, nonce_error="invalid nonce" in str(resp.message))
+
+        missing = [tx for tx, tx_resp in zip(batch, responses) if tx_resp is None]
+        for tx, tx_resp in zip(batch, responses):
+            if tx_resp is not None:
+                tx.resolve((tx.tx_info, tx_resp, None))
+        self.sent += len(batch) - len(missing)
+        metrics.count("tx_sent", len(batch) - len(missing))
+        if not missing:
+            return None
+
+        # No hash for some: those below the exchange's next nonce were applied
+        # (their hash is known from signing), the rest are failed
+        log.warning(f"Batch response carried {len(batch) - len(missing)}/{len(batch)} transaction hashes")
+        next_nonce = await self._try_resync()
+        for tx in missing:
+            if next_nonce is not None and tx.nonce < next_nonce:
+                self.sent += 1
+                tx.resolve((tx.tx_info, self._tx_response(tx.tx_hash, resp), None))
+            else:
+                tx.resolve((None, None, "no transaction hash in batch response"))
+        return [], next_nonce
+
+    async def _recover(self, batch: list[_Tx], error: str, nonce_error: bool = False,
+                       transport: bool = False) -> tuple[list[_Tx], Optional[int]]:
+        """Find out how much of a failed batch was applied; answer or requeue the rest."""
+        if len(batch) == 1 and not (nonce_error or transport):
+            # Rejected without using its nonce: the sequence resumes from it
+            batch[0].resolve((None, None, error))
+            return [], batch[0].nonce
+
+        next_nonce = await self._try_resync()
+        if next_nonce is None:
+            for tx in batch:
+                tx.resolve((None, None, error))
+            return [], None
+
+        # The exchange applies a batch in order up to the first rejection. A
+        # rejected lone transaction, or a batch rejected for its (first)
+        # nonce, applied nothing - the nonce moved under us instead.
+        if transport or (len(batch) > 1 and not nonce_error):
+            applied = min(max(next_nonce - batch[0].nonce, 0), len(batch))
+        else:
+            applied = 0
+
+        requeue = []
+        for i, tx in enumerate(batch):
+            if i < applied:
+                self.sent += 1
+                tx.resolve((tx.tx_info, self._tx_response(tx.tx_hash), None))
+            elif transport:
+                tx.resolve((None, None, error))
+            elif len(batch) > 1:
+                requeue.append(tx)
+            elif nonce_error and tx.replays < self.max_replays:
+                tx.replays += 1
+                self.replays += 1
+                metrics.count("tx_replays")
+                requeue.append(tx)
+            else:
+                tx.resolve((None, None, error))
+        if len(batch) > 1 and requeue:
+            self._singles = len(requeue)
+            log.warning(f"Transaction batch rejected ({error}) - resending {len(requeue)} one at a time")
+        elif nonce_error and requeue:
+            log.warning(f"Nonce rejected ({error}) - replaying from nonce {next_nonce}")
+        return requeue, next_nonce
+
+    async def _try_resync(self) -> Optional[int]:
+        try:
+            return await self.allocator.resync()
+        except Exception as e:
+            log.warning(f"Nonce resync for API key {self.allocator.api_key_index} failed: {e}")
+            return None
+
+    @staticmethod
+    def _tx_response(tx_hash: str, batch_resp=None) -> RespSendTx:
+        return RespSendTx(
+            code=getattr(batch_resp, "code", CODE_OK),
+            message=getattr(batch_resp, "message", None),
+            tx_hash=tx_hash,
+            predicted_execution_time_ms=getattr(batch_resp, "predicted_execution_time_ms", 0),
+            volume_quota_remaining=getattr(batch_resp, "volume_quota_remaining", 0),
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "sent": self.sent,
+            "round_trips": self.round_trips,
+            "replays": self.replays,
+            "resyncs": self.allocator.resyncs,
+            "queued": len(self._queue),
+        }
+
+
+class SigningPool:
+    """Signs transactions on worker threads and submits them through per-key pipelines.
+
+    The SDK signer is a native library called through ctypes, which releases
+    the GIL, so signatures computed on pool threads run in parallel with the
+    event loop and with each other. Each API key has its own NonceAllocator
+    and TxPipeline: nonces are assigned locally in submission order and
+    concurrent callers share batched round trips (see TxPipeline). The SDK
+    nonce manager is only used to pick keys and fetch the exchange's next
+    nonce.
+
+    Signing and sending are timed separately as ``sign.<kind>`` and
+    ``send.<kind>`` (``send.batch`` for a multi-transaction round trip).
+    """
+
+    def __init__(self, threads: int = SIGNER_THREADS):
+        """Initialize the pool.
+
+        Args:
+            threads: Signing threads
+        """
+        self.signer = None  # SignerClient (or the offline fake), bound by LighterClient
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="signer")
+        self._pipelines: dict[int, TxPipeline] = {}
+
+    def bind(self, signer_client):
+        """Use this SignerClient for signing, nonces and sends."""
+        if signer_client is not self.signer:
+            self._pipelines = {}
+        self.signer = signer_client
+
+    async def run(self, kind: str, func: Callable, *args, **kwargs):
+        """Run a blocking signer call (e.g. auth token creation) on the pool."""
+        loop = asyncio.get_running_loop()
+        with span(f"sign.{kind}"):
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def pipeline(self, api_key_index: int) -> TxPipeline:
+        """The transaction pipeline for one API key."""
+        pipeline = self._pipelines.get(api_key_index)
+        if pipeline is None:
+            allocator = NonceAllocator(api_key_index, self.signer.nonce_manager.async_refresh_nonce)
+            pipeline = self._pipelines[api_key_index] = TxPipeline(allocator, self._sign, self.signer)
+        return pipeline
+
+    async def submit(self, request: TxRequest) -> TxResult:
+        """Sign one transaction with the next nonce and send it."""
+        return (await self.submit_many([request]))[0]
+
+    async def submit_many(self, requests: list[TxRequest]) -> list[TxResult]:
+        """Sign and send transactions on one API key, in order.
+
+        Args:
+            requests: Transactions, in the order they should reach the sequencer
+
+        Returns:
+            One (tx_info, response, error) per request, in order
+        """
+        if not requests:
+            return []
+        api_key_index = self.signer.nonce_manager.rotate_key()
+        return await self.pipeline(api_key_index).submit(requests)
+
+    async def _sign(self, request: TxRequest, nonce: int, api_key_index: int) -> tuple:
+        sign = getattr(self.signer, f"sign_{request.kind}")
+        return await self.run(request.kind, sign, **request.params, nonce=nonce, api_key_index=api_key_index)
+
+    def get_stats(self) -> dict:
+        return {key: pipeline.get_stats() for key, pipeline in self._pipelines.items()}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -1,19 +1,46 @@
 # lithood/state.py
 """SQLite-based state manager for the trading bot."""
 
+import hashlib
 import json
 import logging
+import secrets
 import sqlite3
 import threading
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from typing import Any, Optional
 
+from lithood.instrumentation import span
 from lithood.types import Order, OrderSide, OrderStatus, OrderType
 
 logger = logging.getLogger(__name__)
 
 
+# Client order indices fit in 47 bits (the exchange accepts up to 2^48 - 1; 0 means "none")
+CLIENT_ORDER_INDEX_BITS = 47
+
+
+def client_order_index(salt: str, source: str, market_id: int, side: OrderSide, grid_level: int,
+                       generation: int) -> int:
+    """Deterministic client order index for one placement.
+
+    Args:
+        salt: Per-database random salt, so a fresh database never reuses old ids
+        source: Engine that owns the order (e.g. "infinite_grid")
+        market_id: Market the order is for
+        side: BUY or SELL
+        grid_level: Price level of the order
+        generation: How many orders this (source, market, side, level) has had before
+
+    Returns:
+        A non-zero index below 2^CLIENT_ORDER_INDEX_BITS
+    """
+    key = f"{salt}:{source}:{market_id}:{side.value}:{grid_level}:{generation}".encode()
+    digest = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+    return (digest & ((1 << CLIENT_ORDER_INDEX_BITS) - 1)) or 1
+
+
 class InvalidStateTransitionError(Exception):
     """Raised when an invalid order state transition is attempted."""
 
@@ -46,8 +73,9 @@ def decimal_decoder(dct: dict) -> dict:
 class StateManager:
     """SQLite-based state persistence for the trading bot.
 
-    Manages three tables:
+    Manages four tables:
     - orders: Track all grid and hedge orders
+    - client_orders: Client order indices reserved before submission
     - hedge_history: Track hedge position actions
     - bot_state: Key-value store for arbitrary state
     """
@@ -81,6 +109,11 @@ class StateManager:
         self.conn.execute("PRAGMA journal_mode=WAL")
         self._create_tables()
 
+        # In-memory mirror of open (pending/partially filled) orders: id -> side.
+        # Lets metrics read open-order counts without querying the database.
+        self._open_orders: dict[str, OrderSide] = {}
+        self._load_open_orders()
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         with self._lock:
@@ -104,6 +137,22 @@ class StateManager:
                     )
                 """)
 
+                # Client order indices - reserved before an order is sent,
+                # resolved to the exchange order id once it is known
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS client_orders (
+                        client_order_index INTEGER PRIMARY KEY,
+                        source TEXT NOT NULL,
+                        market_id INTEGER NOT NULL,
+                        side TEXT NOT NULL,
+                        grid_level INTEGER NOT NULL,
+                        generation INTEGER NOT NULL,
+                        order_id TEXT,
+                        created_at TEXT NOT NULL,
+                        UNIQUE (source, market_id, side, grid_level, generation)
+                    )
+                """)
+
                 # Hedge history table - tracks hedge actions
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS hedge_history (
@@ -136,11 +185,33 @@ class StateManager:
                     ON orders(market_id, side)
                 """)
 
-                self.conn.commit()
+                self._commit()
             except sqlite3.Error as e:
                 logger.error("Failed to create database tables: %s", e)
                 raise
 
+    def _load_open_orders(self) -> None:
+        """Populate the open-order mirror from the database."""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT id, side FROM orders WHERE status IN (?, ?)",
+                (OrderStatus.PENDING.value, OrderStatus.PARTIALLY_FILLED.value),
+            )
+            self._open_orders = {row["id"]: OrderSide(row["side"]) for row in cursor.fetchall()}
+
+    def open_order_counts(self) -> dict[str, int]:
+        """Count open orders per side (from memory, no query)."""
+        counts = {side.value: 0 for side in OrderSide}
+        for side in list(self._open_orders.values()):
+            counts[side.value] += 1
+        return counts
+
+    def _commit(self) -> None:
+        """Commit the current transaction (caller holds the lock), timing it."""
+        with span("db_commit"):
+            self.conn.commit()
+
     def close(self) -> None:
         """Close the database connection."""
         with self._lock:
@@ -198,11 +269,19 @@ class StateManager:
                     """,
                     (key, json_value, timestamp),
                 )
-                self.conn.commit()
+                self._commit()
             except sqlite3.Error as e:
                 logger.error("Failed to set key '%s': %s", key, e)
                 raise
 
+    def namespace(self, name: str) -> "StateNamespace":
+        """Key-value view whose keys are prefixed with ``name:`` (orders stay shared).
+
+        Lets several engines keep same-named counters and flags in one
+        database, e.g. one grid per market.
+        """
+        return StateNamespace(self, name)
+
     # -------------------------------------------------------------------------
     # Order Methods
     # -------------------------------------------------------------------------
@@ -210,6 +289,10 @@ class StateManager:
     def save_order(self, order: Order) -> None:
         """Save or update an order in the database.
 
+        If the order carries a client_order_index reserved with
+        reserve_client_order(), the reservation is resolved to the order's id
+        in the same transaction.
+
         Args:
             order: The Order object to save
         """
@@ -237,7 +320,16 @@ class StateManager:
                         str(order.filled_size),
                     ),
                 )
-                self.conn.commit()
+                if order.client_order_index:
+                    cursor.execute(
+                        "UPDATE client_orders SET order_id = ? WHERE client_order_index = ?",
+                        (order.id, order.client_order_index),
+                    )
+                self._commit()
+                if order.status in (OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED):
+                    self._open_orders[order.id] = order.side
+                else:
+                    self._open_orders.pop(order.id, None)
             except sqlite3.Error as e:
                 logger.error("Failed to save order '%s': %s", order.id, e)
                 raise
@@ -265,30 +357,23 @@ class StateManager:
                 logger.error("Failed to get order '%s': %s", order_id, e)
                 return None
 
-    def get_pending_orders(self) -> list[Order]:
+    def get_pending_orders(self, market_id: Optional[int] = None) -> list[Order]:
         """Get all pending orders.
 
+        Args:
+            market_id: Only orders for this market (all markets if None)
+
         Returns:
             List of Order objects with PENDING status
         """
-        with self._lock:
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM orders WHERE status = ?", (OrderStatus.PENDING.value,)
-                )
-                rows = cursor.fetchall()
+        return self.get_orders_by_status(OrderStatus.PENDING, market_id)
 
-                return [self._row_to_order(row) for row in rows]
-            except sqlite3.Error as e:
-                logger.error("Failed to get pending orders: %s", e)
-                return []
-
-    def get_orders_by_status(self, status: OrderStatus) -> list[Order]:
+    def get_orders_by_status(self, status: OrderStatus, market_id: Optional[int] = None) -> list[Order]:
         """Get all orders with a specific status.
 
         Args:
             status: The OrderStatus to filter by
+            market_id: Only orders for this market (all markets if None)
 
         Returns:
             List of Order objects with the specified status
@@ -296,7 +381,12 @@ class StateManager:
         with self._lock:
             try:
                 cursor = self.conn.cursor()
-                cursor.execute("SELECT * FROM orders WHERE status = ?", (status.value,))
+                if market_id is None:
+                    cursor.execute("SELECT * FROM orders WHERE status = ?", (status.value,))
+                else:
+                    cursor.execute(
+                        "SELECT * FROM orders WHERE status = ? AND market_id = ?", (status.value, market_id)
+                    )
                 rows = cursor.fetchall()
 
                 return [self._row_to_order(row) for row in rows]
@@ -372,7 +462,8 @@ class StateManager:
                         """,
                         (OrderStatus.FILLED.value, timestamp, order_id),
                     )
-                self.conn.commit()
+                self._commit()
+                self._open_orders.pop(order_id, None)
             except sqlite3.Error as e:
                 logger.error("Failed to mark order '%s' as filled: %s", order_id, e)
                 raise
@@ -414,7 +505,7 @@ class StateManager:
                     """,
                     (OrderStatus.PARTIALLY_FILLED.value, str(filled_size), order_id),
                 )
-                self.conn.commit()
+                self._commit()
             except sqlite3.Error as e:
                 logger.error(
                     "Failed to mark order '%s' as partially filled: %s", order_id, e
@@ -451,7 +542,8 @@ class StateManager:
                     "UPDATE orders SET status = ? WHERE id = ?",
                     (OrderStatus.CANCELLED.value, order_id),
                 )
-                self.conn.commit()
+                self._commit()
+                self._open_orders.pop(order_id, None)
             except sqlite3.Error as e:
                 logger.error("Failed to mark order '%s' as cancelled: %s", order_id, e)
                 raise
@@ -481,6 +573,107 @@ class StateManager:
             filled_size=Decimal(row["filled_size"]) if row["filled_size"] else Decimal("0"),
         )
 
+    # -------------------------------------------------------------------------
+    # Client Order Index Methods
+    # -------------------------------------------------------------------------
+
+    def reserve_client_order(
+        self, source: str, market_id: int, side: OrderSide, grid_level: int
+    ) -> tuple[int, bool]:
+        """Reserve the client order index for the next order at a level.
+
+        The index is derived from (source, market, side, level, generation)
+        and persisted before the order is sent. While a reservation has not
+        been resolved to an order id (see save_order), the same index is
+        returned again: the earlier attempt may have reached the exchange, so
+        the caller should look it up there before sending it again.
+
+        Args:
+            source: Engine that owns the order
+            market_id: Market the order is for
+            side: BUY or SELL
+            grid_level: Price level of the order
+
+        Returns:
+            Tuple of (client_order_index, unresolved) - unresolved is True when
+            the index comes from an earlier attempt whose outcome is unknown
+        """
+        salt = self.get("client_order_salt")
+        if salt is None:
+            salt = secrets.token_hex(8)
+            self.set("client_order_salt", salt)
+
+        with self._lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT client_order_index, generation, order_id FROM client_orders
+                    WHERE source = ? AND market_id = ? AND side = ? AND grid_level = ?
+                    ORDER BY generation DESC LIMIT 1
+                    """,
+                    (source, market_id, side.value, grid_level),
+                )
+                row = cursor.fetchone()
+                if row is not None and row["order_id"] is None:
+                    return row["client_order_index"], True
+
+                generation = row["generation"] + 1 if row is not None else 1
+                while True:
+                    index = client_order_index(salt, source, market_id, side, grid_level, generation)
+                    try:
+                        cursor.execute(
+                            """
+                            INSERT INTO client_orders
+                            (client_order_index, source, market_id, side, grid_level, generation, created_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            (index, source, market_id, side.value, grid_level, generation,
+                             datetime.now().isoformat()),
+                        )
+                        break
+                    except sqlite3.IntegrityError:
+                        # Hash collision with another level's index: skip this generation
+                        generation += 1
+                self._commit()
+                return index, False
+            except sqlite3.Error as e:
+                logger.error("Failed to reserve client order index at level %d: %s", grid_level, e)
+                raise
+
+    def resolve_client_order(self, client_order_index: int, order_id: str) -> None:
+        """Record the exchange order a reserved client order index ended up as.
+
+        Args:
+            client_order_index: The reserved index
+            order_id: Exchange order id (also for orders that were cancelled on arrival)
+        """
+        with self._lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "UPDATE client_orders SET order_id = ? WHERE client_order_index = ?",
+                    (order_id, client_order_index),
+                )
+                self._commit()
+            except sqlite3.Error as e:
+                logger.error("Failed to resolve client order index %d: %s", client_order_index, e)
+                raise
+
+    def is_unresolved_client_order(self, source: str, client_order_index: int) -> bool:
+        """Whether `source` reserved this client order index and has not recorded its order yet."""
+        with self._lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM client_orders WHERE client_order_index = ? AND source = ? AND order_id IS NULL",
+                    (client_order_index, source),
+                )
+                return cursor.fetchone() is not None
+            except sqlite3.Error as e:
+                logger.error("Failed to look up client order index %d: %s", client_order_index, e)
+                return False
+
     # -------------------------------------------------------------------------
     # Hedge Methods
     # -------------------------------------------------------------------------
@@ -525,7 +718,7 @@ class StateManager:
                         timestamp,
                     ),
                 )
-                self.conn.commit()
+                self._commit()
                 return cursor.lastrowid or 0
             except sqlite3.Error as e:
                 logger.error("Failed to log hedge action '%s': %s", action, e)
@@ -701,9 +894,32 @@ class StateManager:
             try:
                 cursor = self.conn.cursor()
                 cursor.execute("DELETE FROM orders")
+                cursor.execute("DELETE FROM client_orders")
                 cursor.execute("DELETE FROM hedge_history")
                 cursor.execute("DELETE FROM bot_state")
-                self.conn.commit()
+                self._commit()
+                self._open_orders.clear()
             except sqlite3.Error as e:
                 logger.error("Failed to clear all data: %s", e)
                 raise
+
+
+class StateNamespace:
+    """A StateManager whose key-value store is scoped to one prefix.
+
+    get()/set() read and write ``<name>:<key>``; every other attribute
+    (orders, hedge history, close) is the shared StateManager's.
+    """
+
+    def __init__(self, state: StateManager, name: str) -> None:
+        self._state = state
+        self.name = name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._state.get(f"{self.name}:{key}", default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._state.set(f"{self.name}:{key}", value)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._state, attr)
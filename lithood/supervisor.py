@@ -0,0 +1,217 @@
+# lithood/supervisor.py
+"""Runs independent periodic bot tasks with their own cadence, priority and restarts."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from lithood.instrumentation import metrics
+from lithood.logger import log
+from lithood.retry import RetryConfig, calculate_delay
+
+# Backoff used when restarting a crashed task
+RESTART_BACKOFF = RetryConfig(max_retries=0, initial_delay=1.0, max_delay=60.0)
+
+
+class SupervisedTask:
+    """A coroutine function run periodically by the Supervisor."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        interval: float,
+        priority: int = 10,
+        timeout: Optional[float] = None,
+        backoff: RetryConfig = RESTART_BACKOFF,
+    ):
+        """Initialize the task.
+
+        Args:
+            name: Task name (used in logs and stats)
+            func: Coroutine function run once per tick
+            interval: Seconds between scheduled ticks
+            priority: Lower is more important; ticks are shed while a more
+                important task is running late
+            timeout: Seconds before a tick is cancelled, or None to never
+                interrupt it (use None for anything that places orders)
+            backoff: Restart delay schedule after a crash
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.priority = priority
+        self.timeout = timeout
+        self.backoff = backoff
+
+        # Statistics
+        self.runs = 0
+        self.crashes = 0
+        self.timeouts = 0
+        self.shed = 0
+        self.overruns = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.last_duration = 0.0
+        self._consecutive_crashes = 0
+        self._consecutive_shed = 0
+        self._running_since: Optional[float] = None
+
+    @property
+    def late(self) -> bool:
+        """True if the current tick has run past twice its interval or the last one started late.
+
+        Lag is scheduling delay only (time between due and actually starting),
+        so a tick that merely takes longer than its interval is an overrun,
+        not lag.
+        """
+        if self._running_since is not None and time.monotonic() - self._running_since > 2 * self.interval:
+            return True
+        return self.last_lag > self.interval
+
+    def get_stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "priority": self.priority,
+            "runs": self.runs,
+            "crashes": self.crashes,
+            "timeouts": self.timeouts,
+            "shed": self.shed,
+            "overruns": self.overruns,
+            "last_lag_ms": round(self.last_lag * 1000, 1),
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+            "last_duration_ms": round(self.last_duration * 1000, 1),
+        }
+
+
+class Supervisor:
+    """Runs each SupervisedTask as its own asyncio task.
+
+    A slow task only delays its own next tick. Crashed tasks are restarted
+    with exponential backoff, and lower-priority ticks are skipped while a
+    higher-priority task is behind schedule.
+    """
+
+    # A task is never shed more than this many ticks in a row
+    MAX_CONSECUTIVE_SHED = 5
+
+    def __init__(self, stop_timeout: float = 30.0):
+        """Initialize the supervisor.
+
+        Args:
+            stop_timeout: Seconds stop() waits for in-progress ticks before cancelling
+        """
+        self.stop_timeout = stop_timeout
+        self._tasks: dict[str, SupervisedTask] = {}
+        self._runners: dict[str, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    def add(self, task: SupervisedTask) -> SupervisedTask:
+        """Register a task (started by start())."""
+        if task.name in self._tasks:
+            raise ValueError(f"Task already registered: {task.name}")
+        self._tasks[task.name] = task
+        return task
+
+    def start(self):
+        """Start runners for every registered task."""
+        self._stopping.clear()
+        for name, task in self._tasks.items():
+            if name not in self._runners or self._runners[name].done():
+                self._runners[name] = asyncio.create_task(self._supervise(task), name=f"supervised-{name}")
+        log.info(f"Supervisor started {len(self._runners)} tasks: {', '.join(self._tasks)}")
+
+    async def wait(self):
+        """Block until stop() is called."""
+        await self._stopping.wait()
+
+    async def stop(self):
+        """Let in-progress ticks finish (up to stop_timeout), then cancel the rest."""
+        self._stopping.set()
+        runners = [r for r in self._runners.values() if not r.done()]
+        if not runners:
+            return
+        _, pending = await asyncio.wait(runners, timeout=self.stop_timeout)
+        for runner in pending:
+            runner.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._runners.clear()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def _should_shed(self, task: SupervisedTask) -> bool:
+        """Skip this tick if a more important task is running behind."""
+        if task._consecutive_shed >= self.MAX_CONSECUTIVE_SHED:
+            return False
+        return any(
+            other.priority < task.priority and other.late
+            for other in self._tasks.values()
+        )
+
+    async def _supervise(self, task: SupervisedTask):
+        """Run a task's loop, restarting it with backoff when it crashes."""
+        while not self.stopping:
+            try:
+                await self._loop(task)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                task.crashes += 1
+                delay = calculate_delay(task._consecutive_crashes, task.backoff)
+                task._consecutive_crashes += 1
+                log.error(f"Task '{task.name}' crashed: {e} - restarting in {delay:.1f}s")
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _loop(self, task: SupervisedTask):
+        next_due = time.monotonic()
+        while not self.stopping:
+            now = time.monotonic()
+            if now < next_due:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=next_due - now)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+
+            started = time.monotonic()
+            task.last_lag = max(0.0, started - next_due)
+            task.max_lag = max(task.max_lag, task.last_lag)
+            next_due += task.interval
+
+            if self._should_shed(task):
+                task.shed += 1
+                task._consecutive_shed += 1
+                continue
+
+            task._consecutive_shed = 0
+            task._running_since = started
+            try:
+                with metrics.tick(task.name):
+                    if task.timeout is None:
+                        await task.func()
+                    else:
+                        await asyncio.wait_for(task.func(), timeout=task.timeout)
+            except asyncio.TimeoutError:
+                task.timeouts += 1
+                log.warning(f"Task '{task.name}' timed out after {task.timeout}s")
+            finally:
+                task._running_since = None
+                ended = time.monotonic()
+                task.last_duration = ended - started
+                if ended > next_due:
+                    # Overran the next tick: start it now rather than bursting to catch up
+                    task.overruns += 1
+                    next_due = ended
+
+            task.runs += 1
+            task._consecutive_crashes = 0
+
+    def get_stats(self) -> dict:
+        """Get per-task statistics keyed by task name."""
+        return {name: task.get_stats() for name, task in self._tasks.items()}
@@ -0,0 +1,200 @@
+# lithood/sweep.py
+"""Parallel parameter sweeps of the grid backtester over shared, memory-mapped prices."""
+
+import csv
+import itertools
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from lithood.backtest import BacktestResult, GridBacktester, price_ticks
+from lithood.infinite_grid import InfiniteGridConfig
+from lithood.logger import log
+
+# Files making up a sweep data directory (one .npy array each)
+_ARRAYS = ("times", "prices", "ticks")
+
+# Fields a results table can be ranked by; larger is better unless listed in LOWER_IS_BETTER
+RANK_FIELDS = ("pnl", "profit", "cycles", "end_equity", "min_equity", "max_drawdown", "inventory_swing")
+LOWER_IS_BETTER = ("max_drawdown", "inventory_swing")
+
+_PARAM_COLUMNS = ("num_levels", "level_spacing_pct", "lit_per_order", "recenter_threshold")
+_RESULT_COLUMNS = (
+    "pnl", "profit", "cycles", "buy_fills", "sell_fills", "fees", "recenters",
+    "end_equity", "min_equity", "max_drawdown", "end_inventory", "min_inventory",
+    "max_inventory", "inventory_swing", "min_cash", "floor_breaches", "missed_fills", "events",
+)
+
+# Per-process state set by _init_worker: memory-mapped arrays and backtester settings
+_worker: dict = {}
+
+
+def expand_grid(
+    num_levels: Iterable[int],
+    level_spacing_pct: Iterable[Decimal],
+    lit_per_order: Iterable[Decimal],
+    recenter_threshold: Iterable[int],
+    total_grid_lit: Decimal = Decimal("16000"),
+) -> list[InfiniteGridConfig]:
+    """Build the cartesian product of parameter values as grid configs.
+
+    Combinations whose recenter threshold exceeds the number of levels are
+    skipped (the engine would never recenter on a level that doesn't exist).
+    """
+    configs = []
+    for levels, spacing, size, threshold in itertools.product(
+        num_levels, level_spacing_pct, lit_per_order, recenter_threshold
+    ):
+        if threshold > levels:
+            continue
+        configs.append(InfiniteGridConfig(
+            num_levels=levels,
+            level_spacing_pct=Decimal(spacing),
+            lit_per_order=Decimal(size),
+            total_grid_lit=total_grid_lit,
+            recenter_threshold=threshold,
+        ))
+    return configs
+
+
+def save_price_data(directory: str, times: np.ndarray, prices: np.ndarray) -> Path:
+    """Write a price path as .npy files that sweep workers map read-only.
+
+    Ticks are computed once here instead of per backtest.
+
+    Returns:
+        The data directory
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    np.save(path / "times.npy", np.ascontiguousarray(times, dtype=np.float64))
+    np.save(path / "prices.npy", prices)
+    np.save(path / "ticks.npy", price_ticks(prices))
+    return path
+
+
+def load_price_data(directory: str) -> dict[str, np.ndarray]:
+    """Map a saved price path read-only (pages are shared between processes)."""
+    path = Path(directory)
+    return {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _ARRAYS}
+
+
+def _init_worker(data_dir: str, backtest_kwargs: dict):
+    _worker["data"] = load_price_data(data_dir)
+    _worker["kwargs"] = backtest_kwargs
+
+
+def _run_chunk(chunk: list[tuple[int, InfiniteGridConfig]]) -> list[tuple[int, BacktestResult]]:
+    data = _worker["data"]
+    results = []
+    for index, config in chunk:
+        backtester = GridBacktester(config, **_worker["kwargs"])
+        results.append((index, backtester.run(data["times"], data["prices"], ticks=data["ticks"])))
+    return results
+
+
+def run_sweep(
+    times: np.ndarray,
+    prices: np.ndarray,
+    configs: list[InfiniteGridConfig],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    data_dir: Optional[str] = None,
+    **backtest_kwargs,
+) -> list[BacktestResult]:
+    """Backtest every config over one price path across a process pool.
+
+    The path is written once as .npy files and each worker maps it with
+    mmap_mode="r", so the OS shares the pages and tasks only carry configs.
+    Configs are handed out in chunks to keep per-task overhead small.
+
+    Args:
+        times: Point times in seconds
+        prices: Prices at each point
+        configs: Grid configs to test
+        workers: Worker processes (default: all cores)
+        chunk_size: Configs per task (default: ~8 tasks per worker)
+        data_dir: Where to write the shared arrays (default: a temp dir
+            removed afterwards)
+        **backtest_kwargs: Passed to GridBacktester (initial_lit, maker_fee, ...)
+
+    Returns:
+        One BacktestResult per config, in config order
+    """
+    if not configs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, len(configs) // (workers * 8))
+    indexed = list(enumerate(configs))
+    chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+    with tempfile.TemporaryDirectory(prefix="lithood_sweep_") as tmp:
+        directory = save_price_data(data_dir or tmp, times, prices)
+        log.info(f"Sweeping {len(configs)} configs over {len(prices):,} points "
+                 f"({workers} workers, {len(chunks)} tasks)")
+
+        results: list[Optional[BacktestResult]] = [None] * len(configs)
+        done = 0
+        started = time.monotonic()
+        last_report = started
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(directory), backtest_kwargs),
+        ) as pool:
+            futures = [pool.submit(_run_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for index, result in future.result():
+                    results[index] = result
+                done += 1
+                now = time.monotonic()
+                if now - last_report >= 10 or done == len(chunks):
+                    last_report = now
+                    finished = sum(r is not None for r in results)
+                    log.info(f"Sweep progress: {finished}/{len(configs)} configs ({now - started:.1f}s)")
+    return results
+
+
+def rank_results(
+    results: list[BacktestResult],
+    by: str = "pnl",
+    exclude_breaches: bool = True,
+) -> list[BacktestResult]:
+    """Sort results best-first by a metric.
+
+    Args:
+        results: Sweep results
+        by: One of RANK_FIELDS
+        exclude_breaches: Rank configs that breached the floor after all others
+
+    Returns:
+        Sorted list
+    """
+    if by not in RANK_FIELDS:
+        raise ValueError(f"Unknown rank field {by} (expected one of {', '.join(RANK_FIELDS)})")
+    sign = 1 if by in LOWER_IS_BETTER else -1
+    return sorted(
+        results,
+        key=lambda r: ((exclude_breaches and r.floor_breaches > 0), sign * getattr(r, by)),
+    )
+
+
+def write_results_csv(path: str, ranked: list[BacktestResult]):
+    """Write a ranked results table (one row per config, best first)."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("rank",) + _PARAM_COLUMNS + _RESULT_COLUMNS)
+        for rank, result in enumerate(ranked, start=1):
+            writer.writerow(
+                [rank]
+                + [result.params[c] for c in _PARAM_COLUMNS]
+                + [round(v, 6) if isinstance(v, float) else v
+                   for v in (getattr(result, c) for c in _RESULT_COLUMNS)]
+            )
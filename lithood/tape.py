@@ -0,0 +1,298 @@
+# lithood/tape.py
+"""Market tape: append-only columnar recording of books, trades and funding."""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from lithood.config import (
+    TAPE_BOOK_INTERVAL_SECONDS,
+    TAPE_DEPTH_INTERVAL_SECONDS,
+    TAPE_DEPTH_LEVELS,
+    TAPE_FUNDING_INTERVAL_SECONDS,
+    TAPE_TRADES_INTERVAL_SECONDS,
+)
+from lithood.logger import log
+from lithood.supervisor import SupervisedTask
+from lithood.types import Market, MarketType
+
+# Column layout per stream. Timestamps are int64 microseconds since the epoch;
+# prices and sizes are int64 ticks of the market's price/size decimals.
+STREAMS: dict[str, tuple[tuple[str, str], ...]] = {
+    "bbo": (("ts", "<i8"), ("bid_price", "<i8"), ("bid_size", "<i8"), ("ask_price", "<i8"), ("ask_size", "<i8")),
+    "depth": (("ts", "<i8"), ("side", "<i1"), ("level", "<i2"), ("price", "<i8"), ("size", "<i8")),
+    "trades": (("ts", "<i8"), ("trade_id", "<i8"), ("price", "<i8"), ("size", "<i8"), ("side", "<i1")),
+    "funding": (("ts", "<i8"), ("rate", "<f8")),
+}
+
+# side column values: book side for depth, taker side for trades
+BID, ASK = 0, 1
+BUY, SELL = 0, 1
+
+INDEX_FILE = "index.json"
+
+
+def market_key(symbol: str, market_type: MarketType) -> str:
+    """Directory name for a market, e.g. "LIT_spot"."""
+    return f"{symbol.replace('/', '-')}_{market_type.value}"
+
+
+def _day(ts_us: int) -> str:
+    return datetime.fromtimestamp(ts_us / 1e6, tz=timezone.utc).strftime("%Y%m%d")
+
+
+def _ticks(value: Decimal, decimals: int) -> int:
+    return int(value.scaleb(decimals))
+
+
+class TapeWriter:
+    """Buffers rows in memory and appends them to per-column files.
+
+    Layout: ``<root>/<market>/<YYYYMMDD>/<stream>.<column>.bin`` holding
+    raw little-endian values, one file per column, so a day of any column
+    can be mapped directly with np.memmap. Days rotate on the UTC date of
+    each row's timestamp. ``index.json`` at the root records the markets
+    (with their tick scales) and the row count and time range of every
+    stream-day, and is rewritten atomically after each flush.
+
+    Rows are only written on flush(), so a crash loses at most the rows
+    since the last flush; readers size columns from the files themselves
+    and trim to the shortest, so a torn flush never misaligns rows.
+    """
+
+    def __init__(self, root: str, flush_rows: int = 4096):
+        """Initialize the writer.
+
+        Args:
+            root: Tape directory
+            flush_rows: Flush once this many rows are buffered
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self._buffers: dict[tuple[str, str, str], list[tuple]] = {}
+        self._buffered = 0
+        self.rows_written = 0
+        self.index = self._load_index()
+
+    def _load_index(self) -> dict:
+        path = self.root / INDEX_FILE
+        if path.exists():
+            return json.loads(path.read_text())
+        return {"version": 1, "markets": {}, "days": {}}
+
+    def add_market(self, market: Market) -> str:
+        """Register a market's tick scales; returns its key."""
+        key = market_key(market.symbol, market.market_type)
+        self.index["markets"][key] = {
+            "symbol": market.symbol,
+            "market_type": market.market_type.value,
+            "market_id": market.market_id,
+            "price_decimals": market.price_decimals,
+            "size_decimals": market.size_decimals,
+        }
+        return key
+
+    def append(self, key: str, stream: str, ts_us: int, *values):
+        """Buffer one row (values in STREAMS column order after ts)."""
+        buffer_key = (key, _day(ts_us), stream)
+        self._buffers.setdefault(buffer_key, []).append((ts_us, *values))
+        self._buffered += 1
+        if self._buffered >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        """Append buffered rows to their column files and update the index."""
+        if not self._buffered:
+            return
+        for (key, day, stream), rows in self._buffers.items():
+            if not rows:
+                continue
+            directory = self.root / key / day
+            directory.mkdir(parents=True, exist_ok=True)
+            columns = list(zip(*rows))
+            for (name, dtype), values in zip(STREAMS[stream], columns):
+                with open(directory / f"{stream}.{name}.bin", "ab") as f:
+                    np.asarray(values, dtype=dtype).tofile(f)
+
+            entry = self.index["days"].setdefault(f"{key}/{day}", {}).setdefault(
+                stream, {"rows": 0, "first_ts": rows[0][0], "last_ts": rows[0][0]}
+            )
+            entry["rows"] += len(rows)
+            entry["first_ts"] = min(entry["first_ts"], columns[0][0])
+            entry["last_ts"] = max(entry["last_ts"], columns[0][-1])
+            self.rows_written += len(rows)
+
+        self._buffers.clear()
+        self._buffered = 0
+        tmp = self.root / f"{INDEX_FILE}.tmp"
+        tmp.write_text(json.dumps(self.index, indent=1, sort_keys=True))
+        os.replace(tmp, self.root / INDEX_FILE)
+
+    def close(self):
+        self.flush()
+
+
+class TapeReader:
+    """Zero-copy access to a recorded tape."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.index = json.loads((self.root / INDEX_FILE).read_text())
+
+    def markets(self) -> list[str]:
+        return sorted(self.index["markets"])
+
+    def days(self, key: str) -> list[str]:
+        return sorted(d.split("/", 1)[1] for d in self.index["days"] if d.startswith(f"{key}/"))
+
+    def price_scale(self, key: str) -> tuple[float, float]:
+        """Multipliers turning (price, size) ticks into prices and sizes."""
+        market = self.index["markets"][key]
+        return 10.0 ** -market["price_decimals"], 10.0 ** -market["size_decimals"]
+
+    def read(self, key: str, stream: str, day: str) -> dict[str, np.ndarray]:
+        """Map one stream-day as read-only arrays (no copy)."""
+        directory = self.root / key / day
+        paths = {name: (directory / f"{stream}.{name}.bin", np.dtype(dtype)) for name, dtype in STREAMS[stream]}
+        rows = min(
+            (path.stat().st_size // dtype.itemsize if path.exists() else 0) for path, dtype in paths.values()
+        )
+        if rows == 0:
+            return {name: np.empty(0, dtype) for name, (_, dtype) in paths.items()}
+        return {
+            name: np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+            for name, (path, dtype) in paths.items()
+        }
+
+    def read_range(
+        self,
+        key: str,
+        stream: str,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+    ) -> dict[str, np.ndarray]:
+        """Concatenate a stream over days [start_day, end_day] (copies)."""
+        days = [d for d in self.days(key) if (not start_day or d >= start_day) and (not end_day or d <= end_day)]
+        parts = [self.read(key, stream, d) for d in days]
+        return {
+            name: np.concatenate([p[name] for p in parts]) if parts else np.empty(0, dtype)
+            for name, dtype in STREAMS[stream]
+        }
+
+    def mid_path(self, key: str, start_day: Optional[str] = None, end_day: Optional[str] = None):
+        """(times in seconds, mid prices) from the recorded best bid/offer."""
+        bbo = self.read_range(key, "bbo", start_day, end_day)
+        price_scale, _ = self.price_scale(key)
+        valid = (bbo["bid_price"] > 0) & (bbo["ask_price"] > 0)
+        mids = (bbo["bid_price"][valid] + bbo["ask_price"][valid]) * (price_scale / 2)
+        return bbo["ts"][valid] / 1e6, mids
+
+    def trade_path(self, key: str, start_day: Optional[str] = None, end_day: Optional[str] = None):
+        """(times in seconds, trade prices)."""
+        trades = self.read_range(key, "trades", start_day, end_day)
+        price_scale, _ = self.price_scale(key)
+        return trades["ts"] / 1e6, trades["price"] * price_scale
+
+
+class TapeRecorder:
+    """Polls books, trades and funding for a set of markets into a TapeWriter.
+
+    Each stream is a low-priority supervised task, so the supervisor sheds
+    recording ticks before it delays anything the bot needs.
+    """
+
+    def __init__(
+        self,
+        client,
+        writer: TapeWriter,
+        markets: list[tuple[str, MarketType]],
+        depth_levels: int = TAPE_DEPTH_LEVELS,
+        depth_interval: float = TAPE_DEPTH_INTERVAL_SECONDS,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            client: Connected LighterClient
+            writer: Destination tape
+            markets: (symbol, market type) pairs to record
+            depth_levels: Book levels per side in depth snapshots
+            depth_interval: Seconds between depth snapshots (BBO is every book poll)
+        """
+        self.client = client
+        self.writer = writer
+        self.depth_levels = depth_levels
+        self.depth_interval = depth_interval
+        self.markets: list[tuple[str, MarketType, Market, str]] = []
+        for symbol, market_type in markets:
+            market = client.get_market(symbol, market_type)
+            if market is None:
+                log.warning(f"Tape: market not found, skipping {symbol}_{market_type.value}")
+                continue
+            self.markets.append((symbol, market_type, market, writer.add_market(market)))
+        self._last_depth: dict[str, float] = {}
+        self._last_trade_id: dict[str, int] = {}
+
+    def supervised_tasks(self, priority: int = 8) -> list[SupervisedTask]:
+        return [
+            SupervisedTask("tape_book", self.record_books, interval=TAPE_BOOK_INTERVAL_SECONDS,
+                           priority=priority, timeout=10),
+            SupervisedTask("tape_trades", self.record_trades, interval=TAPE_TRADES_INTERVAL_SECONDS,
+                           priority=priority, timeout=10),
+            SupervisedTask("tape_funding", self.record_funding, interval=TAPE_FUNDING_INTERVAL_SECONDS,
+                           priority=priority, timeout=10),
+            SupervisedTask("tape_flush", self.flush, interval=5, priority=priority),
+        ]
+
+    async def record_books(self):
+        for symbol, market_type, market, key in self.markets:
+            book = await self.client.get_order_book(symbol, market_type, limit=self.depth_levels)
+            if book is None:
+                continue
+            ts = int(book.timestamp.timestamp() * 1e6)
+            pd, sd = market.price_decimals, market.size_decimals
+            bid = book.bids[0] if book.bids else None
+            ask = book.asks[0] if book.asks else None
+            self.writer.append(
+                key, "bbo", ts,
+                _ticks(bid.price, pd) if bid else 0, _ticks(bid.size, sd) if bid else 0,
+                _ticks(ask.price, pd) if ask else 0, _ticks(ask.size, sd) if ask else 0,
+            )
+
+            now = time.monotonic()
+            if now - self._last_depth.get(key, -self.depth_interval) < self.depth_interval:
+                continue
+            self._last_depth[key] = now
+            for side, levels in ((BID, book.bids), (ASK, book.asks)):
+                for level, entry in enumerate(levels):
+                    self.writer.append(key, "depth", ts, side, level, _ticks(entry.price, pd), _ticks(entry.size, sd))
+
+    async def record_trades(self):
+        for symbol, market_type, market, key in self.markets:
+            last_id = self._last_trade_id.get(key)
+            for trade in await self.client.get_recent_trades(symbol, market_type):
+                if last_id is not None and trade.trade_id <= last_id:
+                    continue
+                self.writer.append(
+                    key, "trades", int(trade.timestamp.timestamp() * 1e6), trade.trade_id,
+                    _ticks(trade.price, market.price_decimals), _ticks(trade.size, market.size_decimals),
+                    BUY if trade.is_maker_ask else SELL,
+                )
+                self._last_trade_id[key] = trade.trade_id
+
+    async def record_funding(self):
+        for symbol, market_type, _, key in self.markets:
+            if market_type != MarketType.PERP:
+                continue
+            funding = await self.client.get_funding_rate(symbol)
+            if funding is not None:
+                self.writer.append(key, "funding", int(funding.timestamp.timestamp() * 1e6), float(funding.rate))
+
+    async def flush(self):
+        self.writer.flush()
@@ -0,0 +1,498 @@
+# lithood/transport.py
+"""Shared, hot-swappable HTTP connection pool for the Lighter SDK clients."""
+
+import asyncio
+import inspect
+import socket
+import ssl
+import time
+from typing import Optional, Sequence
+
+import aiohttp
+from lighter.rest import RESTClientObject, RESTResponse
+
+from lithood.health import RttTracker
+from lithood.instrumentation import metrics
+from lithood.logger import log
+
+
+def _nodelay_socket(addr_info) -> socket.socket:
+    """Socket factory that disables Nagle before connecting."""
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+# aiohttp enables TCP_NODELAY in its protocol; set it on the socket too where supported
+_SUPPORTS_SOCKET_FACTORY = "socket_factory" in inspect.signature(aiohttp.TCPConnector.__init__).parameters
+
+
+class Endpoint:
+    """One route to the exchange (base URL + optional proxy) with latency tracking."""
+
+    def __init__(
+        self,
+        url: str,
+        proxy: Optional[str] = None,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+    ):
+        """Initialize the endpoint.
+
+        Args:
+            url: API base URL
+            proxy: Proxy URL for requests on this route, or None
+            failure_threshold: Consecutive failures before the route is benched
+            cooldown: Seconds a benched route is skipped before being retried
+        """
+        self.url = url.rstrip("/")
+        self.proxy = proxy or None
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.rtt = RttTracker()
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self._benched_until = 0.0
+
+    @property
+    def name(self) -> str:
+        """URL plus proxy host, with proxy credentials masked."""
+        if not self.proxy:
+            return self.url
+        return f"{self.url} via {self.proxy.split('@')[-1]}"
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self._benched_until
+
+    def record_success(self, rtt: float):
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.rtt.record(rtt)
+
+    def record_failure(self):
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self._benched_until = time.monotonic() + self.cooldown
+            self.consecutive_failures = 0
+            log.warning(f"Endpoint {self.name} benched for {self.cooldown:.0f}s after repeated failures")
+
+    def get_stats(self) -> dict:
+        stats = self.rtt.snapshot()
+        stats.update({
+            "endpoint": self.name,
+            "healthy": self.healthy,
+            "requests": self.requests,
+            "failures": self.failures,
+        })
+        return stats
+
+
+class _Route:
+    """Attribute bag RESTClientObject.request() needs to send on one endpoint."""
+
+    def __init__(self, session: aiohttp.ClientSession, proxy: Optional[str]):
+        self.pool_manager = session
+        self.retry_client = None
+        self.proxy = proxy
+        self.proxy_headers = None
+
+
+class HttpPool:
+    """One tuned aiohttp session shared by every SDK ApiClient.
+
+    The reader ApiClient and the SignerClient's ApiClient both route through
+    this pool, so reads and order submission reuse the same keep-alive
+    connections (and the same proxy settings). The session can be swapped
+    while in use: requests already running on the old session finish on it,
+    and it is closed once they drain (or after ``drain_timeout``).
+
+    With several endpoints, requests go to the fastest healthy one (by
+    median RTT). Reads fail over to the next endpoint on transport errors
+    and can optionally be hedged: if the first endpoint hasn't answered
+    within its p95 latency, the same GET is sent to the runner-up and the
+    first response wins. Writes are never hedged or replayed on another
+    endpoint.
+    """
+
+    # Hedge delay bounds (seconds) and the delay used before p95 is known
+    HEDGE_DELAY_MIN = 0.02
+    HEDGE_DELAY_MAX = 2.0
+    HEDGE_DELAY_DEFAULT = 0.25
+    MIN_SAMPLES_FOR_HEDGE_DELAY = 10
+
+    def __init__(
+        self,
+        endpoints: Sequence[Endpoint],
+        pool_size: int = 20,
+        keepalive_timeout: float = 60.0,
+        dns_ttl: int = 300,
+        drain_timeout: float = 10.0,
+        hedge_reads: bool = False,
+    ):
+        """Initialize the pool (the session is created lazily inside the event loop).
+
+        Args:
+            endpoints: Routes to the exchange; the first is the configured
+                base URL that SDK clients build request URLs against
+            pool_size: Max simultaneous connections
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_ttl: Seconds DNS lookups are cached
+            drain_timeout: Max seconds to wait for in-flight requests on swap
+            hedge_reads: Send a backup GET to the runner-up endpoint after a p95 delay
+        """
+        if not endpoints:
+            raise ValueError("HttpPool needs at least one endpoint")
+        self.endpoints = list(endpoints)
+        self.primary_url = self.endpoints[0].url
+        self.hedge_reads = hedge_reads
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.drain_timeout = drain_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        # id(session) -> number of requests currently using it
+        self._in_flight: dict[int, int] = {}
+        self._drain_tasks: set[asyncio.Task] = set()
+
+        # Connection statistics (cumulative across swaps)
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        self.swaps = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.waiting = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = self._new_session()
+        return self._session
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_created)
+        trace.on_connection_reuseconn.append(self._on_reused)
+        trace.on_connection_queued_start.append(self._on_queued_start)
+        trace.on_connection_queued_end.append(self._on_queued_end)
+        trace.on_dns_cache_hit.append(self._on_dns_hit)
+
+        connector_kwargs = dict(
+            limit=self.pool_size,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_ttl,
+            use_dns_cache=True,
+            ssl=ssl.create_default_context(),
+        )
+        if _SUPPORTS_SOCKET_FACTORY:
+            connector_kwargs["socket_factory"] = _nodelay_socket
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**connector_kwargs),
+            trace_configs=[trace],
+            trust_env=True,
+        )
+
+    async def _on_created(self, session, ctx, params):
+        self.connections_created += 1
+
+    async def _on_reused(self, session, ctx, params):
+        self.connections_reused += 1
+
+    async def _on_queued_start(self, session, ctx, params):
+        self.waiting += 1
+
+    async def _on_queued_end(self, session, ctx, params):
+        self.waiting -= 1
+
+    async def _on_dns_hit(self, session, ctx, params):
+        self.dns_cache_hits += 1
+
+    def acquire(self, session: aiohttp.ClientSession):
+        """Mark a request as in flight on the given session."""
+        key = id(session)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def release(self, session: aiohttp.ClientSession):
+        """Mark a request on the given session as finished."""
+        key = id(session)
+        remaining = self._in_flight.get(key, 0) - 1
+        if remaining > 0:
+            self._in_flight[key] = remaining
+        else:
+            self._in_flight.pop(key, None)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight on the current session."""
+        if self._session is None:
+            return 0
+        return self._in_flight.get(id(self._session), 0)
+
+    def swap(self) -> None:
+        """Atomically install a fresh session and drain the old one in the background."""
+        old = self._session
+        self._session = self._new_session()
+        self.swaps += 1
+        if old is None or old.closed:
+            return
+
+        task = asyncio.create_task(self._drain_and_close(old))
+        self._drain_tasks.add(task)
+        task.add_done_callback(self._drain_tasks.discard)
+
+    async def _drain_and_close(self, session: aiohttp.ClientSession) -> None:
+        key = id(session)
+        deadline = time.monotonic() + self.drain_timeout
+        while self._in_flight.get(key, 0) > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        abandoned = self._in_flight.pop(key, 0)
+        if abandoned:
+            log.warning(f"Closing old HTTP session with {abandoned} requests still in flight")
+        try:
+            await session.close()
+        except Exception as e:
+            log.debug("Error closing old HTTP session: %s", e)
+
+    async def warm_up(self, path: str = "/", connections: int = 2) -> int:
+        """Open connections to every endpoint so the first orders skip the handshake.
+
+        Also seeds each endpoint's latency window for routing.
+
+        Args:
+            path: Cheap endpoint path to hit (e.g. the status endpoint)
+            connections: Concurrent requests per endpoint
+
+        Returns:
+            Number of successful warm-up requests
+        """
+        session = self.session
+
+        async def _hit(endpoint: Endpoint) -> bool:
+            start = time.monotonic()
+            try:
+                async with session.get(endpoint.url + path, proxy=endpoint.proxy) as resp:
+                    await resp.read()
+                endpoint.record_success(time.monotonic() - start)
+                return True
+            except Exception as e:
+                endpoint.record_failure()
+                log.debug("Connection warm-up to %s failed: %s", endpoint.name, e)
+                return False
+
+        results = await asyncio.gather(*(
+            _hit(endpoint) for endpoint in self.endpoints for _ in range(connections)
+        ))
+        return sum(results)
+
+    def ranked_endpoints(self) -> list[Endpoint]:
+        """Healthy endpoints, fastest median RTT first (unmeasured ones keep config order)."""
+        healthy = [e for e in self.endpoints if e.healthy] or list(self.endpoints)
+        order = {id(e): i for i, e in enumerate(self.endpoints)}
+
+        def _key(endpoint: Endpoint):
+            p50 = endpoint.rtt.percentile(50)
+            return (p50 is None, p50 or 0.0, order[id(endpoint)])
+
+        return sorted(healthy, key=_key)
+
+    def hedge_delay(self, endpoint: Endpoint) -> float:
+        """Seconds to wait on an endpoint before firing a hedged backup request."""
+        if len(endpoint.rtt) < self.MIN_SAMPLES_FOR_HEDGE_DELAY:
+            return self.HEDGE_DELAY_DEFAULT
+        p95 = endpoint.rtt.percentile(95)
+        return min(self.HEDGE_DELAY_MAX, max(self.HEDGE_DELAY_MIN, p95))
+
+    def get_stats(self) -> dict:
+        """Get pool statistics."""
+        idle = in_use = 0
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            # aiohttp keeps idle connections per host key and tracks acquired ones
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+            in_use = len(getattr(connector, "_acquired", ()))
+        return {
+            "pool_size": self.pool_size,
+            "open": idle + in_use,
+            "idle": idle,
+            "in_use": in_use,
+            "waiting": self.waiting,
+            "created": self.connections_created,
+            "reused": self.connections_reused,
+            "dns_cache_hits": self.dns_cache_hits,
+            "in_flight": self.in_flight,
+            "swaps": self.swaps,
+            "failovers": self.failovers,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+            "endpoints": [e.get_stats() for e in self.endpoints],
+        }
+
+    async def close(self) -> None:
+        """Close the current session and wait for draining sessions."""
+        if self._drain_tasks:
+            await asyncio.gather(*self._drain_tasks, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class SharedRESTClient(RESTClientObject):
+    """SDK REST client backed by a shared HttpPool.
+
+    The SDK's ApiClient only talks to its ``rest_client``, so pointing it at
+    the pool leaves the ApiClient, the API wrappers, the SignerClient and its
+    nonce manager untouched when the pool swaps sessions or endpoints.
+    """
+
+    def __init__(self, pool: HttpPool):
+        # Deliberately skip RESTClientObject.__init__ - it would open its own session
+        self.pool = pool
+        self.proxy = pool.endpoints[0].proxy
+        self.proxy_headers = None
+        self.retry_client = None
+
+    @property
+    def pool_manager(self) -> aiohttp.ClientSession:
+        return self.pool.session
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        method = method.upper()
+        # SDK clients build URLs against the primary base URL; re-root them per endpoint
+        path = url[len(self.pool.primary_url):] if url.startswith(self.pool.primary_url) else None
+        if path is None:
+            return await self._send(None, method, url, headers, body, post_params, _request_timeout)
+
+        ranked = self.pool.ranked_endpoints()
+        if method != "GET" or len(ranked) == 1:
+            return await self._send(ranked[0], method, path, headers, body, post_params, _request_timeout)
+
+        if self.pool.hedge_reads:
+            return await self._hedged(ranked, path, headers, _request_timeout)
+
+        # Idempotent read: fail over to the next endpoint on transport errors
+        for i, endpoint in enumerate(ranked):
+            try:
+                return await self._send(endpoint, method, path, headers, body, post_params, _request_timeout)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                if i == len(ranked) - 1:
+                    raise
+                self.pool.failovers += 1
+                log.warning(f"Read via {endpoint.name} failed - failing over to {ranked[i + 1].name}")
+
+    async def _hedged(self, ranked: list, path: str, headers, _request_timeout) -> RESTResponse:
+        """Send a GET to the best endpoint, and to the runner-up if it is slow."""
+        first, backup = ranked[0], ranked[1]
+        primary = asyncio.create_task(
+            self._send(first, "GET", path, dict(headers or {}), None, None, _request_timeout)
+        )
+        done, _ = await asyncio.wait({primary}, timeout=self.pool.hedge_delay(first))
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self.pool.hedged_requests += 1
+        secondary = asyncio.create_task(
+            self._send(backup, "GET", path, dict(headers or {}), None, None, _request_timeout)
+        )
+        pending = {primary, secondary} - done
+        errors = [primary.exception()] if done else []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if task is secondary:
+                        self.pool.hedge_wins += 1
+                    return task.result()
+                errors.append(task.exception())
+        raise errors[-1]
+
+    async def _send(
+        self,
+        endpoint: Optional[Endpoint],
+        method,
+        path_or_url,
+        headers,
+        body,
+        post_params,
+        _request_timeout,
+    ) -> RESTResponse:
+        """Send one request on the current session, recording endpoint latency."""
+        # Capture the session once so a concurrent swap can't split the request
+        session = self.pool.session
+        url = endpoint.url + path_or_url if endpoint is not None else path_or_url
+        route = _Route(session, endpoint.proxy if endpoint is not None else self.proxy)
+
+        self.pool.acquire(session)
+        metrics.count("api_calls")
+        start = time.monotonic()
+        try:
+            response = await RESTClientObject.request(
+                route, method, url,
+                headers=headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+            # Read the body now so a swapped-out session can be closed once we
+            # return (RESTResponse caches it for the SDK's own read()).
+            await response.read()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if endpoint is not None:
+                endpoint.record_failure()
+            raise
+        finally:
+            self.pool.release(session)
+            metrics.record_ns(f"http.{method}", int((time.monotonic() - start) * 1e9))
+
+        if endpoint is not None:
+            if response.status >= 500:
+                endpoint.record_failure()
+            else:
+                endpoint.record_success(time.monotonic() - start)
+        return response
+
+    async def close(self):
+        # The pool is shared - its owner closes it
+        pass
+
+
+async def install_shared_transport(api_client, pool: HttpPool) -> SharedRESTClient:
+    """Point an ApiClient at the shared pool, releasing its default REST client.
+
+    Args:
+        api_client: lighter ApiClient (the reader's or the SignerClient's)
+        pool: Shared HttpPool
+
+    Returns:
+        The installed SharedRESTClient
+    """
+    current: Optional[RESTClientObject] = api_client.rest_client
+    if isinstance(current, SharedRESTClient) and current.pool is pool:
+        return current
+    transport = SharedRESTClient(pool)
+    api_client.rest_client = transport
+    if current is not None and not isinstance(current, SharedRESTClient):
+        # The SDK's default client has made no requests yet - just release it
+        await current.close()
+    return transport
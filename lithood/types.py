@@ -104,6 +104,7 @@ class Order:
     order_type: OrderType
     tx_hash: Optional[str] = None  # Transaction hash from order placement
     grid_level: Optional[int] = None
+    client_order_index: Optional[int] = None  # Our deterministic id, sent with the order
     created_at: datetime = field(default_factory=datetime.now)
     filled_at: Optional[datetime] = None
     filled_size: Decimal = Decimal("0")
@@ -145,3 +146,30 @@ class FundingRate:
     market_id: int
     rate: Decimal  # Hourly rate
     timestamp: datetime
+
+
+@dataclass
+class BookLevel:
+    """One aggregated order book price level."""
+    price: Decimal
+    size: Decimal
+
+
+@dataclass
+class OrderBook:
+    """Order book snapshot, best levels first."""
+    market_id: int
+    bids: list[BookLevel]
+    asks: list[BookLevel]
+    timestamp: datetime
+
+
+@dataclass
+class Trade:
+    """Public trade print."""
+    trade_id: int
+    market_id: int
+    price: Decimal
+    size: Decimal
+    is_maker_ask: bool  # True when the taker bought
+    timestamp: datetime
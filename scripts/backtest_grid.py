@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Backtest an infinite-grid configuration over historical prices.
+
+Input is either OHLC candles (CSV: timestamp,open,high,low,close), trade
+ticks (CSV: timestamp,price; timestamps in epoch seconds or milliseconds),
+or mid prices from a tape recorded by scripts/record_tape.py.
+
+Usage:
+    python scripts/backtest_grid.py --candles lit_1m.csv --levels 15 --spacing 0.02
+    python scripts/backtest_grid.py --ticks lit_trades.csv --lit 16000 --usdc 5000 --json
+    python scripts/backtest_grid.py --tape data/tape --market LIT-USDC_spot
+"""
+
+import argparse
+import json
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lithood.backtest import GridBacktester, load_candles, load_ticks
+from lithood.config import FLOOR_CONFIG, SPOT_SYMBOL
+from lithood.infinite_grid import InfiniteGridConfig, InfiniteGridEngine
+from lithood.tape import TapeReader, market_key
+from lithood.types import MarketType
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backtest the infinite grid over historical prices")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--candles", help="OHLC candles CSV")
+    source.add_argument("--ticks", help="Trade ticks CSV")
+    source.add_argument("--tape", help="Recorded tape directory (mid prices)")
+    parser.add_argument("--market", default=market_key(SPOT_SYMBOL, MarketType.SPOT), help="Tape market key")
+    parser.add_argument("--levels", type=int, default=15, help="Levels per side")
+    parser.add_argument("--spacing", type=Decimal, default=Decimal("0.02"), help="Level spacing (0.02 = 2%%)")
+    parser.add_argument("--lit-per-order", type=Decimal, default=Decimal("350"), help="LIT per order")
+    parser.add_argument("--threshold", type=int, default=2, help="Recenter within N levels of the edge")
+    parser.add_argument("--lit", type=Decimal, default=Decimal("16000"), help="Starting LIT")
+    parser.add_argument("--usdc", type=Decimal, default=Decimal("0"), help="Starting USDC")
+    parser.add_argument("--grace", type=float, default=InfiniteGridEngine.FILL_GRACE_SECONDS,
+                        help="Fill detection delay in seconds")
+    parser.add_argument("--fee", type=Decimal, default=Decimal("0"), help="Maker fee rate")
+    parser.add_argument("--floor", type=Decimal, default=FLOOR_CONFIG["emergency_buffer"],
+                        help="Equity counted as a floor breach")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if args.tape:
+        times, prices = TapeReader(args.tape).mid_path(args.market)
+    else:
+        times, prices = load_candles(args.candles) if args.candles else load_ticks(args.ticks)
+    load_seconds = time.perf_counter() - t0
+
+    config = InfiniteGridConfig(
+        num_levels=args.levels,
+        level_spacing_pct=args.spacing,
+        lit_per_order=args.lit_per_order,
+        total_grid_lit=args.lit,
+        recenter_threshold=args.threshold,
+    )
+    backtester = GridBacktester(
+        config,
+        initial_lit=args.lit,
+        initial_usdc=args.usdc,
+        fill_grace_seconds=args.grace,
+        maker_fee=args.fee,
+        floor_value=args.floor,
+    )
+
+    t0 = time.perf_counter()
+    result = backtester.run(times, prices)
+    run_seconds = time.perf_counter() - t0
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+        return 0
+
+    days = (times[-1] - times[0]) / 86400 if len(times) > 1 else 0
+    print(f"Path: {result.points:,} points over {days:.1f} days (loaded in {load_seconds:.2f}s, "
+          f"replayed in {run_seconds:.2f}s, {result.events:,} events)")
+    print(f"Config: {args.levels} levels x {args.spacing * 100}% spacing, {args.lit_per_order} LIT/order, "
+          f"recenter threshold {args.threshold}")
+    print()
+    print(f"  Cycles:          {result.cycles:,} ({result.buy_fills:,} buys, {result.sell_fills:,} sells)")
+    print(f"  Grid profit:     ${result.profit:,.2f} (engine accounting)")
+    print(f"  Equity PnL:      ${result.pnl:,.2f} (${result.start_equity:,.2f} -> ${result.end_equity:,.2f})")
+    print(f"  Fees:            ${result.fees:,.2f}")
+    print(f"  Recenters:       {result.recenters:,} ({result.missed_fills} undetected fills dropped)")
+    print(f"  Inventory:       {result.min_inventory:,.0f} .. {result.max_inventory:,.0f} LIT "
+          f"(swing {result.inventory_swing:,.0f})")
+    print(f"  Min cash:        ${result.min_cash:,.2f}")
+    print(f"  Max drawdown:    ${result.max_drawdown:,.2f} (min equity ${result.min_equity:,.2f})")
+    print(f"  Floor breaches:  {result.floor_breaches} (equity <= ${args.floor:,})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Benchmark the grid engine hot paths against the offline simulated exchange.
+
+Each scenario seeds N open grid orders (on the fake exchange and in a
+SQLite state file) plus H rows of filled order history, then measures:
+- check_fills         first fill poll after startup (nothing filled)
+- check_fills_fill    fill poll after the price trades through 10 buys
+- check_fills_steady  fill poll after a previous one (nothing changed)
+- reconcile_orders    full reconciliation pass
+- recenter            cancel everything and rebuild the grid
+- state.save_order    one order insert
+- state.get_pending_orders
+- state.get_grid_stats
+
+Reported per operation: wall and CPU time (median of --repeat runs), API
+calls issued, SQLite commits, and peak/net Python allocations (from a
+separate tracemalloc run so tracing doesn't skew the timings).
+
+Results are written as JSON; --baseline compares against a stored run and
+exits non-zero on regressions (CPU time beyond --threshold, or more API
+calls or commits than before).
+
+Usage:
+    python scripts/benchmark_grid.py --output bench.json
+    python scripts/benchmark_grid.py --orders 30,10000 --history 1000,1000000
+    python scripts/benchmark_grid.py --baseline bench.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lighter import SignerClient
+
+from lithood.client import LighterClient
+from lithood.fake_exchange import FakeExchange, FakeMarket
+from lithood.infinite_grid import InfiniteGridEngine, InfiniteGridConfig, grid_level
+from lithood.instrumentation import metrics
+from lithood.ladder import PriceLadder
+from lithood.state import StateManager
+from lithood.types import Order, OrderSide, OrderStatus, OrderType
+from lithood.config import SPOT_SYMBOL
+
+# Scenario shape: a dense grid around $100 so 10k levels stay distinct at 4dp
+CENTER_PRICE = Decimal("100")
+LEVEL_SPACING = Decimal("0.0005")
+LIT_PER_ORDER = Decimal("1")
+FILLS_PER_RUN = 10
+SPOT_MARKET_ID = 2048
+
+DEFAULT_ORDERS = "30,300,3000,10000"
+DEFAULT_HISTORY = "1000,100000,1000000"
+
+# Recenter re-queries active orders per placement (quadratic in open orders),
+# so larger scenarios are skipped unless --recenter-max-orders raises this
+RECENTER_MAX_ORDERS = 1000
+
+# CPU slowdowns smaller than this are treated as timer noise
+NOISE_FLOOR_MS = 0.5
+
+
+class Scenario:
+    """A seeded engine + exchange + state file, rebuilt for every measured run."""
+
+    def __init__(self, template_db: Path, num_orders: int, work_dir: Path):
+        self.template_db = template_db
+        self.num_orders = num_orders
+        self.work_dir = work_dir
+        self.exchange = None
+        self.client = None
+        self.state = None
+        self.grid = None
+
+    async def build(self):
+        db_path = self.work_dir / "state.db"
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        shutil.copyfile(self.template_db, db_path)
+
+        self.exchange = FakeExchange(
+            markets=[FakeMarket(symbol=SPOT_SYMBOL, market_id=SPOT_MARKET_ID, is_spot=True,
+                                base_asset_id=2, quote_asset_id=3, price=CENTER_PRICE)],
+            balances={2: Decimal("1e9"), 3: Decimal("1e12")},
+        )
+        market = self.exchange.market(SPOT_MARKET_ID)
+        # Order indexes are assigned sequentially, matching the ids in the template
+        for side, price in grid_levels(self.num_orders):
+            await self.exchange.signer_client.create_order(
+                market_index=SPOT_MARKET_ID,
+                client_order_index=0,
+                base_amount=int(LIT_PER_ORDER.scaleb(market.size_decimals)),
+                price=market.to_price_int(price),
+                is_ask=side == OrderSide.SELL,
+                order_type=SignerClient.ORDER_TYPE_LIMIT,
+                time_in_force=SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY,
+            )
+        assert len(self.exchange.open_orders()) == self.num_orders, self.exchange.rejects[:5]
+
+        self.client = LighterClient()
+        await self.client.connect_offline(self.exchange)
+        self.state = StateManager(db_path=str(db_path))
+        self.grid = InfiniteGridEngine(self.client, self.state, grid_config(self.num_orders))
+        self.grid._grid_center = CENTER_PRICE
+        self.grid._generate_levels(CENTER_PRICE)
+        self.exchange.calls.clear()
+
+    async def close(self):
+        self.state.close()
+        await self.client.close()
+
+
+def grid_levels(num_orders: int) -> list[tuple[OrderSide, Decimal]]:
+    """Buy and sell levels for a scenario, in seeding order."""
+    per_side = num_orders // 2
+    ladder = PriceLadder(CENTER_PRICE, LEVEL_SPACING, 4)
+    levels = [(OrderSide.BUY, ladder.price(-i)) for i in range(1, per_side + 1)]
+    levels += [(OrderSide.SELL, ladder.price(i)) for i in range(1, num_orders - per_side + 1)]
+    return levels
+
+
+def grid_config(num_orders: int) -> InfiniteGridConfig:
+    return InfiniteGridConfig(
+        num_levels=max(1, num_orders // 2),
+        level_spacing_pct=LEVEL_SPACING,
+        lit_per_order=LIT_PER_ORDER,
+        total_grid_lit=LIT_PER_ORDER * num_orders,
+        recenter_threshold=2,
+    )
+
+
+def build_template(path: Path, num_orders: int, history: int):
+    """Create a state DB with open grid orders and `history` filled rows."""
+    state = StateManager(db_path=str(path))
+    created = (datetime.now() - timedelta(hours=1)).isoformat()
+    open_rows = [
+        (str(i), SPOT_MARKET_ID, side.value, str(price), str(LIT_PER_ORDER),
+         OrderStatus.PENDING.value, OrderType.LIMIT.value, grid_level(price), created, None, "0")
+        for i, (side, price) in enumerate(grid_levels(num_orders), start=1)
+    ]
+    filled_at = datetime.now() - timedelta(days=30)
+
+    def history_rows():
+        for i in range(history):
+            side = OrderSide.BUY if i % 2 else OrderSide.SELL
+            ts = (filled_at + timedelta(seconds=i)).isoformat()
+            yield (f"h{i}", SPOT_MARKET_ID, side.value, "100.0000", str(LIT_PER_ORDER),
+                   OrderStatus.FILLED.value, OrderType.LIMIT.value, None, ts, ts, str(LIT_PER_ORDER))
+
+    insert = "INSERT INTO orders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    state.conn.executemany(insert, history_rows())
+    state.conn.executemany(insert, open_rows)
+    state.conn.commit()
+    state.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    state.close()
+
+
+# -----------------------------------------------------------------------------
+# Operations (each gets a freshly built scenario)
+# -----------------------------------------------------------------------------
+
+async def op_check_fills(s: Scenario):
+    await s.grid.check_fills()
+
+
+async def prepare_fills(s: Scenario):
+    # Trade down through the top FILLS_PER_RUN buys
+    buys = sorted((o for o in s.exchange.open_orders() if not o.is_ask), key=lambda o: -o.price)
+    if buys:
+        market = s.exchange.market(SPOT_MARKET_ID)
+        target = buys[min(FILLS_PER_RUN, len(buys)) - 1]
+        s.exchange.set_price(SPOT_MARKET_ID, market.to_price(target.price))
+    s.exchange.calls.clear()
+
+
+async def prepare_steady(s: Scenario):
+    # One tick first, so the measured one sees an unchanged exchange
+    await s.grid.check_fills()
+    s.exchange.calls.clear()
+
+
+async def op_reconcile(s: Scenario):
+    await s.grid.reconcile_orders()
+
+
+async def op_recenter(s: Scenario):
+    await s.grid._recenter(CENTER_PRICE)
+
+
+async def op_save_order(s: Scenario):
+    s.state.save_order(Order(
+        id="bench-order",
+        market_id=SPOT_MARKET_ID,
+        side=OrderSide.BUY,
+        price=Decimal("99.9"),
+        size=LIT_PER_ORDER,
+        status=OrderStatus.PENDING,
+        order_type=OrderType.LIMIT,
+        created_at=datetime.now(),
+    ))
+
+
+async def op_get_pending(s: Scenario):
+    s.state.get_pending_orders()
+
+
+async def op_grid_stats(s: Scenario):
+    s.state.get_grid_stats()
+
+
+# name -> (operation, optional per-run preparation outside the measurement)
+OPERATIONS = {
+    "check_fills": (op_check_fills, None),
+    "check_fills_fill": (op_check_fills, prepare_fills),
+    "check_fills_steady": (op_check_fills, prepare_steady),
+    "reconcile_orders": (op_reconcile, None),
+    "recenter": (op_recenter, None),
+    "state.save_order": (op_save_order, None),
+    "state.get_pending_orders": (op_get_pending, None),
+    "state.get_grid_stats": (op_grid_stats, None),
+}
+
+
+@contextlib.contextmanager
+def engine_logging(verbose: bool):
+    """Silence engine INFO lines unless verbose - per-order logging would dominate the measurements."""
+    if verbose:
+        yield
+        return
+    logging.disable(logging.INFO)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+async def measure(scenario: Scenario, op, prepare, trace: bool) -> dict:
+    await scenario.build()
+    if prepare is not None:
+        await prepare(scenario)
+
+    commits_before = metrics.histogram("db_commit").count
+    if trace:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    await op(scenario)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    result = {
+        "wall_ms": wall * 1000,
+        "cpu_ms": cpu * 1000,
+        "api_calls": sum(scenario.exchange.calls.values()),
+        "commits": metrics.histogram("db_commit").count - commits_before,
+    }
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["alloc_peak_kib"] = (peak - mem_before) / 1024
+        result["alloc_net_kib"] = (current - mem_before) / 1024
+
+    await scenario.close()
+    return result
+
+
+async def run_benchmarks(
+    orders: list[int],
+    histories: list[int],
+    ops: list[str],
+    repeat: int,
+    recenter_max_orders: int = RECENTER_MAX_ORDERS,
+    verbose: bool = False,
+) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="lithood-bench-") as tmp:
+        work_dir = Path(tmp)
+        for num_orders in orders:
+            for history in histories:
+                template = work_dir / f"template_{num_orders}_{history}.db"
+                t0 = time.perf_counter()
+                build_template(template, num_orders, history)
+                print(f"Scenario orders={num_orders} history={history} (template built in {time.perf_counter() - t0:.1f}s)", flush=True)
+
+                scenario = Scenario(template, num_orders, work_dir)
+                for name in ops:
+                    if name == "recenter" and num_orders > recenter_max_orders:
+                        print(f"  {name:<26} skipped (orders > {recenter_max_orders})", flush=True)
+                        continue
+                    op, prepare = OPERATIONS[name]
+                    with engine_logging(verbose):
+                        runs = [await measure(scenario, op, prepare, trace=False) for _ in range(repeat)]
+                        traced = await measure(scenario, op, prepare, trace=True)
+                    row = {
+                        "orders": num_orders,
+                        "history": history,
+                        "op": name,
+                        "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 3),
+                        "cpu_ms": round(statistics.median(r["cpu_ms"] for r in runs), 3),
+                        "api_calls": runs[0]["api_calls"],
+                        "commits": runs[0]["commits"],
+                        "alloc_peak_kib": round(traced["alloc_peak_kib"], 1),
+                        "alloc_net_kib": round(traced["alloc_net_kib"], 1),
+                    }
+                    results.append(row)
+                    print(
+                        f"  {name:<26} wall={row['wall_ms']:>10.2f}ms cpu={row['cpu_ms']:>10.2f}ms "
+                        f"api={row['api_calls']:>6} commits={row['commits']:>6} "
+                        f"peak={row['alloc_peak_kib']:>9.1f}KiB",
+                        flush=True,
+                    )
+                template.unlink()
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Regressions versus a baseline run (matched on orders/history/op)."""
+    base = {(r["orders"], r["history"], r["op"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'scenario':<40} {'cpu base':>10} {'cpu now':>10} {'ratio':>7} {'api':>11} {'commits':>11}")
+    for row in results:
+        key = (row["orders"], row["history"], row["op"])
+        old = base.get(key)
+        if old is None:
+            continue
+        ratio = row["cpu_ms"] / old["cpu_ms"] if old["cpu_ms"] else 1.0
+        label = f"{row['op']} n={row['orders']} h={row['history']}"
+        print(
+            f"{label:<40} {old['cpu_ms']:>10.2f} {row['cpu_ms']:>10.2f} {ratio:>6.2f}x "
+            f"{old['api_calls']:>5}->{row['api_calls']:<5} {old['commits']:>5}->{row['commits']:<5}"
+        )
+        if ratio > 1 + threshold and row["cpu_ms"] - old["cpu_ms"] > NOISE_FLOOR_MS:
+            regressions.append(f"{label}: CPU {old['cpu_ms']:.2f}ms -> {row['cpu_ms']:.2f}ms ({ratio:.2f}x)")
+        if row["api_calls"] > old["api_calls"]:
+            regressions.append(f"{label}: API calls {old['api_calls']} -> {row['api_calls']}")
+        if row["commits"] > old["commits"]:
+            regressions.append(f"{label}: commits {old['commits']} -> {row['commits']}")
+    return regressions
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent.parent,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def parse_ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark grid engine hot paths offline")
+    parser.add_argument("--orders", default=DEFAULT_ORDERS, help=f"Open order counts (default {DEFAULT_ORDERS})")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help=f"History row counts (default {DEFAULT_HISTORY})")
+    parser.add_argument("--ops", default=",".join(OPERATIONS), help="Comma-separated operations to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation (median reported)")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument(
+        "--recenter-max-orders", type=int, default=RECENTER_MAX_ORDERS,
+        help=f"Skip recenter above this many open orders (default {RECENTER_MAX_ORDERS})",
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed CPU slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--verbose", action="store_true", help="Keep engine INFO logging on")
+    args = parser.parse_args()
+
+    ops = [op for op in args.ops.split(",") if op]
+    unknown = [op for op in ops if op not in OPERATIONS]
+    if unknown:
+        parser.error(f"Unknown operations: {', '.join(unknown)}")
+
+    results = asyncio.run(run_benchmarks(
+        parse_ints(args.orders), parse_ints(args.history), ops, args.repeat, args.recenter_max_orders, args.verbose,
+    ))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_rev": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.baseline} (rev {baseline['meta'].get('git_rev')}):")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
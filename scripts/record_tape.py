@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Record the market tape (best bid/offer, depth snapshots, trades, funding)
+without trading.
+
+Writes append-only column files under TAPE_DIR (one directory per market
+and UTC day) that lithood.tape.TapeReader maps with np.memmap. No API key
+is needed. To record while trading, run scripts/run_infinite_grid.py
+with --record instead.
+
+Usage:
+    python scripts/record_tape.py
+    python scripts/record_tape.py --dir data/tape --markets LIT/USDC:spot,LIT:perp
+    python scripts/record_tape.py --summary
+"""
+
+import argparse
+import asyncio
+import signal
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lithood.client import LighterClient
+from lithood.config import PERP_SYMBOL, SPOT_SYMBOL, TAPE_DIR
+from lithood.logger import log
+from lithood.supervisor import Supervisor
+from lithood.tape import TapeReader, TapeRecorder, TapeWriter
+from lithood.types import MarketType
+
+
+def parse_markets(value: str) -> list[tuple[str, MarketType]]:
+    markets = []
+    for item in value.split(","):
+        symbol, _, market_type = item.strip().rpartition(":")
+        markets.append((symbol, MarketType(market_type)))
+    return markets
+
+
+def print_summary(root: str):
+    reader = TapeReader(root)
+    for key in reader.markets():
+        print(key)
+        for day in reader.days(key):
+            streams = reader.index["days"][f"{key}/{day}"]
+            parts = []
+            for stream, entry in sorted(streams.items()):
+                last = datetime.fromtimestamp(entry["last_ts"] / 1e6, tz=timezone.utc).strftime("%H:%M:%S")
+                parts.append(f"{stream}={entry['rows']:,} (to {last})")
+            print(f"  {day}: {', '.join(parts)}")
+
+
+async def record(root: str, markets: list[tuple[str, MarketType]]):
+    client = LighterClient()
+    await client.connect()
+    writer = TapeWriter(root)
+    recorder = TapeRecorder(client, writer, markets)
+    if not recorder.markets:
+        log.error("No markets to record")
+        await client.close()
+        return 1
+
+    supervisor = Supervisor()
+    for task in recorder.supervised_tasks(priority=0):
+        supervisor.add(task)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    log.info(f"Recording {', '.join(key for *_, key in recorder.markets)} to {root} (Ctrl+C to stop)")
+    supervisor.start()
+    try:
+        await stop.wait()
+    finally:
+        await supervisor.stop()
+        writer.close()
+        await client.close()
+        log.info(f"Tape closed - {writer.rows_written:,} rows written")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Record the market tape")
+    parser.add_argument("--dir", default=TAPE_DIR, help="Tape directory")
+    parser.add_argument("--markets", type=parse_markets, default=[(SPOT_SYMBOL, MarketType.SPOT),
+                                                                  (PERP_SYMBOL, MarketType.PERP)],
+                        help="Comma-separated symbol:type pairs (type is spot or perp)")
+    parser.add_argument("--summary", action="store_true", help="Print what the tape holds and exit")
+    args = parser.parse_args()
+
+    if args.summary:
+        print_summary(args.dir)
+        return 0
+    return asyncio.run(record(args.dir, args.markets))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# scripts/run_coordinator.py
+"""Multi-account grid deployment - one worker process per account/API-key slot.
+
+Each account in the accounts file runs in its own process with its own
+LighterClient and state DB; this process aggregates their metrics and
+portfolio values and applies the floor to the total. A running
+coordinator is controlled over its local socket (the global kill switch).
+
+Usage:
+    python scripts/run_coordinator.py --accounts accounts.json
+    python scripts/run_coordinator.py --accounts accounts.json --resume   # clear bot_halted first
+    python scripts/run_coordinator.py --send status
+    python scripts/run_coordinator.py --send halt        # cancel everything, stop trading
+    python scripts/run_coordinator.py --send liquidate   # emergency exit on every account
+"""
+
+import argparse
+import asyncio
+import json
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lithood.config import COORDINATOR_SOCKET, METRICS_HOST, METRICS_PORT
+from lithood.coordinator import CONTROL_COMMANDS, Coordinator, load_slots, send_command
+from lithood.logger import log
+from lithood.metrics_server import MetricsServer
+from lithood.state import StateManager
+
+STATUS_INTERVAL = 60
+
+
+def clear_halts(slots):
+    for slot in slots:
+        state = StateManager(db_path=slot.state_db)
+        try:
+            if state.get("bot_halted", False):
+                state.set("bot_halted", False)
+                log.warning(f"Cleared bot_halted for {slot.name} ({slot.state_db})")
+        finally:
+            state.close()
+
+
+def report_status(coordinator: Coordinator):
+    stats = coordinator.get_stats()
+    total = f"${stats['total_value']:,.2f}" if stats["total_value"] is not None else "unknown"
+    log.info(f"Total portfolio {total} (emergency at ${stats['emergency_buffer']:,.2f})"
+             f"{' - HALTED: ' + stats['halted'] if stats['halted'] else ''}")
+    for name, account in stats["accounts"].items():
+        value = f"${account['value']:,.2f}" if account["value"] is not None else "-"
+        cycles = sum(g["cycles"] for g in account["grids"].values())
+        profit = sum(g["profit"] for g in account["grids"].values())
+        log.info(f"  {name}: {'up' if account['alive'] else 'DOWN'} | value {value} | cycles {cycles} "
+                 f"| profit ${profit:,.2f} | restarts {account['restarts']}")
+
+
+async def run(args) -> int:
+    slots = load_slots(args.accounts)
+    if args.resume:
+        clear_halts(slots)
+
+    coordinator = Coordinator(slots, socket_path=args.socket)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, coordinator.request_stop)
+
+    log.info("=" * 60)
+    log.info(f"  MULTI-ACCOUNT COORDINATOR - {len(slots)} workers")
+    for slot in slots:
+        log.info(f"  {slot.name}: account {slot.account_index} key {slot.api_key_index} | "
+                 f"{', '.join(spec.key for spec in slot.grids)}")
+    log.info("=" * 60)
+
+    metrics_server = None
+    if METRICS_PORT:
+        metrics_server = MetricsServer(METRICS_HOST, METRICS_PORT)
+        metrics_server.add_collector(coordinator.collect_metrics)
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            log.warning(f"Metrics endpoint disabled - could not bind {METRICS_HOST}:{METRICS_PORT}: {e}")
+            metrics_server = None
+
+    async def status_loop():
+        while True:
+            await asyncio.sleep(STATUS_INTERVAL)
+            report_status(coordinator)
+
+    await coordinator.start()
+    status_task = asyncio.create_task(status_loop())
+    try:
+        await coordinator.wait()
+    finally:
+        status_task.cancel()
+        log.info("Stopping workers...")
+        await coordinator.stop()
+        if metrics_server:
+            await metrics_server.stop()
+        log.info("Coordinator stopped")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Multi-account grid coordinator")
+    parser.add_argument("--accounts", help="Accounts JSON file (see lithood.coordinator.load_slots)")
+    parser.add_argument("--socket", default=COORDINATOR_SOCKET, help="Control socket path")
+    parser.add_argument("--resume", action="store_true", help="Clear bot_halted in every account's state DB first")
+    parser.add_argument("--send", choices=CONTROL_COMMANDS, help="Send a command to a running coordinator and exit")
+    args = parser.parse_args()
+
+    if args.send:
+        reply = asyncio.run(send_command(args.socket, args.send))
+        print(json.dumps(reply, indent=2))
+        return 0 if reply.get("ok") else 1
+    if not args.accounts:
+        parser.error("--accounts is required unless --send is given")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
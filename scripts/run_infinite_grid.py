@@ -23,25 +23,52 @@ from lithood.client import LighterClient
 from lithood.state import StateManager
 from lithood.infinite_grid import InfiniteGridEngine, InfiniteGridConfig
 from lithood.types import MarketType
-from lithood.config import POLL_INTERVAL_SECONDS, SPOT_SYMBOL
+from lithood.config import (
+    POLL_INTERVAL_SECONDS,
+    FILL_CHECK_INTERVAL_SECONDS,
+    METRICS_HOST,
+    METRICS_PORT,
+    PROFILE_MAX_SECONDS,
+    PERP_SYMBOL,
+    SPOT_SYMBOL,
+    TAPE_DIR,
+)
 from lithood.logger import log
-from lithood.retry import RETRY_PERSISTENT, calculate_delay
+from lithood.retry import RETRY_PERSISTENT
+from lithood.supervisor import Supervisor, SupervisedTask
+from lithood.instrumentation import LoopLagSampler, metrics
+from lithood.metrics_server import MetricsServer
+from lithood.profiling import Profiler
+from lithood.tape import TapeRecorder, TapeWriter
+
+# Task cadences (seconds); fills use FILL_CHECK_INTERVAL_SECONDS, recentering POLL_INTERVAL_SECONDS
+PRICE_INTERVAL = 2.0
+RECONCILE_CHECK_INTERVAL = 60  # maybe_reconcile() itself runs a full pass every 30 min
+STATUS_INTERVAL = 60
 
 
 class InfiniteGridBot:
     """Infinite grid bot - no core sells, all capital cycling."""
 
-    def __init__(self, amount: Decimal = Decimal("350"), levels: int = 15):
+    def __init__(self, amount: Decimal = Decimal("350"), levels: int = 15, record: bool = False, fresh: bool = False):
         self.client = LighterClient()
         db_path = os.getenv("BOT_STATE_DB", os.path.join(os.path.dirname(__file__), "..", "infinite_grid_state.db"))
         self.state = StateManager(db_path=db_path)
         self.grid: InfiniteGridEngine = None
         self._running = False
         self._stopped = False
+        self._closed = asyncio.Event()
         self._start_time = None
         self._consecutive_failures = 0
+        self._price: Decimal = None
+        self._supervisor: Supervisor = None
+        self._lag_sampler = LoopLagSampler(metrics)
+        self._metrics_server: MetricsServer = None
         self._amount = amount
         self._levels = levels
+        self._record = record
+        self._fresh = fresh
+        self._tape: TapeWriter = None
 
     async def start(self):
         """Initialize and start the bot."""
@@ -54,6 +81,7 @@ class InfiniteGridBot:
         log.info("=" * 60)
 
         await self.client.connect()
+        self.client.start_health_monitor()
 
         # Configure grid - all available LIT for cycling
         config = InfiniteGridConfig(
@@ -67,16 +95,16 @@ class InfiniteGridBot:
         self.grid = InfiniteGridEngine(self.client, self.state, config)
 
         await self._sync_state()
-        if not await self.grid.initialize():
+        if not await self.grid.initialize(fresh=self._fresh):
             log.error("Failed to initialize grid - aborting bot start")
             raise RuntimeError("Grid initialization failed")
 
         log.info("Infinite Grid Bot initialized. Starting main loop...")
         self._running = True
 
-        current_price = await self.client.get_mid_price(SPOT_SYMBOL, MarketType.SPOT)
-        if current_price:
-            await self._print_status(current_price)
+        self._price = await self.client.get_mid_price(SPOT_SYMBOL, MarketType.SPOT)
+        if self._price:
+            await self._print_status(self._price)
 
         await self._run_loop()
 
@@ -90,58 +118,122 @@ class InfiniteGridBot:
         log.info("State sync complete")
 
     async def _run_loop(self):
-        """Main bot loop."""
-        last_status_time = 0
-        status_interval = 60
-
-        while self._running:
-            try:
-                if self._consecutive_failures >= 3:
-                    if not await self.client.ensure_connected():
-                        delay = calculate_delay(self._consecutive_failures, RETRY_PERSISTENT)
-                        log.warning(f"Connection failed, waiting {delay:.1f}s...")
-                        await asyncio.sleep(delay)
-                        continue
-
-                current_price = await self.client.get_mid_price(SPOT_SYMBOL, MarketType.SPOT)
-                if current_price is None:
-                    self._consecutive_failures += 1
-                    delay = min(2 ** self._consecutive_failures, 120)
-                    await asyncio.sleep(delay)
-                    continue
-
-                self._consecutive_failures = 0
-
-                # Core loop
-                await self.grid.check_fills()
-                if not await self.grid.check_and_recenter(current_price):
-                    log.warning("Recenter failed - will retry on next iteration")
-
-                # Periodic reconciliation check (every 30 min)
-                await self.grid.maybe_reconcile()
-
-                if datetime.now().timestamp() - last_status_time >= status_interval:
-                    await self._print_status(current_price)
-                    last_status_time = datetime.now().timestamp()
-
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self._consecutive_failures += 1
-                delay = min(2 ** self._consecutive_failures, 120)
-                log.error(f"Error: {e}, backing off {delay}s")
-                await asyncio.sleep(delay)
+        """Run each concern as its own supervised task until stopped."""
+        self._supervisor = Supervisor()
+        self._supervisor.add(SupervisedTask(
+            "fills", self.grid.check_fills, interval=FILL_CHECK_INTERVAL_SECONDS, priority=0,
+        ))
+        self._supervisor.add(SupervisedTask(
+            "price", self._refresh_price, interval=PRICE_INTERVAL, priority=1, timeout=15,
+            backoff=RETRY_PERSISTENT,
+        ))
+        self._supervisor.add(SupervisedTask(
+            "recenter", self._recenter_if_needed, interval=POLL_INTERVAL_SECONDS, priority=2,
+        ))
+        self._supervisor.add(SupervisedTask(
+            "reconcile", self.grid.maybe_reconcile, interval=RECONCILE_CHECK_INTERVAL, priority=5,
+        ))
+        self._supervisor.add(SupervisedTask(
+            "status", self._report_status, interval=STATUS_INTERVAL, priority=9, timeout=10,
+        ))
+        if self._record:
+            self._tape = TapeWriter(TAPE_DIR)
+            recorder = TapeRecorder(
+                self.client, self._tape, [(SPOT_SYMBOL, MarketType.SPOT), (PERP_SYMBOL, MarketType.PERP)],
+            )
+            for task in recorder.supervised_tasks():
+                self._supervisor.add(task)
+            log.info(f"Recording market tape to {TAPE_DIR}")
+        if self._stopped:
+            return
+        self._lag_sampler.start()
+        await self._start_metrics_server()
+        self._supervisor.start()
+        await self._supervisor.wait()
+
+    async def _start_metrics_server(self):
+        if not METRICS_PORT:
+            return
+        self._metrics_server = MetricsServer(METRICS_HOST, METRICS_PORT)
+        self._metrics_server.add_collector(self._collect_metrics)
+        try:
+            await self._metrics_server.start()
+        except OSError as e:
+            log.warning(f"Metrics endpoint disabled - could not bind {METRICS_HOST}:{METRICS_PORT}: {e}")
+            self._metrics_server = None
+
+    def _collect_metrics(self):
+        """Metric families from in-memory state (no DB queries, no API calls)."""
+        stats = self.grid.stats
+        open_orders = self.state.open_order_counts()
+        tasks = self._supervisor.get_stats()
+        health = self.client.get_health_stats() or {}
+        return [
+            ("lithood_grid_fills_total", "counter", "Grid order fills",
+             [({"side": "buy"}, stats["buy_fills"]), ({"side": "sell"}, stats["sell_fills"])]),
+            ("lithood_grid_cycles_total", "counter", "Completed buy/sell cycles", [({}, stats["cycles"])]),
+            ("lithood_grid_realized_profit_usdc", "gauge", "Approximate realized profit", [({}, stats["profit"])]),
+            ("lithood_grid_recenters_total", "counter", "Grid recenters", [({}, stats["recenters"])]),
+            ("lithood_grid_open_orders", "gauge", "Open grid orders",
+             [({"side": side}, count) for side, count in open_orders.items()]),
+            ("lithood_price", "gauge", "Last mid price", [({}, self._price or 0)]),
+            ("lithood_connection_up", "gauge", "1 if the exchange connection is healthy",
+             [({}, 1 if self.client.is_connected() else 0)]),
+            ("lithood_health_proactive_reconnects_total", "counter", "Reconnects triggered by the health monitor",
+             [({}, health.get("proactive_reconnects", 0))]),
+            ("lithood_task_lag_seconds", "gauge", "Last scheduling lag per supervised task",
+             [({"task": name}, t["last_lag_ms"] / 1000) for name, t in tasks.items()]),
+            ("lithood_task_crashes_total", "counter", "Supervised task crashes",
+             [({"task": name}, t["crashes"]) for name, t in tasks.items()]),
+        ]
+
+    async def _refresh_price(self):
+        """Fetch the mid price; reconnect after repeated failures."""
+        if self._consecutive_failures >= 3:
+            if not await self.client.ensure_connected():
+                # Crash the task so the supervisor backs off before retrying
+                raise ConnectionError(f"Connection failed ({self._consecutive_failures} consecutive price failures)")
+
+        price = await self.client.get_mid_price(SPOT_SYMBOL, MarketType.SPOT)
+        if price is None:
+            self._consecutive_failures += 1
+            return
+        self._consecutive_failures = 0
+        self._price = price
+
+    async def _recenter_if_needed(self):
+        if self._price is None:
+            return
+        if not await self.grid.check_and_recenter(self._price):
+            log.warning("Recenter failed - will retry on next iteration")
+
+    async def _report_status(self):
+        if self._price is not None:
+            await self._print_status(self._price)
+        lags = ", ".join(
+            f"{name}={stats['last_lag_ms']:.0f}/{stats['max_lag_ms']:.0f}ms"
+            for name, stats in self._supervisor.get_stats().items()
+        )
+        log.info(f"Task lag (last/max): {lags}")
+
+        histograms = metrics.get_stats()["histograms"]
+        timings = ", ".join(
+            f"{name}={stats['p50']:.1f}/{stats['p99']:.1f}ms"
+            for name, stats in histograms.items()
+            if stats["count"] and not name.startswith(("tick.", "api_calls_per_tick.", "http."))
+        )
+        if timings:
+            log.info(f"Timings (p50/p99): {timings}")
 
     async def _print_status(self, price: Decimal):
         """Print status."""
-        cycles = int(self.state.get("infinite_grid_cycles", "0"))
-        profit = Decimal(self.state.get("infinite_grid_profit", "0"))
-        recenters = int(self.state.get("infinite_grid_recenters", "0"))
-        buy_fills = int(self.state.get("infinite_grid_buy_fills", "0"))
-        sell_fills = int(self.state.get("infinite_grid_sell_fills", "0"))
-        center = Decimal(self.state.get("infinite_grid_center", "0"))
+        stats = self.grid.stats
+        cycles = stats["cycles"]
+        profit = stats["profit"]
+        recenters = stats["recenters"]
+        buy_fills = stats["buy_fills"]
+        sell_fills = stats["sell_fills"]
+        center = self.grid.get_stats()["center"]
 
         runtime = ""
         if self._start_time:
@@ -168,17 +260,26 @@ class InfiniteGridBot:
     async def stop(self):
         """Stop gracefully."""
         if self._stopped:
+            await self._closed.wait()
             return
         self._stopped = True
         log.info("Stopping infinite grid bot...")
         self._running = False
-        await asyncio.sleep(POLL_INTERVAL_SECONDS + 1)
         try:
+            # Lets in-progress ticks (e.g. a counter-order) finish before cancelling
+            if self._supervisor:
+                await self._supervisor.stop()
+            await self._lag_sampler.stop()
+            if self._metrics_server:
+                await self._metrics_server.stop()
+            if self._tape:
+                self._tape.close()
             await self.client.close()
         except:
             pass
         finally:
             self.state.close()
+            self._closed.set()
         log.info("Bot stopped")
 
 
@@ -196,6 +297,16 @@ def parse_args():
         default=15,
         help="Number of buy/sell levels (default: 15)"
     )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record books, trades and funding to TAPE_DIR while trading"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Cancel all orders and start a new grid instead of resuming the previous one"
+    )
     return parser.parse_args()
 
 
@@ -203,7 +314,9 @@ async def main():
     args = parse_args()
     bot = InfiniteGridBot(
         amount=Decimal(str(args.amount)),
-        levels=args.levels
+        levels=args.levels,
+        record=args.record,
+        fresh=args.fresh,
     )
     stop_requested = False
 
@@ -217,9 +330,14 @@ async def main():
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, request_stop)
 
+    # kill -USR1 <pid>: toggle cProfile; kill -USR2 <pid>: task stacks + tracemalloc
+    profiler = Profiler(max_seconds=PROFILE_MAX_SECONDS)
+    profiler.install(loop)
+
     try:
         await bot.start()
     finally:
+        profiler.stop_all()
         await bot.stop()
 
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# scripts/run_multi_grid.py
+"""Multi-market Infinite Grid Bot - one grid per market in a single process.
+
+All grids share one LighterClient (connection pool, auth token, signer)
+and one state database, with each grid's counters in its own namespace.
+
+Usage:
+    python scripts/run_multi_grid.py --grid LIT/USDC:spot:350:15 --grid LIT:perp:200:10
+    python scripts/run_multi_grid.py --grid LIT/USDC:spot:350:15:0.015
+    python scripts/run_multi_grid.py --fresh   # cancel everything instead of resuming
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lithood.client import LighterClient
+from lithood.state import StateManager
+from lithood.multi_grid import GridSpec, MultiGridHost
+from lithood.config import METRICS_HOST, METRICS_PORT, PROFILE_MAX_SECONDS, SPOT_SYMBOL
+from lithood.logger import log
+from lithood.supervisor import Supervisor, SupervisedTask
+from lithood.instrumentation import LoopLagSampler, metrics
+from lithood.metrics_server import MetricsServer
+from lithood.profiling import Profiler
+
+STATUS_INTERVAL = 60
+
+
+def parse_grid(value: str) -> GridSpec:
+    """Parse SYMBOL:TYPE[:AMOUNT[:LEVELS[:SPACING]]], e.g. LIT:perp:200:10:0.02."""
+    try:
+        return GridSpec.parse(value)
+    except (ValueError, ArithmeticError) as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+class MultiGridBot:
+    """Runs a MultiGridHost under a Supervisor."""
+
+    def __init__(self, specs: list[GridSpec], fresh: bool = False):
+        self.client = LighterClient()
+        db_path = os.getenv("BOT_STATE_DB", os.path.join(os.path.dirname(__file__), "..", "multi_grid_state.db"))
+        self.state = StateManager(db_path=db_path)
+        self.host = MultiGridHost(self.client, self.state, specs)
+        self._fresh = fresh
+        self._supervisor: Supervisor = None
+        self._lag_sampler = LoopLagSampler(metrics)
+        self._metrics_server: MetricsServer = None
+        self._stopped = False
+        self._closed = asyncio.Event()
+
+    async def start(self):
+        log.info("=" * 60)
+        log.info("  MULTI-MARKET INFINITE GRID BOT")
+        for spec in self.host.specs:
+            log.info(f"  {spec.key}: {spec.config.lit_per_order} per order x {spec.config.num_levels} levels "
+                     f"@ {spec.config.level_spacing_pct * 100}%")
+        log.info("=" * 60)
+
+        await self.client.connect()
+        self.client.start_health_monitor()
+
+        if not await self.host.initialize(fresh=self._fresh):
+            log.error("Failed to initialize grids - aborting bot start")
+            raise RuntimeError("Grid initialization failed")
+
+        self._supervisor = Supervisor()
+        for task in self.host.supervised_tasks():
+            self._supervisor.add(task)
+        self._supervisor.add(SupervisedTask(
+            "status", self._report_status, interval=STATUS_INTERVAL, priority=9, timeout=10,
+        ))
+        if self._stopped:
+            return
+        self._lag_sampler.start()
+        await self._start_metrics_server()
+        self._supervisor.start()
+        await self._supervisor.wait()
+
+    async def _start_metrics_server(self):
+        if not METRICS_PORT:
+            return
+        self._metrics_server = MetricsServer(METRICS_HOST, METRICS_PORT)
+        self._metrics_server.add_collector(self.host.collect_metrics)
+        try:
+            await self._metrics_server.start()
+        except OSError as e:
+            log.warning(f"Metrics endpoint disabled - could not bind {METRICS_HOST}:{METRICS_PORT}: {e}")
+            self._metrics_server = None
+
+    async def _report_status(self):
+        for key, stats in self.host.get_stats().items():
+            price = f"${stats['price']:.4f}" if stats["price"] is not None else "-"
+            log.info(
+                f"{key}: price {price} center ${stats['center']:.4f} | cycles {stats['cycles']} "
+                f"| recenters {stats['recenters']} | profit ${stats['profit']:,.2f}"
+            )
+
+    async def stop(self):
+        if self._stopped:
+            await self._closed.wait()
+            return
+        self._stopped = True
+        log.info("Stopping multi-market grid bot...")
+        try:
+            if self._supervisor:
+                await self._supervisor.stop()
+            await self._lag_sampler.stop()
+            if self._metrics_server:
+                await self._metrics_server.stop()
+            await self.client.close()
+        except Exception as e:
+            log.warning(f"Error during shutdown: {e}")
+        finally:
+            self.state.close()
+            self._closed.set()
+        log.info("Bot stopped")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Multi-market Infinite Grid Bot")
+    parser.add_argument(
+        "--grid",
+        type=parse_grid,
+        action="append",
+        help="Market to run, SYMBOL:TYPE[:AMOUNT[:LEVELS[:SPACING]]] (repeatable; "
+             f"default: {SPOT_SYMBOL}:spot:350:15)"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Cancel all orders and start new grids instead of resuming the previous ones"
+    )
+    args = parser.parse_args()
+    args.grid = args.grid or [parse_grid(f"{SPOT_SYMBOL}:spot:350:15")]
+    return args
+
+
+async def main():
+    args = parse_args()
+    bot = MultiGridBot(args.grid, fresh=args.fresh)
+    stop_requested = False
+
+    def request_stop():
+        nonlocal stop_requested
+        if not stop_requested:
+            stop_requested = True
+            asyncio.create_task(bot.stop())
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, request_stop)
+
+    profiler = Profiler(max_seconds=PROFILE_MAX_SECONDS)
+    profiler.install(loop)
+
+    try:
+        await bot.start()
+    finally:
+        profiler.stop_all()
+        await bot.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo estimate of floor-breach probability for the grid (plus hedge).
+
+Simulates thousands of price paths and reports, for each candidate
+emergency_buffer, how often the emergency exit fires, how often the value
+left after liquidation ends below the hard floor, when it fires, and the
+expected grid profit and final value.
+
+Path models:
+    gbm        geometric Brownian motion (--vol, --drift, annualized)
+    jump       GBM plus Poisson jumps (--jumps-per-year, --jump-mean, --jump-std)
+    bootstrap  block bootstrap of historical candle returns (--candles, --block);
+               the step is the candle interval
+
+Usage:
+    python scripts/stress_floor.py --price 1.75 --vol 1.2 --buffers 25250,25500,26000,27000
+    python scripts/stress_floor.py --model jump --price 1.75 --jumps-per-year 6 --jump-mean -0.2
+    python scripts/stress_floor.py --model bootstrap --candles lit_1h.csv --price 1.75 --json
+"""
+
+import argparse
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lithood.backtest import load_candles
+from lithood.config import FLOOR_CONFIG, HEDGE_CONFIG
+from lithood.infinite_grid import InfiniteGridConfig
+from lithood.montecarlo import GBM, Bootstrap, JumpDiffusion, StressSimulator, log_returns
+
+
+def parse_floats(value: str) -> list[float]:
+    return [float(v) for v in value.split(",") if v]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Monte Carlo floor-breach stress test")
+    parser.add_argument("--model", choices=("gbm", "jump", "bootstrap"), default="gbm", help="Path model")
+    parser.add_argument("--paths", type=int, default=10000, help="Number of paths")
+    parser.add_argument("--days", type=float, default=30, help="Horizon in days")
+    parser.add_argument("--step", type=float, default=3600, help="Step in seconds (gbm/jump)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--vol", type=float, default=1.0, help="Annualized volatility (1.0 = 100%%)")
+    parser.add_argument("--drift", type=float, default=0.0, help="Annualized drift")
+    parser.add_argument("--jumps-per-year", type=float, default=6.0, help="Jump intensity")
+    parser.add_argument("--jump-mean", type=float, default=-0.15, help="Mean jump (log return)")
+    parser.add_argument("--jump-std", type=float, default=0.10, help="Jump size std (log return)")
+    parser.add_argument("--candles", help="OHLC candles CSV for bootstrap")
+    parser.add_argument("--block", type=int, default=24, help="Bootstrap block length in steps")
+    parser.add_argument("--price", type=float, required=True, help="Starting LIT price")
+    parser.add_argument("--lit", type=float, default=16000, help="Starting LIT")
+    parser.add_argument("--usdc", type=float, default=0, help="Starting USDC")
+    parser.add_argument("--levels", type=int, default=15, help="Levels per side")
+    parser.add_argument("--spacing", type=Decimal, default=Decimal("0.02"), help="Level spacing")
+    parser.add_argument("--lit-per-order", type=Decimal, default=Decimal("350"), help="LIT per order")
+    parser.add_argument("--threshold", type=int, default=2, help="Recenter within N levels of the edge")
+    parser.add_argument("--hedge-size", type=float, default=None,
+                        help="Enable a hedge short of this size (default: HEDGE_CONFIG)")
+    parser.add_argument("--funding", type=float, default=0.0, help="Hourly funding rate paid to shorts")
+    parser.add_argument("--fee", type=float, default=0.0, help="Maker fee rate")
+    parser.add_argument("--slippage", type=float, default=0.01, help="Liquidation slippage")
+    parser.add_argument("--floor", type=float, default=float(FLOOR_CONFIG["floor_value"]), help="Hard floor")
+    parser.add_argument("--buffers", type=parse_floats,
+                        default=[float(FLOOR_CONFIG["emergency_buffer"])], help="emergency_buffer candidates")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    step = args.step
+    if args.model == "gbm":
+        model = GBM(vol=args.vol, drift=args.drift)
+    elif args.model == "jump":
+        model = JumpDiffusion(vol=args.vol, drift=args.drift, intensity=args.jumps_per_year,
+                              jump_mean=args.jump_mean, jump_std=args.jump_std)
+    else:
+        if not args.candles:
+            parser.error("--model bootstrap needs --candles")
+        times, prices = load_candles(args.candles)
+        # load_candles expands each bar to 4 points; every 4th point is a close
+        closes, bar_times = prices[3::4], times[::4]
+        step = float(np.median(np.diff(bar_times)))
+        model = Bootstrap(returns=log_returns(closes), block=args.block)
+
+    hedge_config = dict(HEDGE_CONFIG)
+    if args.hedge_size is not None:
+        hedge_config.update(enabled=args.hedge_size > 0, short_size=Decimal(str(args.hedge_size)))
+
+    config = InfiniteGridConfig(
+        num_levels=args.levels,
+        level_spacing_pct=args.spacing,
+        lit_per_order=args.lit_per_order,
+        total_grid_lit=Decimal(str(args.lit)),
+        recenter_threshold=args.threshold,
+    )
+    simulator = StressSimulator(
+        config,
+        start_price=args.price,
+        initial_lit=args.lit,
+        initial_usdc=args.usdc,
+        hedge_config=hedge_config,
+        floor_value=args.floor,
+        liquidation_slippage=args.slippage,
+        funding_rate_hourly=args.funding,
+        maker_fee=args.fee,
+    )
+    result = simulator.run(model, paths=args.paths, horizon_days=args.days, step_seconds=step,
+                           buffers=args.buffers, seed=args.seed)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+        return 0
+
+    print(f"{result.paths:,} {result.model} paths x {result.steps:,} steps of {result.step_seconds:.0f}s "
+          f"({args.days:g} days) in {result.seconds:.2f}s")
+    print(f"Start value ${result.start_value:,.2f}, hard floor ${result.floor_value:,.0f}")
+    q = result.final_value_quantiles
+    print(f"Final value without exit: p5 ${q['p5']:,.0f}  p50 ${q['p50']:,.0f}  p95 ${q['p95']:,.0f}")
+    print(f"Mean cycles {result.mean_cycles:,.1f}, recenters {result.mean_recenters:,.1f}, "
+          f"hedge PnL ${result.mean_hedge_pnl:,.2f} (stopped out on {result.hedge_stop_probability:.1%})")
+    print()
+    print(f"{'buffer':>9} {'P(exit)':>8} {'P(breach)':>9} {'exit p50 days':>13} "
+          f"{'worst exit':>11} {'E[profit]':>10} {'E[final]':>10}")
+    for b in result.buffers:
+        days = f"{b.trigger_days['p50']:.1f}" if b.trigger_days else "-"
+        worst = f"${b.worst_exit_value:,.0f}" if b.worst_exit_value is not None else "-"
+        print(f"{b.buffer:>9,.0f} {b.trigger_probability:>8.2%} {b.breach_probability:>9.2%} {days:>13} "
+              f"{worst:>11} {b.expected_profit:>10,.2f} {b.expected_final_value:>10,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
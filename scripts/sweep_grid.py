@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Sweep infinite-grid parameters over historical prices and rank the results.
+
+Every combination of the given values is backtested across a process pool
+(workers share the price path through memory-mapped .npy files). Values
+are comma lists or inclusive start:stop:step ranges.
+
+Usage:
+    python scripts/sweep_grid.py --candles lit_1m.csv --levels 10:30:5 --spacing 0.005:0.03:0.0025
+    python scripts/sweep_grid.py --ticks lit_trades.csv --lit-per-order 200,350,500 --rank-by min_equity
+"""
+
+import argparse
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lithood.backtest import load_candles, load_ticks
+from lithood.config import FLOOR_CONFIG
+from lithood.infinite_grid import InfiniteGridEngine
+from lithood.logger import log
+from lithood.sweep import RANK_FIELDS, expand_grid, rank_results, run_sweep, write_results_csv
+
+
+def parse_values(value: str, kind=Decimal) -> list:
+    """Parse "a,b,c" or an inclusive "start:stop:step" range."""
+    if ":" in value:
+        start, stop, step = (kind(v) for v in value.split(":"))
+        if step <= 0:
+            raise argparse.ArgumentTypeError(f"step must be positive: {value}")
+        values = []
+        current = start
+        while current <= stop:
+            values.append(current)
+            current += step
+        return values
+    return [kind(v) for v in value.split(",") if v]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep of the infinite grid")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--candles", help="OHLC candles CSV")
+    source.add_argument("--ticks", help="Trade ticks CSV")
+    parser.add_argument("--levels", type=lambda v: parse_values(v, int), default=[10, 15, 20],
+                        help="Levels per side")
+    parser.add_argument("--spacing", type=parse_values, default=parse_values("0.01,0.015,0.02,0.03"),
+                        help="Level spacing (0.02 = 2%%)")
+    parser.add_argument("--lit-per-order", type=parse_values, default=[Decimal("350")], help="LIT per order")
+    parser.add_argument("--threshold", type=lambda v: parse_values(v, int), default=[1, 2, 3],
+                        help="Recenter within N levels of the edge")
+    parser.add_argument("--lit", type=Decimal, default=Decimal("16000"), help="Starting LIT")
+    parser.add_argument("--usdc", type=Decimal, default=Decimal("0"), help="Starting USDC")
+    parser.add_argument("--grace", type=float, default=InfiniteGridEngine.FILL_GRACE_SECONDS,
+                        help="Fill detection delay in seconds")
+    parser.add_argument("--fee", type=Decimal, default=Decimal("0"), help="Maker fee rate")
+    parser.add_argument("--floor", type=Decimal, default=FLOOR_CONFIG["emergency_buffer"],
+                        help="Equity counted as a floor breach")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Configs per task")
+    parser.add_argument("--data-dir", help="Keep the memory-mapped price arrays in this directory")
+    parser.add_argument("--rank-by", choices=RANK_FIELDS, default="pnl", help="Ranking metric")
+    parser.add_argument("--keep-breaches", action="store_true",
+                        help="Rank floor-breaching configs alongside the rest")
+    parser.add_argument("--output", default="sweep_results.csv", help="Ranked results CSV")
+    parser.add_argument("--top", type=int, default=10, help="Rows to print")
+    args = parser.parse_args()
+
+    times, prices = load_candles(args.candles) if args.candles else load_ticks(args.ticks)
+    configs = expand_grid(args.levels, args.spacing, args.lit_per_order, args.threshold, total_grid_lit=args.lit)
+    if not configs:
+        log.error("No valid parameter combinations")
+        return 1
+
+    t0 = time.perf_counter()
+    results = run_sweep(
+        times, prices, configs,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        data_dir=args.data_dir,
+        initial_lit=args.lit,
+        initial_usdc=args.usdc,
+        fill_grace_seconds=args.grace,
+        maker_fee=args.fee,
+        floor_value=args.floor,
+    )
+    elapsed = time.perf_counter() - t0
+
+    ranked = rank_results(results, by=args.rank_by, exclude_breaches=not args.keep_breaches)
+    write_results_csv(args.output, ranked)
+    log.info(f"{len(configs)} configs in {elapsed:.1f}s ({len(configs) / elapsed:.1f}/s) - wrote {args.output}")
+
+    print()
+    print(f"{'#':>3} {'levels':>6} {'spacing':>8} {'lit/order':>9} {'thr':>3} "
+          f"{'pnl':>12} {'profit':>12} {'cycles':>7} {'recenters':>9} {'max dd':>12} {'breaches':>8}")
+    for rank, r in enumerate(ranked[:args.top], start=1):
+        p = r.params
+        print(f"{rank:>3} {p['num_levels']:>6} {p['level_spacing_pct']:>8} {p['lit_per_order']:>9} "
+              f"{p['recenter_threshold']:>3} {r.pnl:>12,.2f} {r.profit:>12,.2f} {r.cycles:>7,} "
+              f"{r.recenters:>9,} {r.max_drawdown:>12,.2f} {r.floor_breaches:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-endpoint routing, failover and hedged reads.
+
+Runs local stand-in servers with injected latency (no exchange access needed):
+1. Routing - reads settle on the fastest endpoint after warm-up
+2. Failover - a dead endpoint is skipped and benched
+3. Hedging - a slow tail on the primary is cut by the backup request
+4. Writes - POSTs go to one endpoint only, never hedged
+"""
+
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiohttp import web
+from lighter import ApiClient, Configuration, RootApi
+
+from lithood.transport import Endpoint, HttpPool, install_shared_transport
+from lithood.logger import log
+
+
+class StandInServer:
+    """Local HTTP server answering the status endpoint with configurable latency."""
+
+    def __init__(self, name: str, latency: float, tail_latency: float = 0.0, tail_rate: float = 0.0):
+        self.name = name
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_rate = tail_rate
+        self.hits = {"GET": 0, "POST": 0}
+        self.port = None
+        self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.hits[request.method] = self.hits.get(request.method, 0) + 1
+        delay = self.latency
+        if self.tail_rate and random.random() < self.tail_rate:
+            delay = self.tail_latency
+        await asyncio.sleep(delay)
+        return web.json_response({"status": 200, "network_id": 1, "timestamp": int(time.time())})
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{self.port}"
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+
+async def make_client(pool: HttpPool) -> tuple[ApiClient, RootApi]:
+    api_client = ApiClient(configuration=Configuration(host=pool.primary_url))
+    await install_shared_transport(api_client, pool)
+    return api_client, RootApi(api_client)
+
+
+async def test_routing():
+    log.info("=" * 60)
+    log.info("TEST 1: Routing to the fastest endpoint")
+    slow, fast = StandInServer("slow", 0.08), StandInServer("fast", 0.01)
+    slow_url, fast_url = await slow.start(), await fast.start()
+    pool = HttpPool([Endpoint(slow_url), Endpoint(fast_url)])
+    api_client, root = await make_client(pool)
+    try:
+        await pool.warm_up("/", 2)
+        for _ in range(20):
+            await root.status()
+        log.info(f"  slow={slow.hits['GET']} fast={fast.hits['GET']}")
+        passed = fast.hits["GET"] > slow.hits["GET"]
+    finally:
+        await api_client.close()
+        await pool.close()
+        await slow.stop()
+        await fast.stop()
+    log.info(f"  {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+async def test_failover():
+    log.info("=" * 60)
+    log.info("TEST 2: Failover when the primary is down")
+    backup = StandInServer("backup", 0.01)
+    backup_url = await backup.start()
+    # Nothing listens on port 9 - connection refused
+    dead = Endpoint("http://127.0.0.1:9", failure_threshold=1, cooldown=60)
+    pool = HttpPool([dead, Endpoint(backup_url)])
+    api_client, root = await make_client(pool)
+    try:
+        for _ in range(5):
+            await root.status()
+        stats = pool.get_stats()
+        log.info(f"  backup hits={backup.hits['GET']} failovers={stats['failovers']} primary healthy={dead.healthy}")
+        passed = backup.hits["GET"] == 5 and not dead.healthy
+    finally:
+        await api_client.close()
+        await pool.close()
+        await backup.stop()
+    log.info(f"  {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+async def _timed_reads(root: RootApi, count: int) -> list[float]:
+    times = []
+    for _ in range(count):
+        start = time.monotonic()
+        await root.status()
+        times.append(time.monotonic() - start)
+    return sorted(times)
+
+
+async def test_hedging():
+    log.info("=" * 60)
+    log.info("TEST 3: Hedged reads cut the tail")
+    random.seed(7)
+    results = {}
+    for hedge in (False, True):
+        primary = StandInServer("primary", 0.01, tail_latency=0.5, tail_rate=0.15)
+        backup = StandInServer("backup", 0.02)
+        primary_url, backup_url = await primary.start(), await backup.start()
+        pool = HttpPool([Endpoint(primary_url), Endpoint(backup_url)], hedge_reads=hedge)
+        pool.HEDGE_DELAY_DEFAULT = 0.05
+        api_client, root = await make_client(pool)
+        try:
+            # Seed latency so the primary ranks first
+            primary.tail_rate, rate = 0.0, primary.tail_rate
+            await _timed_reads(root, 10)
+            primary.tail_rate = rate
+            times = await _timed_reads(root, 60)
+            results[hedge] = times[int(len(times) * 0.95)]
+            stats = pool.get_stats()
+            log.info(
+                f"  hedge={hedge}: p95={results[hedge] * 1000:.0f}ms "
+                f"hedged={stats['hedged_requests']} wins={stats['hedge_wins']}"
+            )
+        finally:
+            await api_client.close()
+            await pool.close()
+            await primary.stop()
+            await backup.stop()
+    passed = results[True] < results[False] / 2
+    log.info(f"  {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+async def test_writes_not_hedged():
+    log.info("=" * 60)
+    log.info("TEST 4: Writes are sent once")
+    primary = StandInServer("primary", 0.3)
+    backup = StandInServer("backup", 0.01)
+    primary_url, backup_url = await primary.start(), await backup.start()
+    pool = HttpPool([Endpoint(primary_url), Endpoint(backup_url)], hedge_reads=True)
+    api_client, _ = await make_client(pool)
+    try:
+        for _ in range(3):
+            await api_client.rest_client.request("POST", f"{primary_url}/api/v1/sendTx", body={})
+        total = primary.hits["POST"] + backup.hits["POST"]
+        log.info(f"  primary={primary.hits['POST']} backup={backup.hits['POST']}")
+        passed = total == 3 and pool.hedged_requests == 0
+    finally:
+        await api_client.close()
+        await pool.close()
+        await primary.stop()
+        await backup.stop()
+    log.info(f"  {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+async def main():
+    results = {
+        "routing": await test_routing(),
+        "failover": await test_failover(),
+        "hedging": await test_hedging(),
+        "writes": await test_writes_not_hedged(),
+    }
+    log.info("=" * 60)
+    for name, passed in results.items():
+        log.info(f"{name}: {'PASS' if passed else 'FAIL'}")
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
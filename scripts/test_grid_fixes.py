@@ -10,8 +10,10 @@ Tests:
 5. Reconciliation - doesn't create duplicate counter-orders
 
 Cost: ~$2-5 for the tiny test orders (10 LIT per order, 3 levels = 60 LIT)
+Run with --offline to use the in-process simulated exchange instead (free).
 """
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime, timedelta
@@ -22,6 +24,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from lithood.client import LighterClient
+from lithood.fake_exchange import FakeExchange
 from lithood.state import StateManager
 from lithood.infinite_grid import InfiniteGridEngine, InfiniteGridConfig
 from lithood.types import OrderSide, MarketType, OrderStatus
@@ -37,8 +40,9 @@ TEST_SPACING = Decimal("0.02")  # 2% spacing
 class GridFixTester:
     """Test harness for grid fixes."""
 
-    def __init__(self):
+    def __init__(self, offline: bool = False):
         self.client = LighterClient()
+        self.exchange = FakeExchange() if offline else None
         self.state = StateManager(db_path=":memory:")  # In-memory DB for tests
         self.config = InfiniteGridConfig(
             num_levels=TEST_LEVELS,
@@ -53,8 +57,12 @@ class GridFixTester:
 
     async def setup(self):
         """Connect and initialize."""
-        log.info("Connecting to Lighter DEX...")
-        await self.client.connect()
+        if self.exchange is not None:
+            log.info("Connecting to offline simulated exchange...")
+            await self.client.connect_offline(self.exchange)
+        else:
+            log.info("Connecting to Lighter DEX...")
+            await self.client.connect()
         log.info("Connected!")
 
         self.market = self.client.get_market(SPOT_SYMBOL, MarketType.SPOT)
@@ -318,14 +326,14 @@ async def test_reconciliation_no_duplicates(tester: GridFixTester) -> bool:
 
 async def test_check_fills_no_duplicates(tester: GridFixTester) -> bool:
     """
-    TEST 5: Verify check_fills with processing lock doesn't create duplicates.
+    TEST 5: Verify repeated check_fills under the book lock doesn't create duplicates.
 
     - Run check_fills multiple times rapidly
     - Verify order count doesn't increase unexpectedly
     """
     log.info("")
     log.info("=" * 60)
-    log.info("=== TEST 5: CHECK_FILLS PROCESSING LOCK ===")
+    log.info("=== TEST 5: CHECK_FILLS BOOK LOCK ===")
     log.info("=" * 60)
 
     # Count orders before
@@ -349,9 +357,8 @@ async def test_check_fills_no_duplicates(tester: GridFixTester) -> bool:
         log.warning(f"Order count increased: {len(orders_before)} -> {len(orders_after)}")
         log.warning("This may be expected if orders filled during test")
 
-    # Check that processing lock is working
-    log.info(f"Processing lock set size: {len(tester.grid._processing_orders)}")
-    assert len(tester.grid._processing_orders) == 0, "Processing lock not properly released!"
+    # Check that the book lock serializing fill handling was released
+    assert not tester.grid._book_lock.locked(), "Book lock not properly released!"
 
     log.info("TEST 5 PASSED")
     return True
@@ -440,10 +447,10 @@ async def test_full_cycle(tester: GridFixTester) -> bool:
     return True
 
 
-async def main() -> int:
+async def main(offline: bool = False) -> int:
     """Run all grid fix tests."""
     log.info("=" * 60)
-    log.info("GRID ORDER MANAGEMENT FIX TESTS")
+    log.info(f"GRID ORDER MANAGEMENT FIX TESTS{' (OFFLINE)' if offline else ''}")
     log.info("=" * 60)
     log.info("")
     log.info(f"Test configuration:")
@@ -453,7 +460,7 @@ async def main() -> int:
     log.info(f"  Expected total orders: {TEST_LEVELS * 2}")
     log.info("")
 
-    tester = GridFixTester()
+    tester = GridFixTester(offline=offline)
     results = {}
 
     try:
@@ -509,5 +516,12 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Grid order management fix tests")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Run against the in-process simulated exchange instead of Lighter",
+    )
+    args = parser.parse_args()
+    exit_code = asyncio.run(main(offline=args.offline))
     sys.exit(exit_code)